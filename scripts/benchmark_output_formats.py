@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark of the object and table output formats of the search tools.
+
+Serializes synthetic result pages the way tool results are serialized (through a TypeAdapter
+of the tool's return annotation, then JSON) and reports payload size and CPU time per format.
+
+Usage:
+    python scripts/benchmark_output_formats.py                 # limit=100 pages, all result types
+    python scripts/benchmark_output_formats.py --rows 30 --repeat 500
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from modelscope_mcp_server.types import Dataset, McpServer, Model, Paper, Studio
+from modelscope_mcp_server.utils.table import Results, format_results
+
+
+def make_models(rows: int) -> list[Model]:
+    """Build synthetic models."""
+    return [
+        Model(
+            id=f"owner-{i % 50}/model-{i}",
+            path=f"owner-{i % 50}",
+            name=f"model-{i}",
+            chinese_name=f"模型 {i}",
+            created_by=f"user-{i % 7}",
+            license="Apache License 2.0",
+            modelscope_url=f"https://modelscope.cn/models/owner-{i % 50}/model-{i}",
+            support_inference=i % 2 == 0,
+            downloads_count=i * 37,
+            stars_count=i,
+            created_at=1_700_000_000 + i,
+            updated_at=1_710_000_000 + i,
+        )
+        for i in range(rows)
+    ]
+
+
+def make_datasets(rows: int) -> list[Dataset]:
+    """Build synthetic datasets."""
+    return [
+        Dataset(
+            id=f"owner-{i % 50}/dataset-{i}",
+            path=f"owner-{i % 50}",
+            name=f"dataset-{i}",
+            chinese_name=f"数据集 {i}",
+            created_by=f"user-{i % 7}",
+            license="CC BY 4.0",
+            modelscope_url=f"https://modelscope.cn/datasets/owner-{i % 50}/dataset-{i}",
+            downloads_count=i * 11,
+            likes_count=i,
+            created_at=1_700_000_000 + i,
+            updated_at=1_710_000_000 + i,
+        )
+        for i in range(rows)
+    ]
+
+
+def make_studios(rows: int) -> list[Studio]:
+    """Build synthetic studios."""
+    return [
+        Studio(
+            id=f"owner-{i % 50}/studio-{i}",
+            path=f"owner-{i % 50}",
+            name=f"studio-{i}",
+            chinese_name=f"创空间 {i}",
+            description="A demo application " * 4,
+            created_by=f"user-{i % 7}",
+            license="MIT",
+            modelscope_url=f"https://modelscope.cn/studios/owner-{i % 50}/studio-{i}",
+            independent_url=None,
+            cover_image=f"https://example.com/covers/{i}.png",
+            type="programmatic",
+            status="Running",
+            domains=["cv", "nlp"],
+            stars=i,
+            visits=i * 5,
+            created_at=1_700_000_000 + i,
+            updated_at=1_710_000_000 + i,
+            deployed_at=1_710_000_000 + i,
+        )
+        for i in range(rows)
+    ]
+
+
+def make_papers(rows: int) -> list[Paper]:
+    """Build synthetic papers."""
+    return [
+        Paper(
+            arxiv_id=f"2401.{i:05d}",
+            title=f"Paper title {i}",
+            authors="A. Author, B. Author",
+            publish_date="2024-01-01",
+            abstract_cn="摘要 " * 40,
+            abstract_en="Abstract text " * 40,
+            modelscope_url=f"https://modelscope.cn/papers/2401.{i:05d}",
+            arxiv_url=f"https://arxiv.org/abs/2401.{i:05d}",
+            pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}",
+            code_link=None,
+            view_count=i * 3,
+            favorite_count=i,
+            comment_count=0,
+        )
+        for i in range(rows)
+    ]
+
+
+def make_mcp_servers(rows: int) -> list[McpServer]:
+    """Build synthetic MCP servers."""
+    return [
+        McpServer(
+            id=f"@owner-{i % 50}/server-{i}",
+            name=f"server-{i}",
+            description="An MCP server " * 4,
+            tags=["search", "files"],
+            logo_url=None,
+            modelscope_url=f"https://modelscope.cn/mcp/servers/@owner-{i % 50}/server-{i}",
+            view_count=i * 9,
+        )
+        for i in range(rows)
+    ]
+
+
+FACTORIES: dict[str, tuple[type[BaseModel], Callable[[int], list[Any]]]] = {
+    "models": (Model, make_models),
+    "datasets": (Dataset, make_datasets),
+    "studios": (Studio, make_studios),
+    "papers": (Paper, make_papers),
+    "mcp_servers": (McpServer, make_mcp_servers),
+}
+
+
+def measure(items: list[Any], model: type[BaseModel], format: str, repeat: int) -> tuple[int, float]:
+    """Return (payload bytes, microseconds per call) for formatting and serializing a page."""
+    adapter = TypeAdapter(Results[model])  # type: ignore[valid-type]
+
+    def run() -> bytes:
+        result = format_results(items, model, None, format)  # type: ignore[arg-type]
+        return json.dumps({"result": adapter.dump_python(result, mode="json")}).encode("utf-8")
+
+    size = len(run())
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = time.perf_counter() - start_time
+    return size, elapsed / repeat * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison per result type."""
+    parser = argparse.ArgumentParser(description="Benchmark tool output formats")
+    parser.add_argument("--rows", type=int, default=100, help="Results per page (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Iterations per measurement (default: 200)")
+    args = parser.parse_args()
+
+    print(f"{'type':<12} {'objects':>16} {'table':>16} {'bytes saved':>12} {'cpu saved':>10}")
+    for name, (model, factory) in FACTORIES.items():
+        items = factory(args.rows)
+        object_size, object_time = measure(items, model, "objects", args.repeat)
+        table_size, table_time = measure(items, model, "table", args.repeat)
+        print(
+            f"{name:<12} {object_size:>7} B {object_time:>6.0f}µs {table_size:>7} B {table_time:>6.0f}µs "
+            f"{1 - table_size / object_size:>11.0%} {1 - table_time / object_time:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark of mapping upstream search results to result models.
+
+Compares, on synthetic upstream pages, the page mappings used by the search tools with
+constructing one validated model per item and with model_construct.
+
+Usage:
+    python scripts/benchmark_result_mapping.py                        # 1k, 10k and 100k rows
+    python scripts/benchmark_result_mapping.py --rows 1000 --repeat 20
+"""
+
+import argparse
+import gc
+import time
+from collections.abc import Callable
+from typing import Any
+
+from modelscope_mcp_server.tools.dataset import DATASET_MAPPING
+from modelscope_mcp_server.tools.mcp import MCP_SERVER_MAPPING
+from modelscope_mcp_server.tools.model import MODEL_MAPPING
+from modelscope_mcp_server.tools.paper import PAPER_MAPPING
+from modelscope_mcp_server.tools.studio import STUDIO_MAPPING
+from modelscope_mcp_server.utils.mapping import ResultMapping
+
+
+def upstream_model(i: int) -> dict[str, Any]:
+    """Build a synthetic upstream model."""
+    return {
+        "Path": f"owner-{i % 50}",
+        "Name": f"model-{i}",
+        "ChineseName": f"模型 {i}",
+        "CreatedBy": f"user-{i % 7}",
+        "License": "Apache License 2.0",
+        "SupportInference": "txt2img" if i % 2 else "",
+        "Downloads": i * 37,
+        "Stars": i,
+        "CreatedTime": 1_700_000_000 + i,
+        "LastUpdatedTime": 1_710_000_000 + i,
+    }
+
+
+def upstream_dataset(i: int) -> dict[str, Any]:
+    """Build a synthetic upstream dataset."""
+    return {
+        "Namespace": f"owner-{i % 50}",
+        "Name": f"dataset-{i}",
+        "ChineseName": f"数据集 {i}",
+        "CreatedBy": f"user-{i % 7}",
+        "License": "CC BY 4.0",
+        "Downloads": i * 11,
+        "Likes": i,
+        "GmtCreate": 1_700_000_000 + i,
+        "LastUpdatedTime": 1_710_000_000 + i,
+    }
+
+
+def upstream_studio(i: int) -> dict[str, Any]:
+    """Build a synthetic upstream studio."""
+    return {
+        "Id": i,
+        "Path": f"owner-{i % 50}",
+        "Name": f"studio-{i}",
+        "ChineseName": f"创空间 {i}",
+        "Description": "A demo application",
+        "CreatedBy": f"user-{i % 7}",
+        "License": "MIT",
+        "CoverImage": f"https://example.com/covers/{i}.png",
+        "Type": "programmatic",
+        "Status": "Running",
+        "Domain": ["cv", "nlp"],
+        "Stars": i,
+        "Visits": i * 5,
+        "CreatedTime": 1_700_000_000 + i,
+        "LastUpdatedTime": 1_710_000_000 + i,
+        "DeployedTime": 1_710_000_000 + i,
+    }
+
+
+def upstream_paper(i: int) -> dict[str, Any]:
+    """Build a synthetic upstream paper."""
+    return {
+        "ArxivId": f"2401.{i:05d}",
+        "Title": f"Paper title {i}",
+        "Authors": "A. Author, B. Author",
+        "PublishDate": "2024-01-01",
+        "AbstractCn": "摘要",
+        "AbstractEn": "Abstract text",
+        "ArxivUrl": f"https://arxiv.org/abs/2401.{i:05d}",
+        "PdfUrl": f"https://arxiv.org/pdf/2401.{i:05d}",
+        "ViewCount": i * 3,
+        "FavoriteCount": i,
+        "CommentTotalCount": 0,
+    }
+
+
+def upstream_mcp_server(i: int) -> dict[str, Any]:
+    """Build a synthetic upstream MCP server."""
+    return {
+        "id": f"@owner-{i % 50}/server-{i}",
+        "name": f"server-{i}",
+        "description": "An MCP server",
+        "tags": ["search", "files"],
+        "view_count": i * 9,
+    }
+
+
+FACTORIES: dict[str, tuple[ResultMapping[Any], Callable[[int], dict[str, Any]]]] = {
+    "models": (MODEL_MAPPING, upstream_model),
+    "datasets": (DATASET_MAPPING, upstream_dataset),
+    "studios": (STUDIO_MAPPING, upstream_studio),
+    "papers": (PAPER_MAPPING, upstream_paper),
+    "mcp_servers": (MCP_SERVER_MAPPING, upstream_mcp_server),
+}
+
+
+def per_item(mapping: ResultMapping[Any], page: list[dict[str, Any]]) -> list[Any]:
+    """Map items one by one into validated models, as the tools did before the page mappings."""
+    return [mapping.model(**mapping.to_row(item)) for item in page]
+
+
+def constructed(mapping: ResultMapping[Any], page: list[dict[str, Any]]) -> list[Any]:
+    """Map items one by one with model_construct, skipping validation."""
+    return [mapping.model.model_construct(**mapping.to_row(item)) for item in page]
+
+
+def paged(mapping: ResultMapping[Any], page: list[dict[str, Any]]) -> list[Any]:
+    """Map a page with its bulk-validating page mapping."""
+    return mapping.map_page(page)
+
+
+def measure(
+    method: Callable[[ResultMapping[Any], list[dict[str, Any]]], list[Any]],
+    mapping: ResultMapping[Any],
+    page: list[dict[str, Any]],
+    repeat: int,
+) -> float:
+    """Return the best time in milliseconds of mapping the page `repeat` times, with GC paused as in timeit."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            method(mapping, page)
+            best = min(best, time.perf_counter() - start_time)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print timings per result type and page size."""
+    parser = argparse.ArgumentParser(description="Benchmark result mapping")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Page sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    print(f"{'type':<12} {'rows':>7} {'per item':>10} {'construct':>10} {'page':>10} {'speedup':>8}")
+    for name, (mapping, factory) in FACTORIES.items():
+        for rows in args.rows:
+            page = [factory(i) for i in range(rows)]
+            per_item_ms = measure(per_item, mapping, page, args.repeat)
+            constructed_ms = measure(constructed, mapping, page, args.repeat)
+            paged_ms = measure(paged, mapping, page, args.repeat)
+            print(
+                f"{name:<12} {rows:>7} {per_item_ms:>8.1f}ms {constructed_ms:>8.1f}ms {paged_ms:>8.1f}ms "
+                f"{per_item_ms / paged_ms:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
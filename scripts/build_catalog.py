@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Catalog snapshot build script for ModelScope MCP Server.
+
+Usage:
+    python scripts/build_catalog.py                          # Build all catalogs into MODELSCOPE_CATALOG_DIR
+    python scripts/build_catalog.py --kind models            # Build only the models catalog
+    python scripts/build_catalog.py --dir ./catalog --max-rows 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from modelscope_mcp_server.catalog import CATALOG_SCHEMAS, build_catalog_snapshot, get_catalog
+from modelscope_mcp_server.client import ModelScopeClient
+from modelscope_mcp_server.settings import settings
+
+
+async def build(kinds: list[str], directory: str, max_rows: int) -> None:
+    """Build snapshots for the given catalog kinds."""
+    try:
+        for kind in kinds:
+            print(f"🔄 Building {kind} catalog...")
+            start_time = time.perf_counter()
+            path = await build_catalog_snapshot(kind, max_rows, directory)
+            elapsed = time.perf_counter() - start_time
+            print(f"✅ Wrote {path} in {elapsed:.1f}s")
+    finally:
+        await ModelScopeClient.close_global_pool()
+
+
+def main() -> None:
+    """Handle catalog build operations."""
+    parser = argparse.ArgumentParser(description="Build local catalog snapshots")
+    parser.add_argument("--kind", choices=sorted(CATALOG_SCHEMAS), help="Catalog to build (default: all)")
+    parser.add_argument(
+        "--dir", default=settings.catalog_dir, help="Output directory (default: MODELSCOPE_CATALOG_DIR)"
+    )
+    parser.add_argument("--max-rows", type=int, default=100_000, help="Maximum rows per catalog (default: 100000)")
+    args = parser.parse_args()
+
+    if not args.dir:
+        parser.error("--dir is required when MODELSCOPE_CATALOG_DIR is not set")
+
+    kinds = [args.kind] if args.kind else sorted(CATALOG_SCHEMAS)
+
+    try:
+        asyncio.run(build(kinds, args.dir, args.max_rows))
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    settings.catalog_dir = args.dir
+    for kind in kinds:
+        start_time = time.perf_counter()
+        snapshot = get_catalog(kind)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if snapshot is not None:
+            print(f"📋 {kind}: {snapshot.row_count} rows, opened in {elapsed_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
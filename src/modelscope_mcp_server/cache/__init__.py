@@ -0,0 +1,20 @@
+"""Caching of upstream ModelScope API responses."""
+
+from .backend import CacheBackend, StoredValue, create_backend
+from .disk import DiskBackend, DiskCache
+from .redis import RedisBackend
+from .response import CachePolicy, CacheStatistics, ResponseCache, make_cache_key, response_cache
+
+__all__ = [
+    "CacheBackend",
+    "CachePolicy",
+    "CacheStatistics",
+    "DiskBackend",
+    "DiskCache",
+    "RedisBackend",
+    "ResponseCache",
+    "StoredValue",
+    "create_backend",
+    "make_cache_key",
+    "response_cache",
+]
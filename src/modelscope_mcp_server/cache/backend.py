@@ -0,0 +1,105 @@
+"""Shared second-level cache backends.
+
+A backend sits behind the in-memory response cache, which acts as its near-cache. Backends
+store JSON responses together with their (wall-clock) storage time, so that entries keep
+their age when they move between processes or replicas.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, NamedTuple
+
+from ..settings import settings
+
+# Called with the key of an entry that was changed by another process or replica
+InvalidationListener = Callable[[str], None]
+
+
+class StoredValue(NamedTuple):
+    """A cached response with its wall-clock storage time."""
+
+    value: dict[str, Any]
+    stored_at: float
+
+
+def dump_value(value: dict[str, Any]) -> bytes:
+    """Serialize a response as zlib-compressed JSON."""
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def load_value(data: bytes) -> dict[str, Any]:
+    """Deserialize a response written by dump_value."""
+    return json.loads(zlib.decompress(data))
+
+
+class CacheBackend(ABC):
+    """Interface of a second-level cache tier.
+
+    Backends must never make a request fail: errors and timeouts are reported as misses.
+    """
+
+    name: str = "backend"
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._listeners: list[InvalidationListener] = []
+
+    @abstractmethod
+    async def get_many(self, keys: Iterable[str]) -> dict[str, StoredValue]:
+        """Return the stored values found for the given keys."""
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, StoredValue], ttl: float) -> None:
+        """Store values that expire `ttl` seconds after their storage time."""
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        """Remove keys."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries owned by this cache."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections and other resources."""
+
+    async def get(self, key: str) -> StoredValue | None:
+        """Return the stored value for a single key."""
+        return (await self.get_many([key])).get(key)
+
+    async def set(self, key: str, value: StoredValue, ttl: float) -> None:
+        """Store a single value."""
+        await self.set_many({key: value}, ttl)
+
+    def add_invalidation_listener(self, listener: InvalidationListener) -> None:
+        """Register a callback for keys changed elsewhere, used to invalidate near-caches."""
+        self._listeners.append(listener)
+
+    def _notify_invalidated(self, key: str) -> None:
+        for listener in self._listeners:
+            listener(key)
+
+
+def create_backend() -> CacheBackend | None:
+    """Create the backend configured in settings, if any.
+
+    A Redis URL takes precedence over a local cache directory.
+    """
+    if settings.cache_redis_url:
+        from .redis import RedisBackend
+
+        return RedisBackend(settings.cache_redis_url, timeout=settings.cache_backend_timeout_seconds)
+
+    if settings.cache_dir:
+        from .disk import DiskBackend, DiskCache
+
+        path = os.path.join(settings.cache_dir, "responses.sqlite3")
+        return DiskBackend(DiskCache(path, max_bytes=settings.cache_disk_max_bytes))
+
+    return None
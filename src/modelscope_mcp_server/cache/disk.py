@@ -0,0 +1,211 @@
+"""Persistent on-disk tier for the response cache.
+
+Entries are stored in a single SQLite database in WAL mode, so any number of reader and
+writer processes on the same host (for example multiple HTTP workers) can share one cache
+file, and warm entries survive restarts. Values are zlib-compressed JSON.
+
+Timestamps are wall-clock (``time.time()``) since they must be comparable across processes.
+The total size of the values is kept in a meta row, updated by triggers in the same
+transaction as each change, so that enforcing the size limit does not scan the table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from fastmcp.utilities import logging
+
+from .backend import CacheBackend, StoredValue, dump_value, load_value
+
+logger = logging.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO meta (name, value) SELECT 'total_size', COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'total_size';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_size';
+END;
+"""
+
+
+class DiskCache:
+    """SQLite-backed key/value store with per-entry TTLs and a total size limit.
+
+    Methods are blocking; call them from a worker thread in async code.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_bytes: int, busy_timeout: float = 5.0) -> None:
+        """Open (or create) a cache database.
+
+        Args:
+            path: Database file path, parent directories are created as needed
+            max_bytes: Maximum total size of compressed values
+            busy_timeout: Seconds to wait for a write lock held by another process
+
+        """
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Create the schema in one transaction, so that the size total of an existing database
+        # is computed once, while no other process writes
+        self._conn.executescript(f"BEGIN IMMEDIATE; {_SCHEMA} COMMIT;")
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """Return (value, stored_at) for a key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return load_value(row[0]), row[1]
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Dropping corrupt disk cache entry: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: dict[str, Any], ttl: float, stored_at: float | None = None) -> None:
+        """Store a value that expires after `ttl` seconds, evicting entries beyond the size limit."""
+        stored_at = time.time() if stored_at is None else stored_at
+        blob = dump_value(value)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # An upsert rather than INSERT OR REPLACE, whose implicit delete fires no trigger
+                self._conn.execute(
+                    "INSERT INTO entries (key, value, size, stored_at, expires_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "stored_at = excluded.stored_at, expires_at = excluded.expires_at",
+                    (key, blob, len(blob), stored_at, stored_at + ttl),
+                )
+                self._trim()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _trim(self) -> None:
+        """Drop expired entries, then the entries closest to expiry until under the size limit."""
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY expires_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def _total_size(self) -> int:
+        (total,) = self._conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()
+        return total
+
+    def delete(self, key: str) -> None:
+        """Remove a key."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def size_bytes(self) -> int:
+        """Return the total size of stored (compressed) values."""
+        with self._lock:
+            return self._total_size()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet purged."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class DiskBackend(CacheBackend):
+    """Cache backend storing entries in a local DiskCache, shared by the processes on a host."""
+
+    name = "disk"
+
+    def __init__(self, disk: DiskCache) -> None:
+        """Initialize the backend.
+
+        Args:
+            disk: The disk cache to store entries in
+
+        """
+        super().__init__()
+        self.disk = disk
+
+    def _get_many(self, keys: Iterable[str]) -> dict[str, StoredValue]:
+        results = {}
+        for key in keys:
+            result = self.disk.get(key)
+            if result is not None:
+                results[key] = StoredValue(*result)
+        return results
+
+    def _set_many(self, items: Mapping[str, StoredValue], ttl: float) -> None:
+        for key, (value, stored_at) in items.items():
+            self.disk.set(key, value, ttl, stored_at=stored_at)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, StoredValue]:
+        """Return the stored values found for the given keys."""
+        return await asyncio.to_thread(self._get_many, list(keys))
+
+    async def set_many(self, items: Mapping[str, StoredValue], ttl: float) -> None:
+        """Store values that expire `ttl` seconds after their storage time."""
+        await asyncio.to_thread(self._set_many, dict(items), ttl)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        """Remove keys."""
+        for key in keys:
+            await asyncio.to_thread(self.disk.delete, key)
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        await asyncio.to_thread(self.disk.clear)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        self.disk.close()
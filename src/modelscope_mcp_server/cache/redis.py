@@ -0,0 +1,370 @@
+"""Redis-protocol cache backend shared by server replicas.
+
+Implements the small subset of RESP needed for caching directly on asyncio streams, so any
+Redis-compatible server works without extra dependencies:
+
+* Commands are pipelined over a single connection: concurrent callers write their commands
+  without waiting for earlier replies, and replies are matched to callers in order.
+  Multi-key reads use ``MGET`` and multi-key writes are sent as one batch.
+* Every operation is bounded by a short client-side timeout. Timeouts count as misses, and
+  after a connection failure the backend stays disabled for a retry interval, so an
+  unavailable cache server never slows down tool calls.
+* Writes publish the changed keys on a pub/sub channel. Other replicas drop those keys from
+  their in-memory near-cache, so their next read picks up the new entry. Invalidations sent
+  while a subscriber is disconnected are lost; the near-cache TTLs bound the staleness.
+
+Streams belong to the event loop that opened them, so each running loop has its own
+connection and subscriber (see LoopConnection).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from fastmcp.utilities import logging
+
+from .backend import CacheBackend, StoredValue, dump_value, load_value
+
+logger = logging.get_logger(__name__)
+
+# Stored values are prefixed with their wall-clock storage time
+_STORED_AT = struct.Struct("<d")
+
+DEFAULT_KEY_PREFIX = "modelscope-mcp:"
+DEFAULT_RETRY_INTERVAL_SECONDS = 5.0
+
+
+class RedisError(Exception):
+    """Error reply from the server or protocol violation."""
+
+
+def encode_command(*args: str | bytes | int | float) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            data = arg.encode("utf-8")
+        elif isinstance(arg, bytes):
+            data = arg
+        else:
+            data = str(arg).encode("ascii")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read a single RESP reply.
+
+    Error replies are returned as RedisError instances rather than raised, so that a pipeline
+    stays in sync after a failed command.
+    """
+    line = await reader.readuntil(b"\r\n")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        return RedisError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply: {line!r}")
+
+
+async def open_streams(
+    host: str, port: int, password: str | None = None, db: int = 0
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect, authenticate and select the database."""
+    reader, writer = await asyncio.open_connection(host, port)
+    setup: list[tuple[Any, ...]] = []
+    if password:
+        setup.append(("AUTH", password))
+    if db:
+        setup.append(("SELECT", db))
+    try:
+        for command in setup:
+            writer.write(encode_command(*command))
+            reply = await read_reply(reader)
+            if isinstance(reply, RedisError):
+                raise reply
+    except BaseException:
+        writer.close()
+        raise
+    return reader, writer
+
+
+class RedisConnection:
+    """A pipelined RESP connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Wrap an open stream pair and start reading replies."""
+        self._reader = reader
+        self._writer = writer
+        self._pending: deque[asyncio.Future[Any]] = deque()
+        self._reader_task = asyncio.create_task(self._read_replies())
+
+    @classmethod
+    async def open(cls, host: str, port: int, password: str | None = None, db: int = 0) -> RedisConnection:
+        """Open a connection, see open_streams."""
+        return cls(*await open_streams(host, port, password, db))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection was closed or lost."""
+        return self._reader_task.done()
+
+    def send(self, commands: Iterable[tuple[Any, ...]]) -> list[asyncio.Future[Any]]:
+        """Write commands in one batch and return futures for their replies."""
+        if self.closed:
+            raise ConnectionError("Connection is closed")
+        loop = asyncio.get_running_loop()
+        futures = []
+        buffer = bytearray()
+        for command in commands:
+            buffer += encode_command(*command)
+            future = loop.create_future()
+            self._pending.append(future)
+            futures.append(future)
+        self._writer.write(bytes(buffer))
+        return futures
+
+    async def _read_replies(self) -> None:
+        try:
+            while True:
+                reply = await read_reply(self._reader)
+                future = self._pending.popleft()
+                # Callers that timed out have cancelled their futures
+                if not future.done():
+                    future.set_result(reply)
+        except (asyncio.IncompleteReadError, OSError, RedisError, IndexError) as e:
+            error = ConnectionError(f"Connection lost: {e}")
+        except asyncio.CancelledError:
+            error = ConnectionError("Connection closed")
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+        self._writer.close()
+
+    def close(self) -> None:
+        """Close the connection, failing pending replies."""
+        self._reader_task.cancel()
+        self._writer.close()
+
+
+@dataclass
+class LoopConnection:
+    """Connection and invalidation subscriber of an event loop."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    connection: RedisConnection | None = None
+    subscriber: asyncio.Task[None] | None = None
+
+
+class RedisBackend(CacheBackend):
+    """Cache backend on a Redis-compatible server, shared by all replicas."""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the backend, connecting lazily on first use.
+
+        Args:
+            url: Server URL such as redis://:password@host:6379/0
+            timeout: Client-side timeout in seconds for each operation
+            key_prefix: Prefix for all keys, also used for the invalidation channel
+            retry_interval: Seconds to stay disabled after a connection failure
+
+        """
+        super().__init__()
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"Unsupported cache URL scheme: {parts.scheme}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+        self.retry_interval = retry_interval
+        self.channel = f"{key_prefix}invalidate"
+        # Identifies this replica's own invalidation messages
+        self.node_id = uuid.uuid4().hex
+
+        self._disabled_until = 0.0
+        self._loop_connections: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopConnection] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._registry_lock = threading.Lock()
+
+    def _get_loop_connection(self) -> LoopConnection:
+        """Return the connection state of the running event loop, registering it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._registry_lock:
+            state = self._loop_connections.get(loop)
+            if state is None:
+                # Connections reference their loop, so the entries of closed loops are only dropped here
+                for closed_loop in [other for other in self._loop_connections if other.is_closed()]:
+                    del self._loop_connections[closed_loop]
+                state = self._loop_connections[loop] = LoopConnection()
+        return state
+
+    async def _get_connection(self) -> RedisConnection:
+        state = self._get_loop_connection()
+        if state.connection is not None and not state.connection.closed:
+            return state.connection
+        async with state.lock:
+            if state.connection is None or state.connection.closed:
+                state.connection = await RedisConnection.open(self.host, self.port, self.password, self.db)
+        return state.connection
+
+    def _disable(self, error: BaseException) -> None:
+        logger.warning(f"Cache server {self.host}:{self.port} unavailable, retrying in {self.retry_interval}s: {error}")
+        self._disabled_until = time.monotonic() + self.retry_interval
+        state = self._get_loop_connection()
+        if state.connection is not None:
+            state.connection.close()
+            state.connection = None
+
+    async def _execute(self, commands: list[tuple[Any, ...]]) -> list[Any] | None:
+        """Run a pipeline of commands, returning None on timeouts and connection failures."""
+        if time.monotonic() < self._disabled_until:
+            return None
+        if self._listeners:
+            state = self._get_loop_connection()
+            if state.subscriber is None:
+                state.subscriber = asyncio.create_task(self._subscribe())
+
+        deadline = time.monotonic() + self.timeout
+        try:
+            connection = await asyncio.wait_for(self._get_connection(), self.timeout)
+            futures = connection.send(commands)
+            return await asyncio.wait_for(asyncio.gather(*futures), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            logger.debug(f"Cache server did not answer within {self.timeout}s")
+            return None
+        except (OSError, RedisError) as e:
+            self._disable(e)
+            return None
+
+    def _key(self, key: str) -> str:
+        return self.key_prefix + key
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, StoredValue]:
+        """Return the stored values found for the given keys, using a single MGET."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        replies = await self._execute([("MGET", *(self._key(key) for key in keys))])
+        if replies is None or not isinstance(replies[0], list):
+            return {}
+
+        results = {}
+        for key, data in zip(keys, replies[0], strict=True):
+            if not isinstance(data, bytes) or len(data) < _STORED_AT.size:
+                continue
+            try:
+                (stored_at,) = _STORED_AT.unpack_from(data)
+                results[key] = StoredValue(load_value(data[_STORED_AT.size :]), stored_at)
+            except ValueError as e:
+                logger.warning(f"Ignoring corrupt cache entry: {e}")
+        return results
+
+    async def set_many(self, items: Mapping[str, StoredValue], ttl: float) -> None:
+        """Store values in one pipelined batch and notify other replicas."""
+        now = time.time()
+        commands: list[tuple[Any, ...]] = []
+        for key, (value, stored_at) in items.items():
+            ttl_ms = int((stored_at + ttl - now) * 1000)
+            if ttl_ms > 0:
+                data = _STORED_AT.pack(stored_at) + dump_value(value)
+                commands.append(("SET", self._key(key), data, "PX", ttl_ms))
+        commands += [("PUBLISH", self.channel, f"{self.node_id}\n{key}") for key in items]
+        if commands:
+            await self._execute(commands)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        """Remove keys and notify other replicas."""
+        keys = list(keys)
+        if keys:
+            commands: list[tuple[Any, ...]] = [("DEL", *(self._key(key) for key in keys))]
+            commands += [("PUBLISH", self.channel, f"{self.node_id}\n{key}") for key in keys]
+            await self._execute(commands)
+
+    async def clear(self) -> None:
+        """Remove all keys with this backend's prefix."""
+        cursor = b"0"
+        while True:
+            replies = await self._execute([("SCAN", cursor, "MATCH", f"{self.key_prefix}*", "COUNT", 500)])
+            if replies is None or not isinstance(replies[0], list):
+                return
+            cursor, keys = replies[0]
+            if keys:
+                await self._execute([("DEL", *keys)])
+            if cursor in (b"0", "0"):
+                return
+
+    async def _subscribe(self) -> None:
+        """Listen for invalidations from other replicas, reconnecting after failures."""
+        while True:
+            writer = None
+            try:
+                reader, writer = await asyncio.wait_for(
+                    open_streams(self.host, self.port, self.password, self.db), self.timeout
+                )
+                writer.write(encode_command("SUBSCRIBE", self.channel))
+                while True:
+                    message = await read_reply(reader)
+                    if isinstance(message, list) and len(message) == 3 and message[0] == b"message":
+                        node_id, _, key = message[2].decode("utf-8").partition("\n")
+                        if node_id != self.node_id:
+                            self._notify_invalidated(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Cache invalidation subscriber disconnected: {e}")
+            finally:
+                if writer is not None:
+                    writer.close()
+            await asyncio.sleep(self.retry_interval)
+
+    async def close(self) -> None:
+        """Stop the invalidation subscriber and close the connection of the running event loop.
+
+        Those of other loops end with their loop.
+        """
+        state = self._get_loop_connection()
+        if state.subscriber is not None:
+            state.subscriber.cancel()
+            try:
+                await state.subscriber
+            except asyncio.CancelledError:
+                pass
+            state.subscriber = None
+        if state.connection is not None:
+            state.connection.close()
+            state.connection = None
@@ -0,0 +1,532 @@
+"""Client-level response cache with stale-while-revalidate semantics.
+
+Every cached entry moves through three phases, measured from the time it was stored:
+
+    fresh (age <= soft TTL)   -> served directly
+    stale (age <= hard TTL)   -> served directly, refreshed once in the background
+    expired                   -> refetched synchronously
+
+While the upstream is failing, expired entries keep being served for up to
+``stale_if_error`` seconds past their hard TTL. Concurrent fetches for the same key are
+collapsed into a single upstream request (single-flight).
+
+Negative outcomes (not-found errors and, per policy, empty results) are kept in a separate,
+smaller store with a short TTL, so repeated lookups of missing resources are answered
+locally. They are never stale-served or written to the backend.
+
+Likely follow-up requests can be prefetched in the background to warm the cache. Prefetches
+are best-effort: they are dropped when the concurrency cap is reached, and hits on prefetched
+entries are counted to measure whether prefetching pays off.
+
+If a backend is configured (see create_backend), it sits behind the in-memory LRU, which
+acts as its near-cache: memory misses are looked up in the backend before going upstream,
+and fetched responses are written to it in the background, so warm entries survive restarts
+and are shared between workers or replicas.
+
+Cached entries are shared by all event loops of the process, under a thread lock. Fetches,
+refreshes, prefetches and backend writes run as tasks of the loop that started them, so each
+loop keeps its own (see LoopTasks), and concurrent fetches are only collapsed within a loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from fastmcp.utilities import logging
+
+from ..settings import settings
+from .backend import CacheBackend, StoredValue, create_backend
+
+logger = logging.get_logger(__name__)
+
+Fetcher = Callable[[], Awaitable[dict[str, Any]]]
+
+# HTTP statuses meaning the requested resource does not exist
+NOT_FOUND_STATUS_CODES = (404, 410)
+
+
+def is_not_found_error(error: BaseException) -> bool:
+    """Check if an upstream error means the requested resource does not exist.
+
+    Besides HTTP 404/410, errors may flag themselves with a truthy ``not_found`` attribute,
+    as ModelScopeAPIError does for not-found business error codes.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in NOT_FOUND_STATUS_CODES
+    return bool(getattr(error, "not_found", False))
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy for a class of upstream requests.
+
+    TTLs left as None fall back to the global cache settings. Responses for which
+    `is_empty` returns True are cached as negative results. Responses that depend on the
+    caller's token, such as searches that list the caller's private repositories, are
+    `per_tenant` and cached separately for each caller passing its own token (see tenant).
+    """
+
+    name: str
+    soft_ttl: float | None = None
+    hard_ttl: float | None = None
+    negative_ttl: float | None = None
+    per_tenant: bool = False
+    is_empty: Callable[[dict[str, Any]], bool] | None = field(default=None, compare=False)
+
+    @property
+    def soft_ttl_seconds(self) -> float:
+        """Seconds an entry is served without revalidation."""
+        return settings.cache_soft_ttl_seconds if self.soft_ttl is None else self.soft_ttl
+
+    @property
+    def hard_ttl_seconds(self) -> float:
+        """Seconds an entry may be served at all (while revalidating)."""
+        hard_ttl = settings.cache_hard_ttl_seconds if self.hard_ttl is None else self.hard_ttl
+        return max(hard_ttl, self.soft_ttl_seconds)
+
+    @property
+    def negative_ttl_seconds(self) -> float:
+        """Seconds a not-found error or empty response is served."""
+        return settings.cache_negative_ttl_seconds if self.negative_ttl is None else self.negative_ttl
+
+
+@dataclass
+class CacheEntry:
+    """A cached upstream response."""
+
+    value: dict[str, Any]
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return time.monotonic() - self.stored_at
+
+
+@dataclass
+class NotFoundError:
+    """What is kept of a not-found error, to raise a new one on each negative hit.
+
+    HTTP errors are rebuilt with a bare request and response carrying the status; other
+    errors flagged ``not_found`` are rebuilt as ``error_type(message, code, status_code)``,
+    the signature of ModelScopeAPIError.
+    """
+
+    error_type: type[Exception]
+    message: str
+    status_code: int
+    code: Any = None
+    method: str = "GET"
+    url: str = ""
+
+    @classmethod
+    def from_error(cls, error: Exception) -> NotFoundError:
+        """Keep the type, status and message of a not-found error."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return cls(
+                type(error),
+                str(error),
+                error.response.status_code,
+                method=error.request.method,
+                url=str(error.request.url),
+            )
+        return cls(type(error), str(error), getattr(error, "status_code", 404), getattr(error, "code", None))
+
+    def to_error(self) -> Exception:
+        """Build a new exception equivalent to the cached one."""
+        if issubclass(self.error_type, httpx.HTTPStatusError):
+            request = httpx.Request(self.method, self.url)
+            response = httpx.Response(self.status_code, request=request)
+            return self.error_type(self.message, request=request, response=response)
+        return self.error_type(self.message, self.code, self.status_code)
+
+
+@dataclass
+class NegativeEntry:
+    """A cached not-found error or empty response."""
+
+    stored_at: float
+    value: dict[str, Any] = field(default_factory=dict)
+    error: NotFoundError | None = None
+
+
+@dataclass
+class CacheStatistics:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    # Hits (fresh or stale) served from the backend tier after a memory miss
+    backend_hits: int = 0
+    background_refreshes: int = 0
+    stale_on_error: int = 0
+    negative_hits: int = 0
+    evictions: int = 0
+    prefetches: int = 0
+    # Prefetches dropped because the concurrency cap was reached
+    prefetches_dropped: int = 0
+    prefetch_failures: int = 0
+    # Requests answered by (or joined) a prefetched entry
+    prefetch_hits: int = 0
+
+    @property
+    def prefetch_hit_rate(self) -> float:
+        """Fraction of prefetches that were used by a later request."""
+        return self.prefetch_hits / self.prefetches if self.prefetches else 0.0
+
+
+@dataclass
+class LoopTasks:
+    """Fetches and background tasks of the cache running in an event loop."""
+
+    inflight: dict[str, asyncio.Future[dict[str, Any]]] = field(default_factory=dict)
+    # Keys being refreshed in the background
+    refreshing: set[str] = field(default_factory=set)
+    refresh_tasks: set[asyncio.Future[None]] = field(default_factory=set)
+    pending_writes: set[asyncio.Future[None]] = field(default_factory=set)
+    prefetch_tasks: set[asyncio.Future[None]] = field(default_factory=set)
+
+
+def make_cache_key(method: str, url: str, *parts: Mapping[str, Any] | None) -> str:
+    """Build a stable cache key from a request method, URL and payload parts.
+
+    Payloads are serialized with sorted keys, so logically equal requests share a key.
+    """
+    payload = json.dumps([part or {} for part in parts], sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    return f"{method.upper()} {url} {digest}"
+
+
+class ResponseCache:
+    """Bounded LRU cache of upstream JSON responses with stale-while-revalidate.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int | None = None, backend: CacheBackend | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries, defaults to settings.cache_max_entries
+            backend: Shared second-level tier, defaults to the backend configured in settings
+
+        """
+        self.max_entries = max_entries
+        self.stats = CacheStatistics()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._negative: OrderedDict[str, NegativeEntry] = OrderedDict()
+        # Prefetched keys not requested yet
+        self._prefetched: set[str] = set()
+        # Guards the entries above, which are shared by the event loops of all threads
+        self._lock = threading.Lock()
+        self._loop_tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopTasks] = weakref.WeakKeyDictionary()
+        self.backend: CacheBackend | None = None
+        self._backend_configured = False
+        if backend is not None:
+            self._attach_backend(backend)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._negative.clear()
+            self._prefetched.clear()
+            self.stats = CacheStatistics()
+
+    def invalidate_local(self, key: str) -> None:
+        """Drop a key from memory only, e.g. after it was changed by another replica."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._negative.pop(key, None)
+            self._prefetched.discard(key)
+
+    def _get_loop_tasks(self) -> LoopTasks:
+        """Return the tasks of the running event loop, registering it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._loop_tasks.get(loop)
+            if tasks is None:
+                # Tasks reference their loop, so the entries of closed loops are only dropped here
+                for closed_loop in [other for other in self._loop_tasks if other.is_closed()]:
+                    del self._loop_tasks[closed_loop]
+                tasks = self._loop_tasks[loop] = LoopTasks()
+        return tasks
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a key from all tiers, invalidating other replicas' copies."""
+        self.invalidate_local(key)
+        backend = self._get_backend()
+        if backend is not None:
+            await backend.delete([key])
+
+    async def flush(self) -> None:
+        """Wait for pending writes to the backend started in the running event loop."""
+        pending_writes = self._get_loop_tasks().pending_writes
+        if pending_writes:
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel background refreshes and prefetches, flush pending writes and close the backend, if any.
+
+        Only the tasks of the running event loop are cancelled and flushed, those of other loops
+        end with their loop.
+        """
+        tasks = self._get_loop_tasks()
+        background_tasks = [*tasks.refresh_tasks, *tasks.prefetch_tasks]
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        if self.stats.prefetches:
+            logger.info(
+                f"Prefetched {self.stats.prefetches} responses, hit rate {self.stats.prefetch_hit_rate:.1%} "
+                f"({self.stats.prefetches_dropped} dropped, {self.stats.prefetch_failures} failed)"
+            )
+        await self.flush()
+        if self.backend is not None:
+            await self.backend.close()
+        self.backend = None
+        self._backend_configured = False
+
+    def _attach_backend(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._backend_configured = True
+        backend.add_invalidation_listener(self.invalidate_local)
+
+    def _get_backend(self) -> CacheBackend | None:
+        if not self._backend_configured:
+            with self._lock:
+                if not self._backend_configured:
+                    backend = create_backend()
+                    self._backend_configured = True
+                    if backend is not None:
+                        logger.info(f"Using {backend.name} cache backend")
+                        self._attach_backend(backend)
+        return self.backend
+
+    async def _read_backend(self, key: str) -> CacheEntry | None:
+        """Look up a key in the backend tier."""
+        backend = self._get_backend()
+        if backend is None:
+            return None
+        try:
+            result = await backend.get(key)
+        except Exception as e:
+            logger.warning(f"Cache backend read failed: {e}")
+            return None
+        if result is None:
+            return None
+
+        # Convert the wall-clock storage time into the monotonic clock used in memory
+        return CacheEntry(value=result.value, stored_at=time.monotonic() - max(time.time() - result.stored_at, 0.0))
+
+    async def _write_backend(self, backend: CacheBackend, key: str, value: StoredValue, ttl: float) -> None:
+        try:
+            await backend.set(key, value, ttl)
+        except Exception as e:
+            logger.warning(f"Cache backend write failed: {e}")
+
+    def _schedule_write(self, key: str, value: dict[str, Any], policy: CachePolicy) -> None:
+        """Write an entry to the backend in the background, so that callers never wait for it."""
+        backend = self._get_backend()
+        if backend is None:
+            return
+        # Keep entries in the backend as long as they may be served, including after upstream errors
+        ttl = policy.hard_ttl_seconds + settings.cache_stale_if_error_seconds
+        task = asyncio.ensure_future(self._write_backend(backend, key, StoredValue(value, time.time()), ttl))
+        pending_writes = self._get_loop_tasks().pending_writes
+        pending_writes.add(task)
+        task.add_done_callback(pending_writes.discard)
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._negative.pop(key, None)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _store_negative(self, key: str, entry: NegativeEntry) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._negative[key] = entry
+            self._negative.move_to_end(key)
+            while len(self._negative) > settings.cache_negative_max_entries:
+                self._negative.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def _evict(self) -> None:
+        # Called with the lock held
+        max_entries = self.max_entries or settings.cache_max_entries
+        while len(self._entries) > max_entries:
+            key, _ = self._entries.popitem(last=False)
+            self._prefetched.discard(key)
+            self.stats.evictions += 1
+
+    async def _load(self, key: str, fetch: Fetcher, policy: CachePolicy) -> dict[str, Any]:
+        try:
+            value = await fetch()
+        except Exception as e:
+            if is_not_found_error(e):
+                self._store_negative(key, NegativeEntry(stored_at=time.monotonic(), error=NotFoundError.from_error(e)))
+            raise
+
+        if policy.is_empty is not None and policy.is_empty(value):
+            self._store_negative(key, NegativeEntry(stored_at=time.monotonic(), value=value))
+            return value
+
+        self._store(key, CacheEntry(value=value, stored_at=time.monotonic()))
+        self._schedule_write(key, value, policy)
+        return value
+
+    async def _fetch(self, key: str, fetch: Fetcher, policy: CachePolicy) -> dict[str, Any]:
+        """Fetch a value, sharing one upstream request between concurrent callers of the running loop."""
+        inflight = self._get_loop_tasks().inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, fetch, policy))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so that a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _refresh(self, key: str, fetch: Fetcher, policy: CachePolicy) -> None:
+        try:
+            await self._fetch(key, fetch, policy)
+        except Exception as e:
+            logger.warning(f"Background refresh failed, keeping stale entry: {e}")
+        finally:
+            self._get_loop_tasks().refreshing.discard(key)
+
+    def _schedule_refresh(self, key: str, fetch: Fetcher, policy: CachePolicy) -> None:
+        tasks = self._get_loop_tasks()
+        if key in tasks.refreshing or key in tasks.inflight:
+            return
+        tasks.refreshing.add(key)
+        self.stats.background_refreshes += 1
+        task = asyncio.ensure_future(self._refresh(key, fetch, policy))
+        tasks.refresh_tasks.add(task)
+        task.add_done_callback(tasks.refresh_tasks.discard)
+
+    async def _prefetch(self, key: str, fetch: Fetcher, policy: CachePolicy) -> None:
+        try:
+            await self._fetch(key, fetch, policy)
+        except Exception as e:
+            self.stats.prefetch_failures += 1
+            with self._lock:
+                self._prefetched.discard(key)
+            logger.debug(f"Prefetch failed ({policy.name}): {e}")
+
+    def prefetch(self, key: str, fetch: Fetcher, policy: CachePolicy) -> bool:
+        """Warm the cache for a likely follow-up request in the background.
+
+        Keys that are already cached or being fetched are skipped, and prefetches beyond
+        settings.prefetch_max_concurrency in the running event loop are dropped rather than
+        queued.
+
+        Returns:
+            True if a prefetch was started
+
+        """
+        tasks = self._get_loop_tasks()
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and entry.age <= policy.soft_ttl_seconds) or key in self._negative:
+                return False
+            if key in tasks.inflight or key in self._prefetched:
+                return False
+            if len(tasks.prefetch_tasks) >= settings.prefetch_max_concurrency:
+                self.stats.prefetches_dropped += 1
+                return False
+
+            self.stats.prefetches += 1
+            self._prefetched.add(key)
+        task = asyncio.ensure_future(self._prefetch(key, fetch, policy))
+        tasks.prefetch_tasks.add(task)
+        task.add_done_callback(tasks.prefetch_tasks.discard)
+        return True
+
+    async def get_or_fetch(self, key: str, fetch: Fetcher, policy: CachePolicy) -> dict[str, Any]:
+        """Return the cached value for a key, fetching or revalidating it as needed.
+
+        Args:
+            key: Cache key, see make_cache_key
+            fetch: Coroutine function performing the upstream request
+            policy: Caching policy for this request
+
+        Returns:
+            The (possibly stale) upstream response
+
+        """
+        with self._lock:
+            if key in self._prefetched:
+                self._prefetched.discard(key)
+                self.stats.prefetch_hits += 1
+
+            negative = self._negative.get(key)
+            if negative is not None and time.monotonic() - negative.stored_at > policy.negative_ttl_seconds:
+                del self._negative[key]
+                negative = None
+            entry = self._entries.get(key)
+
+        if negative is not None:
+            self.stats.negative_hits += 1
+            if negative.error is not None:
+                raise negative.error.to_error()
+            return negative.value
+
+        if entry is None or entry.age > policy.soft_ttl_seconds:
+            # The backend may hold a fresher copy, e.g. stored by another worker or before a restart
+            backend_entry = await self._read_backend(key)
+            if backend_entry is not None and (entry is None or backend_entry.stored_at > entry.stored_at):
+                self.stats.backend_hits += 1
+                entry = backend_entry
+                self._store(key, entry)
+        if entry is not None:
+            age = entry.age
+            if age <= policy.soft_ttl_seconds:
+                self.stats.hits += 1
+                self._touch(key)
+                return entry.value
+            if age <= policy.hard_ttl_seconds:
+                self.stats.stale_hits += 1
+                self._touch(key)
+                self._schedule_refresh(key, fetch, policy)
+                return entry.value
+
+        self.stats.misses += 1
+        try:
+            return await self._fetch(key, fetch, policy)
+        except Exception as e:
+            if (
+                entry is not None
+                and not is_not_found_error(e)
+                and entry.age <= policy.hard_ttl_seconds + settings.cache_stale_if_error_seconds
+            ):
+                logger.warning(f"Upstream request failed, serving stale response ({policy.name}): {e}")
+                self.stats.stale_on_error += 1
+                return entry.value
+            raise
+
+
+# Global response cache shared by all clients
+response_cache = ResponseCache()
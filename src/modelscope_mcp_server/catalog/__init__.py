@@ -0,0 +1,58 @@
+"""Local catalog of ModelScope resources backed by memory-mapped snapshot files."""
+
+import os
+import threading
+
+from fastmcp.utilities import logging
+
+from .builder import CATALOG_SCHEMAS, build_catalog_snapshot, get_snapshot_path
+from .snapshot import CatalogSnapshot, ColumnSpec, ColumnType, SnapshotFormatError, write_snapshot
+
+logger = logging.get_logger(__name__)
+
+_snapshots: dict[str, CatalogSnapshot] = {}
+_lock = threading.Lock()
+
+
+def get_catalog(kind: str) -> CatalogSnapshot | None:
+    """Get the memory-mapped snapshot for a catalog kind.
+
+    Snapshots are opened lazily and kept open for the lifetime of the process. If the file has
+    been replaced since it was opened (for example by a rebuild), the new file is mapped instead.
+
+    Args:
+        kind: Catalog kind, for example 'models'
+
+    Returns:
+        The snapshot, or None if no catalog directory is configured or the file does not exist
+
+    """
+    try:
+        path = get_snapshot_path(kind)
+        stat = os.stat(path)
+    except (ValueError, FileNotFoundError):
+        return None
+
+    with _lock:
+        snapshot = _snapshots.get(kind)
+        if snapshot is not None and snapshot.path == path and snapshot.file_id == (stat.st_ino, stat.st_mtime_ns):
+            return snapshot
+
+        new_snapshot = CatalogSnapshot(path)
+        logger.info(f"Opened {kind} catalog snapshot: {new_snapshot.row_count} rows from {path}")
+        # The previous mapping is left to the garbage collector, since in-flight readers may still use it
+        _snapshots[kind] = new_snapshot
+        return new_snapshot
+
+
+__all__ = [
+    "CATALOG_SCHEMAS",
+    "CatalogSnapshot",
+    "ColumnSpec",
+    "ColumnType",
+    "SnapshotFormatError",
+    "build_catalog_snapshot",
+    "get_catalog",
+    "get_snapshot_path",
+    "write_snapshot",
+]
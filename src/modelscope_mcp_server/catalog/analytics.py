@@ -0,0 +1,208 @@
+"""Vectorized analytics over catalog snapshot columns.
+
+Numeric columns are wrapped with ``numpy.frombuffer`` directly on the memory-mapped snapshot,
+so aggregations run without copying or materializing rows. String columns are factorized into
+integer codes once per snapshot and cached.
+
+NumPy is an optional dependency, installed with the ``analytics`` extra.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import weakref
+from collections.abc import Mapping, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from .snapshot import CatalogSnapshot, ColumnType, StringColumn
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Factorized string columns per snapshot: {column: (labels, codes)}
+_factorized: weakref.WeakKeyDictionary[CatalogSnapshot, dict[str, tuple[list[str], Any]]] = weakref.WeakKeyDictionary()
+
+
+def is_available() -> bool:
+    """Check if NumPy is installed and analytics are available."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _require_numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on installed extras
+        raise ImportError(
+            "NumPy is required for catalog analytics. Install it with: pip install 'modelscope-mcp-server[analytics]'"
+        ) from e
+    return numpy
+
+
+def numeric_column(snapshot: CatalogSnapshot, name: str) -> npt.NDArray[Any]:
+    """Return a zero-copy NumPy view of a numeric or boolean column."""
+    np = _require_numpy()
+    column = snapshot.column(name)
+    if isinstance(column, StringColumn):
+        raise ValueError(f"Column '{name}' is not a numeric column")
+    dtype = np.int64 if snapshot.column_type(name) == ColumnType.INT64 else np.uint8
+    return np.frombuffer(column, dtype=dtype)
+
+
+def factorize(snapshot: CatalogSnapshot, name: str) -> tuple[list[str], npt.NDArray[Any]]:
+    """Encode a string or boolean column as (labels, integer codes per row).
+
+    String columns are decoded once per snapshot; the result is cached.
+    """
+    np = _require_numpy()
+    if snapshot.column_type(name) == ColumnType.BOOL:
+        return ["false", "true"], numeric_column(snapshot, name).astype(np.intp)
+
+    cached = _factorized.setdefault(snapshot, {})
+    if name not in cached:
+        column = snapshot.column(name)
+        values = np.array(list(column), dtype=object)
+        labels, codes = np.unique(values, return_inverse=True)
+        cached[name] = ([str(label) for label in labels], codes.reshape(-1))
+    return cached[name]
+
+
+def build_mask(
+    snapshot: CatalogSnapshot,
+    query: str = "",
+    where: Mapping[str, Any] | None = None,
+    contains: Mapping[str, str] | None = None,
+) -> npt.NDArray[np.bool_]:
+    """Build a boolean row mask from the same filters as CatalogSnapshot.search."""
+    np = _require_numpy()
+    mask = np.ones(snapshot.row_count, dtype=bool)
+
+    if query:
+        _, rows = snapshot.search(query=query, limit=snapshot.row_count)
+        query_mask = np.zeros(snapshot.row_count, dtype=bool)
+        query_mask[rows] = True
+        mask &= query_mask
+
+    for name, expected in (where or {}).items():
+        if snapshot.column_type(name) == ColumnType.STRING:
+            labels, codes = factorize(snapshot, name)
+            mask &= codes == (labels.index(expected) if expected in labels else -1)
+        else:
+            mask &= numeric_column(snapshot, name) == int(expected)
+
+    for name, needle in (contains or {}).items():
+        column = snapshot.column(name)
+        if not isinstance(column, StringColumn):
+            raise ValueError(f"Column '{name}' is not a string column")
+        contains_mask = np.zeros(snapshot.row_count, dtype=bool)
+        contains_mask[column.find_rows(needle)] = True
+        mask &= contains_mask
+
+    return mask
+
+
+def group_by(
+    snapshot: CatalogSnapshot,
+    mask: npt.NDArray[np.bool_],
+    column: str,
+    metric: str | None = None,
+    limit: int = 10,
+) -> tuple[list[str], list[list[Any]]]:
+    """Count rows (and sum/average a metric) per distinct column value.
+
+    Groups are ordered by the metric sum if a metric is given, otherwise by row count.
+
+    Returns:
+        Tuple of (column names, rows)
+
+    """
+    np = _require_numpy()
+    labels, codes = factorize(snapshot, column)
+    selected = codes[mask]
+    counts = np.bincount(selected, minlength=len(labels))
+
+    header = [column, "count"]
+    if metric is None:
+        order = np.argsort(-counts, kind="stable")
+        sums = None
+    else:
+        values = numeric_column(snapshot, metric)[mask]
+        sums = np.bincount(selected, weights=values, minlength=len(labels))
+        order = np.argsort(-sums, kind="stable")
+        header += [f"sum_{metric}", f"mean_{metric}"]
+
+    rows: list[list[Any]] = []
+    for index in order[:limit]:
+        count = int(counts[index])
+        if count == 0:
+            break
+        row: list[Any] = [labels[index], count]
+        if sums is not None:
+            row += [int(sums[index]), round(float(sums[index]) / count, 2)]
+        rows.append(row)
+    return header, rows
+
+
+def top_k(
+    snapshot: CatalogSnapshot,
+    mask: npt.NDArray[np.bool_],
+    metric: str,
+    limit: int = 10,
+) -> tuple[list[str], list[list[Any]]]:
+    """Return the rows with the highest metric values, using a partial sort."""
+    np = _require_numpy()
+    values = numeric_column(snapshot, metric)
+    row_indexes = np.flatnonzero(mask)
+    if len(row_indexes) > limit:
+        partition = np.argpartition(-values[row_indexes], limit - 1)[:limit]
+        row_indexes = row_indexes[partition]
+    row_indexes = row_indexes[np.argsort(-values[row_indexes], kind="stable")]
+
+    ids = snapshot.column("id")
+    return ["id", metric], [[ids[int(index)], int(values[index])] for index in row_indexes]
+
+
+def histogram(
+    snapshot: CatalogSnapshot,
+    mask: npt.NDArray[np.bool_],
+    metric: str,
+    bins: int = 10,
+    log_scale: bool = False,
+) -> tuple[list[str], list[list[Any]]]:
+    """Bucket metric values into equal-width (or log-spaced) bins."""
+    np = _require_numpy()
+    values = numeric_column(snapshot, metric)[mask]
+    if len(values) == 0:
+        return ["bin_start", "bin_end", "count"], []
+
+    if log_scale:
+        upper = max(int(values.max()), 1)
+        edges = np.unique(np.concatenate(([0], np.geomspace(1, upper + 1, bins))).astype(np.int64))
+    else:
+        edges = np.histogram_bin_edges(values, bins=bins)
+    counts, edges = np.histogram(values, bins=edges)
+
+    rows = [[_as_number(edges[i]), _as_number(edges[i + 1]), int(counts[i])] for i in range(len(counts))]
+    return ["bin_start", "bin_end", "count"], rows
+
+
+def percentiles(
+    snapshot: CatalogSnapshot,
+    mask: npt.NDArray[np.bool_],
+    metric: str,
+    points: Sequence[float] = (50, 90, 99),
+) -> tuple[list[str], list[list[Any]]]:
+    """Compute metric percentiles over the selected rows."""
+    np = _require_numpy()
+    values = numeric_column(snapshot, metric)[mask]
+    if len(values) == 0:
+        return ["percentile", metric], []
+
+    results = np.percentile(values, points)
+    return ["percentile", metric], [[point, _as_number(value)] for point, value in zip(points, results, strict=True)]
+
+
+def _as_number(value: Any) -> int | float:
+    value = float(value)
+    return int(value) if value.is_integer() else round(value, 2)
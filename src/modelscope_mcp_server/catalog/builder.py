@@ -0,0 +1,209 @@
+"""Build catalog snapshots from the ModelScope API.
+
+Pages through the same endpoints used by the search tools and converts each upstream record
+into a flat row matching the catalog schema.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+from fastmcp.utilities import logging
+
+from ..client import get_client
+from ..settings import settings
+from .snapshot import SNAPSHOT_SUFFIX, ColumnSpec, ColumnType, write_snapshot
+
+logger = logging.get_logger(__name__)
+
+CATALOG_PAGE_SIZE = 30
+
+MODEL_SCHEMA = (
+    ColumnSpec("id", ColumnType.STRING),
+    ColumnSpec("path", ColumnType.STRING),
+    ColumnSpec("name", ColumnType.STRING),
+    ColumnSpec("chinese_name", ColumnType.STRING),
+    ColumnSpec("created_by", ColumnType.STRING),
+    ColumnSpec("license", ColumnType.STRING),
+    ColumnSpec("tasks", ColumnType.STRING),
+    ColumnSpec("support_inference", ColumnType.BOOL),
+    ColumnSpec("downloads_count", ColumnType.INT64),
+    ColumnSpec("stars_count", ColumnType.INT64),
+    ColumnSpec("created_at", ColumnType.INT64),
+    ColumnSpec("updated_at", ColumnType.INT64),
+)
+
+DATASET_SCHEMA = (
+    ColumnSpec("id", ColumnType.STRING),
+    ColumnSpec("path", ColumnType.STRING),
+    ColumnSpec("name", ColumnType.STRING),
+    ColumnSpec("chinese_name", ColumnType.STRING),
+    ColumnSpec("created_by", ColumnType.STRING),
+    ColumnSpec("license", ColumnType.STRING),
+    ColumnSpec("downloads_count", ColumnType.INT64),
+    ColumnSpec("likes_count", ColumnType.INT64),
+    ColumnSpec("created_at", ColumnType.INT64),
+    ColumnSpec("updated_at", ColumnType.INT64),
+)
+
+CATALOG_SCHEMAS = {
+    "models": MODEL_SCHEMA,
+    "datasets": DATASET_SCHEMA,
+}
+
+# String columns combined into the case-insensitive search column
+CATALOG_SEARCH_FIELDS = ("id", "chinese_name")
+
+
+def get_snapshot_path(kind: str, directory: str | None = None) -> str:
+    """Return the snapshot file path for a catalog kind."""
+    directory = directory or settings.catalog_dir
+    if not directory:
+        raise ValueError("Catalog directory is not set")
+    return os.path.join(directory, f"{kind}{SNAPSHOT_SUFFIX}")
+
+
+def _join_tasks(tasks: Any) -> str:
+    """Flatten the upstream task list into a comma-separated string."""
+    if not tasks:
+        return ""
+    if isinstance(tasks, str):
+        return tasks
+    names = []
+    for task in tasks:
+        name = task.get("Name") if isinstance(task, dict) else task
+        if name:
+            names.append(str(name))
+    return ",".join(names)
+
+
+def model_row(model_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert an upstream model record into a catalog row."""
+    path = model_data.get("Path", "")
+    name = model_data.get("Name", "")
+    if not path or not name:
+        return None
+
+    return {
+        "id": f"{path}/{name}",
+        "path": path,
+        "name": name,
+        "chinese_name": model_data.get("ChineseName", ""),
+        "created_by": model_data.get("CreatedBy", ""),
+        "license": model_data.get("License", ""),
+        "tasks": _join_tasks(model_data.get("Tasks")),
+        # Non-empty value means True, else False
+        "support_inference": bool(model_data.get("SupportInference", "")),
+        "downloads_count": model_data.get("Downloads", 0),
+        "stars_count": model_data.get("Stars", 0),
+        "created_at": model_data.get("CreatedTime", 0),
+        "updated_at": model_data.get("LastUpdatedTime", 0),
+    }
+
+
+def dataset_row(dataset_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert an upstream dataset record into a catalog row."""
+    path = dataset_data.get("Namespace", "")
+    name = dataset_data.get("Name", "")
+    if not path or not name:
+        return None
+
+    return {
+        "id": f"{path}/{name}",
+        "path": path,
+        "name": name,
+        "chinese_name": dataset_data.get("ChineseName", ""),
+        "created_by": dataset_data.get("CreatedBy", ""),
+        "license": dataset_data.get("License", ""),
+        "downloads_count": dataset_data.get("Downloads", 0),
+        "likes_count": dataset_data.get("Likes", 0),
+        "created_at": dataset_data.get("GmtCreate", 0),
+        "updated_at": dataset_data.get("LastUpdatedTime", 0),
+    }
+
+
+async def _fetch_model_page(page_number: int) -> list[dict[str, Any]]:
+    url = f"{settings.main_domain}/api/v1/dolphin/models"
+    request_data = {
+        "Name": "",
+        "Criterion": [],
+        "SingleCriterion": [],
+        "SortBy": "DownloadsCount",
+        "PageNumber": page_number,
+        "PageSize": CATALOG_PAGE_SIZE,
+    }
+    response = await get_client().put(url, request_data)
+    return response.get("Data", {}).get("Model", {}).get("Models", [])
+
+
+async def _fetch_dataset_page(page_number: int) -> list[dict[str, Any]]:
+    url = f"{settings.main_domain}/api/v1/dolphin/datasets"
+    params = {
+        "Query": "",
+        "Sort": "downloads",
+        "PageNumber": page_number,
+        "PageSize": CATALOG_PAGE_SIZE,
+    }
+    response = await get_client().get(url, params=params)
+    return response.get("Data", [])
+
+
+_FETCHERS: dict[str, tuple[Callable[[int], Any], Callable[[dict[str, Any]], dict[str, Any] | None]]] = {
+    "models": (_fetch_model_page, model_row),
+    "datasets": (_fetch_dataset_page, dataset_row),
+}
+
+
+async def fetch_catalog_rows(kind: str, max_rows: int) -> list[dict[str, Any]]:
+    """Page through the upstream API and return catalog rows.
+
+    Args:
+        kind: Catalog kind, one of CATALOG_SCHEMAS
+        max_rows: Maximum number of rows to fetch
+
+    Returns:
+        Catalog rows, deduplicated by ID
+
+    """
+    if kind not in _FETCHERS:
+        raise ValueError(f"Unsupported catalog kind: {kind}")
+
+    fetch_page, to_row = _FETCHERS[kind]
+    rows: dict[str, dict[str, Any]] = {}
+    page_number = 1
+    while len(rows) < max_rows:
+        records = await fetch_page(page_number)
+        if not records:
+            break
+        for record in records:
+            row = to_row(record)
+            if row is None:
+                logger.warning(f"Skipping {kind} record with invalid path or name: {record}")
+                continue
+            rows.setdefault(row["id"], row)
+        logger.info(f"Fetched {kind} page {page_number}, {len(rows)} rows so far")
+        page_number += 1
+
+    return list(rows.values())[:max_rows]
+
+
+async def build_catalog_snapshot(kind: str, max_rows: int, directory: str | None = None) -> str:
+    """Fetch a catalog from the upstream API and write it as a snapshot.
+
+    Args:
+        kind: Catalog kind, one of CATALOG_SCHEMAS
+        max_rows: Maximum number of rows to include
+        directory: Output directory, defaults to settings.catalog_dir
+
+    Returns:
+        Path of the written snapshot file
+
+    """
+    rows = await fetch_catalog_rows(kind, max_rows)
+    path = get_snapshot_path(kind, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_snapshot(path, kind, CATALOG_SCHEMAS[kind], rows, search_fields=CATALOG_SEARCH_FIELDS)
+    logger.info(f"Wrote {kind} snapshot with {len(rows)} rows to {path}")
+    return path
@@ -0,0 +1,394 @@
+"""Memory-mapped catalog snapshot files.
+
+A snapshot is a versioned, read-only binary file holding one catalog (for example all models)
+in a columnar layout:
+
+    header | column directory | column sections (8-byte aligned)
+
+Numeric columns are stored as fixed-width little-endian arrays. String columns are stored as
+an offsets array (``row_count + 1`` unsigned 64-bit integers) plus a UTF-8 string heap.
+
+Snapshots are opened with ``mmap`` in read-only mode, so columns are exposed as zero-copy
+``memoryview`` objects and every process on a host that opens the same file shares a single
+physical copy through the page cache.
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+SNAPSHOT_MAGIC = b"MSCATLOG"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".mscat"
+
+# magic, version, flags, column_count, row_count, created_at, kind
+_HEADER = struct.Struct("<8sHHIQd16s")
+# name, type, data_offset, data_length, heap_offset, heap_length
+_COLUMN_ENTRY = struct.Struct("<32sB7xQQQQ")
+_ALIGNMENT = 8
+
+# Name of the derived column used for case-insensitive keyword search
+SEARCH_COLUMN = "_search_text"
+
+
+class ColumnType(IntEnum):
+    """Physical column types supported by the snapshot format."""
+
+    INT64 = 1
+    BOOL = 2
+    STRING = 3
+
+
+class ColumnSpec(NamedTuple):
+    """Column definition used when writing a snapshot."""
+
+    name: str
+    type: ColumnType
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a snapshot file is malformed or has an unsupported version."""
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+def _encode_column(spec: ColumnSpec, rows: Sequence[Mapping[str, Any]]) -> tuple[bytes, bytes]:
+    """Encode one column into its (data, heap) byte sections."""
+    if spec.type == ColumnType.INT64:
+        return array("q", (int(row.get(spec.name) or 0) for row in rows)).tobytes(), b""
+
+    if spec.type == ColumnType.BOOL:
+        return bytes(1 if row.get(spec.name) else 0 for row in rows), b""
+
+    heap = bytearray()
+    offsets = array("Q", [0])
+    for row in rows:
+        value = row.get(spec.name)
+        if value:
+            heap += str(value).encode("utf-8")
+        offsets.append(len(heap))
+    return offsets.tobytes(), bytes(heap)
+
+
+def _search_text(row: Mapping[str, Any], search_fields: Sequence[str]) -> str:
+    return "\n".join(str(row.get(field) or "") for field in search_fields).casefold()
+
+
+def write_snapshot(
+    path: str | os.PathLike[str],
+    kind: str,
+    schema: Sequence[ColumnSpec],
+    rows: Sequence[Mapping[str, Any]],
+    search_fields: Sequence[str] = (),
+    created_at: float | None = None,
+) -> None:
+    """Write rows to a snapshot file.
+
+    The file is written to a temporary path and atomically renamed into place, so processes
+    that already have the previous snapshot mapped keep reading a consistent copy.
+
+    Args:
+        path: Destination file path
+        kind: Catalog kind stored in the header, for example 'models'
+        schema: Column definitions, in file order
+        rows: Row dictionaries keyed by column name
+        search_fields: String columns combined into the case-insensitive search column
+        created_at: Snapshot creation time (unix timestamp), defaults to now
+
+    """
+    if sys.byteorder != "little":
+        raise SnapshotFormatError("Snapshots can only be written on little-endian hosts")
+
+    kind_bytes = kind.encode("utf-8")
+    if len(kind_bytes) > 16:
+        raise ValueError(f"Catalog kind is too long: {kind}")
+
+    columns = list(schema)
+    rows = list(rows)
+    if search_fields:
+        rows = [{**row, SEARCH_COLUMN: _search_text(row, search_fields)} for row in rows]
+        columns.append(ColumnSpec(SEARCH_COLUMN, ColumnType.STRING))
+
+    for spec in columns:
+        if len(spec.name.encode("utf-8")) > 32:
+            raise ValueError(f"Column name is too long: {spec.name}")
+
+    sections = [_encode_column(spec, rows) for spec in columns]
+
+    # Lay out the column sections after the header and directory
+    offset = _HEADER.size + _COLUMN_ENTRY.size * len(columns)
+    offset += _padding(offset)
+    entries = []
+    for spec, (data, heap) in zip(columns, sections, strict=True):
+        data_offset = offset
+        offset += len(data) + _padding(len(data))
+        heap_offset = offset
+        offset += len(heap) + _padding(len(heap))
+        entries.append(
+            _COLUMN_ENTRY.pack(spec.name.encode("utf-8"), spec.type, data_offset, len(data), heap_offset, len(heap))
+        )
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        0,
+        len(columns),
+        len(rows),
+        time.time() if created_at is None else created_at,
+        kind_bytes,
+    )
+
+    directory = os.path.dirname(os.fspath(path)) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", suffix=SNAPSHOT_SUFFIX, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for entry in entries:
+                f.write(entry)
+            f.write(b"\0" * _padding(f.tell()))
+            for data, heap in sections:
+                f.write(data)
+                f.write(b"\0" * _padding(len(data)))
+                f.write(heap)
+                f.write(b"\0" * _padding(len(heap)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class StringColumn(Sequence[str]):
+    """Zero-copy view of a string column: offsets array plus UTF-8 heap."""
+
+    def __init__(self, buffer: mmap.mmap, offsets: memoryview, heap_offset: int, heap_length: int) -> None:
+        """Initialize the column view.
+
+        Args:
+            buffer: The snapshot memory map
+            offsets: Row offsets into the heap (``row_count + 1`` entries)
+            heap_offset: Absolute position of the heap in the snapshot
+            heap_length: Heap size in bytes
+
+        """
+        self._buffer = buffer
+        self._offsets = offsets
+        self._heap_offset = heap_offset
+        self._heap_length = heap_length
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):  # type: ignore[override]
+        """Decode the string stored at the given row."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        start = self._heap_offset + self._offsets[index]
+        end = self._heap_offset + self._offsets[index + 1]
+        return self._buffer[start:end].decode("utf-8")
+
+    def find_rows(self, needle: str) -> list[int]:
+        """Return the indexes of rows whose value contains the given substring.
+
+        Scans the heap directly in the memory map, without decoding non-matching rows.
+        """
+        if not needle:
+            return list(range(len(self)))
+
+        pattern = needle.encode("utf-8")
+        heap_start = self._heap_offset
+        heap_end = heap_start + self._heap_length
+        rows = []
+        position = self._buffer.find(pattern, heap_start, heap_end)
+        while position != -1:
+            row = bisect_right(self._offsets, position - heap_start) - 1
+            # Only count the match if it lies entirely within this row's value
+            if position + len(pattern) - heap_start <= self._offsets[row + 1]:
+                rows.append(row)
+                position = heap_start + self._offsets[row + 1]
+            else:
+                position += 1
+            position = self._buffer.find(pattern, position, heap_end)
+        return rows
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped catalog snapshot."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open and map a snapshot file.
+
+        Args:
+            path: Snapshot file path
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < _HEADER.size:
+                raise SnapshotFormatError(f"Snapshot file is truncated: {self.path}")
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.file_id = (stat.st_ino, stat.st_mtime_ns)
+
+        try:
+            self._load()
+        except BaseException:
+            self._buffer.close()
+            raise
+
+    def _load(self) -> None:
+        magic, version, _flags, column_count, row_count, created_at, kind = _HEADER.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotFormatError(f"Not a catalog snapshot: {self.path}")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotFormatError(f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+        if sys.byteorder != "little":
+            raise SnapshotFormatError("Snapshots can only be read on little-endian hosts")
+
+        self.kind: str = kind.rstrip(b"\0").decode("utf-8")
+        self.row_count: int = row_count
+        self.created_at: float = created_at
+
+        view = memoryview(self._buffer)
+        self._views = [view]
+        self._columns: dict[str, memoryview | StringColumn] = {}
+        self._types: dict[str, ColumnType] = {}
+        for index in range(column_count):
+            raw_name, raw_type, data_offset, data_length, heap_offset, heap_length = _COLUMN_ENTRY.unpack_from(
+                self._buffer, _HEADER.size + index * _COLUMN_ENTRY.size
+            )
+            name = raw_name.rstrip(b"\0").decode("utf-8")
+            column_type = ColumnType(raw_type)
+            if max(data_offset + data_length, heap_offset + heap_length) > len(self._buffer):
+                raise SnapshotFormatError(f"Column '{name}' points outside of the snapshot file")
+
+            data = view[data_offset : data_offset + data_length]
+            if column_type == ColumnType.INT64:
+                column: memoryview | StringColumn = data.cast("q")
+            elif column_type == ColumnType.BOOL:
+                column = data.cast("B")
+            else:
+                column = StringColumn(self._buffer, data.cast("Q"), heap_offset, heap_length)
+            self._views.append(data)
+            if isinstance(column, memoryview):
+                self._views.append(column)
+            else:
+                self._views.append(column._offsets)
+
+            self._columns[name] = column
+            self._types[name] = column_type
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the public (non-derived) columns, in file order."""
+        return [name for name in self._columns if name != SEARCH_COLUMN]
+
+    def column_type(self, name: str) -> ColumnType:
+        """Return the physical type of a column."""
+        return self._types[name]
+
+    def column(self, name: str) -> memoryview | StringColumn:
+        """Return a zero-copy view of a column.
+
+        Numeric columns are returned as ``memoryview`` objects (format ``q`` or ``B``), which can
+        be wrapped without copying, for example by ``numpy.frombuffer``.
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown column '{name}' in {self.kind} snapshot") from None
+
+    def row(self, index: int, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        """Materialize a single row as a dictionary."""
+        result: dict[str, Any] = {}
+        for name in fields if fields is not None else self.column_names:
+            value = self._columns[name][index]
+            result[name] = bool(value) if self._types[name] == ColumnType.BOOL else value
+        return result
+
+    def search(
+        self,
+        query: str = "",
+        where: Mapping[str, Any] | None = None,
+        contains: Mapping[str, str] | None = None,
+        sort_by: str | None = None,
+        limit: int = 10,
+    ) -> tuple[int, list[int]]:
+        """Find matching rows.
+
+        Args:
+            query: Case-insensitive keyword matched against the search column
+            where: Exact-match filters on column values
+            contains: Substring filters on string columns
+            sort_by: Numeric column to sort by (descending); file order if omitted
+            limit: Maximum number of row indexes to return
+
+        Returns:
+            Tuple of (total number of matches, matching row indexes)
+
+        """
+        if query and SEARCH_COLUMN in self._columns:
+            search_column = self._columns[SEARCH_COLUMN]
+            assert isinstance(search_column, StringColumn)
+            candidates: Iterable[int] = search_column.find_rows(query.casefold())
+        else:
+            candidates = range(self.row_count)
+
+        for name, expected in (where or {}).items():
+            column = self.column(name)
+            if self._types[name] == ColumnType.BOOL:
+                expected = 1 if expected else 0
+            candidates = [i for i in candidates if column[i] == expected]
+
+        for name, needle in (contains or {}).items():
+            column = self.column(name)
+            if not isinstance(column, StringColumn):
+                raise ValueError(f"Column '{name}' is not a string column")
+            matches = set(column.find_rows(needle))
+            candidates = [i for i in candidates if i in matches]
+
+        candidates = list(candidates)
+        if sort_by is None:
+            return len(candidates), candidates[:limit]
+
+        sort_column = self.column(sort_by)
+        if isinstance(sort_column, StringColumn):
+            raise ValueError(f"Column '{sort_by}' is not a numeric column")
+        return len(candidates), heapq.nlargest(limit, candidates, key=sort_column.__getitem__)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._columns = {}
+        self._buffer.close()
+
+    def __enter__(self) -> CatalogSnapshot:
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the snapshot on context exit."""
+        self.close()
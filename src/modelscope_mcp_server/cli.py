@@ -1,10 +1,13 @@
 """Command line interface for ModelScope MCP Server."""
 
 import argparse
+import os
 import sys
 
 from .server import create_mcp_server
+from .settings import settings
 from .utils.metadata import get_server_name, get_server_name_with_version, get_server_version
+from .workers import run_http
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -19,6 +22,8 @@ Examples:
   %(prog)s --transport sse         # Run with SSE transport on port 8000 (default)
   %(prog)s --transport sse --port 8080    # Run with SSE transport on port 8080
   %(prog)s --transport http --port 3000   # Run with streamable HTTP transport on port 3000
+  %(prog)s --transport http --workers 4   # Run 4 worker processes sharing port 8000
+  %(prog)s --transport http --stateless   # Run streamable HTTP without session state
         """,
     )
 
@@ -36,6 +41,19 @@ Examples:
         help="Port number for SSE/HTTP transport (default: 8000)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for SSE/HTTP transport (default: 1)",
+    )
+
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        help="Keep no session state between HTTP requests, for replicas behind a load balancer",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -49,6 +67,12 @@ def validate_args(args: argparse.Namespace) -> None:
     """Validate parsed arguments."""
     if args.transport != "stdio" and args.port <= 0:
         raise ValueError("Port must be a positive integer for SSE/HTTP transport")
+    if args.workers < 1:
+        raise ValueError("Workers must be a positive integer")
+    if args.transport == "stdio" and args.workers > 1:
+        raise ValueError("Multiple workers require SSE/HTTP transport")
+    if args.stateless and args.transport != "http":
+        raise ValueError("Stateless mode requires HTTP transport")
 
 
 def main() -> None:
@@ -61,6 +85,20 @@ def main() -> None:
     except ValueError as e:
         parser.error(str(e))
 
+    if args.stateless:
+        settings.stateless_http = True
+        # Worker processes read their settings from the environment
+        os.environ["MODELSCOPE_STATELESS_HTTP"] = "true"
+
+    if args.transport != "stdio":
+        # uvicorn creates the server in each worker process and handles shutdown signals
+        try:
+            run_http(args.transport, port=args.port, workers=args.workers)
+        except Exception as e:
+            print(f"Error starting server: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     # Create and configure the MCP server
     try:
         mcp = create_mcp_server()
@@ -69,17 +107,10 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        if args.transport == "stdio":
-            mcp.run(
-                transport=args.transport,
-                show_banner=False,
-            )
-        else:
-            mcp.run(
-                transport=args.transport,
-                port=args.port,
-                show_banner=False,
-            )
+        mcp.run(
+            transport=args.transport,
+            show_banner=False,
+        )
     except KeyboardInterrupt:
         print(f"\nShutting down {get_server_name()}...", file=sys.stderr)
         sys.exit(0)
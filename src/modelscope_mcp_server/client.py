@@ -3,8 +3,13 @@
 import asyncio
 import json
 import logging as std_logging
+import threading
 import time
 import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
@@ -13,25 +18,95 @@ from fastmcp.utilities import logging
 from modelscope_mcp_server.utils.metadata import get_server_version
 from modelscope_mcp_server.utils.text import truncate_for_log
 
+from .cache import CachePolicy, make_cache_key, response_cache
+from .pool import KeepaliveTuner, MeteredTransport
 from .settings import settings
+from .tenant import get_tenant_id, get_tenant_token
 
 logger = logging.get_logger(__name__)
 
 LOG_BODY_MAX_CHARS = 1024
 REQUEST_ID_HEADER = "X-Request-ID"
 
+# Business error codes reporting a missing resource
+NOT_FOUND_ERROR_CODES = frozenset({"NOT_FOUND", "MCP_SERVER_NOT_FOUND"})
+
+
+class ModelScopeAPIError(RuntimeError):
+    """Business error reported by the API with success=false."""
+
+    def __init__(self, message: str, code: Any = "UNKNOWN", status_code: int = 200) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            code: API error code
+            status_code: HTTP status code of the response
+
+        """
+        super().__init__(message)
+        self.code = code
+        self.status_code = status_code
+
+    @property
+    def not_found(self) -> bool:
+        """Whether the error reports a missing resource, by HTTP status or error code."""
+        return self.status_code in (404, 410) or str(self.code).upper() in NOT_FOUND_ERROR_CODES
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of warming up the connections to an upstream domain."""
+
+    domain: str
+    probes: int
+    # New connections opened; probes multiplexed over an open HTTP/2 connection open none
+    connections: int = 0
+    failures: int = 0
+    connect_seconds: list[float] = field(default_factory=list)
+    tls_seconds: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        """Summarize the report for the log."""
+
+        def mean(values: list[float]) -> str:
+            return f"{sum(values) / len(values):.3f}s" if values else "n/a"
+
+        return (
+            f"{self.domain}: {self.connections} connections opened by {self.probes} probes "
+            f"in {self.elapsed:.3f}s (TCP connect {mean(self.connect_seconds)}, "
+            f"TLS handshake {mean(self.tls_seconds)}), {self.failures} failed"
+        )
+
+
+@dataclass
+class LoopPool:
+    """Connection pool of an event loop, with the clients sending requests over it."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    client: httpx.AsyncClient | None = None
+    transport: MeteredTransport | None = None
+    # Clients of callers' own tokens by tenant, with their last use, least recently used first
+    tenant_clients: OrderedDict[str, tuple[httpx.AsyncClient, float]] = field(default_factory=OrderedDict)
+    # Async generator closing the pool when it is closed, see ModelScopeClient._close_at_loop_shutdown
+    closer: AsyncGenerator[None, None] | None = None
+
 
 class ModelScopeClient:
     """High-performance HTTP client with connection pooling.
 
     This client maintains a global connection pool that is shared across all requests,
     providing optimal performance for both single-user and high-concurrency scenarios.
+    Connections belong to the event loop that opened them, so each running loop has a pool
+    of its own, closed when the loop shuts down; threads can run loops in parallel.
+    Requests of callers passing their own token (see tenant) go through a client of that token
+    on the same pool, which keeps the token's headers and cookies apart from other callers'.
     """
 
-    # Class-level shared resources
-    _global_client: httpx.AsyncClient | None = None
-    _initialization_lock = asyncio.Lock()
-    _shutdown_event = asyncio.Event()
+    # Class-level shared resources: the pools of the event loops, dropped with their loop
+    _pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopPool] = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
 
     def __init__(self, timeout: int = settings.default_api_timeout_seconds) -> None:
         """Initialize the client configuration.
@@ -42,58 +117,139 @@ class ModelScopeClient:
         """
         self.timeout = timeout
 
+    @classmethod
+    def _get_loop_pool(cls) -> LoopPool:
+        """Return the pool of the running event loop, registering it on first use."""
+        loop = asyncio.get_running_loop()
+        with cls._registry_lock:
+            pool = cls._pools.get(loop)
+            if pool is None:
+                # A pool references its loop, so the entries of loops closed without shutting
+                # down their async generators are only dropped here
+                for closed_loop in [other for other in cls._pools if other.is_closed()]:
+                    del cls._pools[closed_loop]
+                pool = cls._pools[loop] = LoopPool()
+        return pool
+
     @classmethod
     async def _ensure_global_client(cls) -> httpx.AsyncClient:
-        """Ensure the global client pool exists and is healthy.
+        """Ensure the connection pool of the running event loop exists and is healthy.
 
-        Uses double-checked locking pattern for thread-safe initialization.
+        Uses double-checked locking pattern for safe initialization within the loop.
         """
-        if cls._global_client is None or cls._global_client.is_closed:
-            async with cls._initialization_lock:
+        pool = cls._get_loop_pool()
+        if pool.client is None or pool.client.is_closed:
+            async with pool.lock:
                 # Double-check after acquiring lock
-                if cls._global_client is None or cls._global_client.is_closed:
+                if pool.client is None or pool.client.is_closed:
                     logger.info("Initializing global connection pool")
 
-                    event_hooks = {
-                        "request": [cls._log_request],
-                        "response": [cls._log_response, cls._raise_on_error],
-                    }
-
-                    default_headers = {
-                        "User-Agent": f"modelscope-mcp-server/{get_server_version()}",
-                    }
-
-                    if settings.is_api_token_configured():
-                        default_headers["Authorization"] = f"Bearer {settings.api_token}"
-                        # TODO: Remove this once all API endpoints support Bearer token
-                        default_headers["Cookie"] = f"m_session_id={settings.api_token}"
-
-                    cls._global_client = httpx.AsyncClient(
-                        limits=httpx.Limits(
-                            max_keepalive_connections=100,  # Keep 100 persistent connections
-                            max_connections=200,  # Allow up to 200 concurrent connections
-                            keepalive_expiry=30,  # Keep connections alive for 30 seconds
-                        ),
-                        timeout=httpx.Timeout(
-                            connect=5.0,  # Connection timeout
-                            read=30.0,  # Read timeout
-                            write=30.0,  # Write timeout
-                            pool=5.0,  # Pool acquisition timeout
-                        ),
-                        # Enable HTTP/2 for multiplexing
-                        http2=True,
-                        headers=default_headers,
-                        event_hooks=event_hooks,
-                        follow_redirects=True,
-                        # Don't use system proxy settings
-                        trust_env=False,
+                    limits = httpx.Limits(
+                        max_keepalive_connections=settings.http_max_keepalive_connections,
+                        max_connections=settings.http_max_connections,
+                        keepalive_expiry=settings.http_keepalive_expiry_seconds,
                     )
+                    tuner = None
+                    if settings.pool_adaptive_enabled:
+                        tuner = KeepaliveTuner(
+                            min_keepalive=settings.pool_adaptive_min_keepalive,
+                            max_keepalive=settings.http_max_connections,
+                            interval=settings.pool_adaptive_interval_seconds,
+                            wait_target=settings.pool_adaptive_wait_target_seconds,
+                        )
+                    # Enable HTTP/2 for multiplexing, and don't use system proxy settings
+                    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, trust_env=False)
+
+                    pool.transport = MeteredTransport(transport, limits, tuner)
+                    pool.client = cls._create_client(pool.transport, settings.api_token)
+                    pool.tenant_clients.clear()
+                    pool.closer = cls._close_at_loop_shutdown(pool)
+                    await anext(pool.closer)
 
                     logger.info(
-                        f"Global connection pool initialized: max_keepalive={100}, max_connections={200}, http2=True"
+                        f"Global connection pool initialized: max_keepalive={limits.max_keepalive_connections}, "
+                        f"max_connections={limits.max_connections}, http2=True, adaptive={tuner is not None}"
                     )
 
-        return cls._global_client
+        return pool.client
+
+    @staticmethod
+    async def _close_at_loop_shutdown(pool: LoopPool) -> AsyncGenerator[None, None]:
+        """Close a pool when this generator is closed.
+
+        The event loop tracks the async generators started in it and closes them when it
+        shuts down, as asyncio.run does before closing the loop, so the pool is closed
+        with its loop even if close_global_pool is never called.
+        """
+        try:
+            yield
+        finally:
+            pool.closer = None
+            if pool.client is not None and not pool.client.is_closed:
+                logger.info("Closing global connection pool")
+                await pool.client.aclose()
+            pool.client = None
+            pool.transport = None
+            pool.tenant_clients.clear()
+
+    @classmethod
+    def _create_client(cls, transport: httpx.AsyncBaseTransport, token: str | None) -> httpx.AsyncClient:
+        """Create a client sending requests authenticated with `token` over a pool's transport."""
+        event_hooks = {
+            "request": [cls._log_request],
+            "response": [cls._log_response, cls._raise_on_error],
+        }
+
+        default_headers = {
+            "User-Agent": f"modelscope-mcp-server/{get_server_version()}",
+        }
+
+        if token:
+            default_headers["Authorization"] = f"Bearer {token}"
+            # TODO: Remove this once all API endpoints support Bearer token
+            default_headers["Cookie"] = f"m_session_id={token}"
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                connect=settings.http_connect_timeout_seconds,
+                read=settings.http_read_timeout_seconds,
+                write=settings.http_write_timeout_seconds,
+                pool=settings.http_pool_timeout_seconds,
+            ),
+            headers=default_headers,
+            event_hooks=event_hooks,
+            follow_redirects=True,
+            trust_env=False,
+        )
+
+    @classmethod
+    async def _get_http_client(cls) -> httpx.AsyncClient:
+        """Return the client of the caller's token, the global client if the caller passed none."""
+        client = await cls._ensure_global_client()
+        tenant = get_tenant_id()
+        if tenant is None:
+            return client
+
+        pool = cls._get_loop_pool()
+        # Set up with the global client above
+        assert pool.transport is not None
+        now = time.monotonic()
+        entry = pool.tenant_clients.pop(tenant, None)
+        # Evict idle clients and the least recently used beyond the limit; evicted clients need
+        # no closing, as their connections belong to the shared pool
+        while pool.tenant_clients:
+            _, last_used = next(iter(pool.tenant_clients.values()))
+            if (
+                now - last_used < settings.tenant_idle_seconds
+                and len(pool.tenant_clients) < settings.tenant_max_clients
+            ):
+                break
+            pool.tenant_clients.popitem(last=False)
+
+        tenant_client = entry[0] if entry else cls._create_client(pool.transport, get_tenant_token())
+        pool.tenant_clients[tenant] = (tenant_client, now)
+        return tenant_client
 
     @staticmethod
     async def _log_request(request: httpx.Request) -> None:
@@ -186,14 +342,90 @@ class ModelScopeClient:
                             response=response,
                         )
                     else:
-                        raise RuntimeError(f"[status={status}] API error [{error_code}]: {error_msg}")
+                        raise ModelScopeAPIError(
+                            f"[status={status}] API error [{error_code}]: {error_msg}", error_code, status
+                        )
         except json.JSONDecodeError:
             pass
 
         response.raise_for_status()
 
+    async def _request(self, method: str, url: str, timeout: int | None = None, **kwargs) -> dict[str, Any]:
+        """Perform a request using the global connection pool and parse the JSON response."""
+        client = await self._get_http_client()
+        # The request's timeout bounds reading the response, the other phases use the pool's timeouts
+        request_timeout = httpx.Timeout(
+            connect=client.timeout.connect,
+            read=timeout or self.timeout,
+            write=client.timeout.write,
+            pool=client.timeout.pool,
+        )
+
+        try:
+            response = await client.request(method, url, timeout=request_timeout, **kwargs)
+            return response.json()
+        except httpx.TimeoutException as e:
+            raise TimeoutError("Request timeout - please try again later") from e
+
+    async def _send(
+        self, method: str, url: str, cache: CachePolicy | None, timeout: int | None = None, **kwargs
+    ) -> dict[str, Any]:
+        """Perform a request, serving it from the response cache if a cache policy is given."""
+        if cache is None or not settings.cache_enabled:
+            return await self._request(method, url, timeout, **kwargs)
+
+        return await response_cache.get_or_fetch(
+            self._cache_key(method, url, kwargs, cache),
+            lambda: self._request(method, url, timeout, **kwargs),
+            cache,
+        )
+
+    @staticmethod
+    def _cache_key(method: str, url: str, kwargs: dict[str, Any], cache: CachePolicy) -> str:
+        parts = [kwargs.get("params"), kwargs.get("json"), kwargs.get("headers")]
+        tenant = get_tenant_id() if cache.per_tenant else None
+        if tenant is not None:
+            parts.append({"tenant": tenant})
+        return make_cache_key(method, url, *parts)
+
+    def prefetch(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        cache: CachePolicy | None = None,
+        **kwargs,
+    ) -> bool:
+        """Warm the response cache for a likely follow-up GET request in the background.
+
+        Does nothing unless prefetching and caching are enabled in settings.
+
+        Args:
+            url: The URL to request
+            params: Query parameters
+            cache: Cache policy the follow-up request will use
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            True if a prefetch was started
+
+        """
+        if cache is None or not settings.cache_enabled or not settings.prefetch_enabled:
+            return False
+
+        kwargs["params"] = params
+        return response_cache.prefetch(
+            self._cache_key("GET", url, kwargs, cache),
+            lambda: self._request("GET", url, None, **kwargs),
+            cache,
+        )
+
     async def get(
-        self, url: str, params: dict[str, Any] | None = None, timeout: int | None = None, **kwargs
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        timeout: int | None = None,
+        cache: CachePolicy | None = None,
+        **kwargs,
     ) -> dict[str, Any]:
         """Perform GET request using the global connection pool.
 
@@ -201,6 +433,7 @@ class ModelScopeClient:
             url: The URL to request
             params: Query parameters
             timeout: Request timeout in seconds (overrides default)
+            cache: Cache policy for read-only requests, None to bypass the response cache
             **kwargs: Additional arguments passed to httpx
 
         Returns:
@@ -208,17 +441,11 @@ class ModelScopeClient:
 
         Raises:
             TimeoutError: If request times out
-            RuntimeError: For API errors
+            ModelScopeAPIError: For API errors
             httpx.HTTPStatusError: For HTTP errors
 
         """
-        client = await self._ensure_global_client()
-
-        try:
-            response = await client.get(url, params=params, timeout=timeout or self.timeout, **kwargs)
-            return response.json()
-        except httpx.TimeoutException as e:
-            raise TimeoutError("Request timeout - please try again later") from e
+        return await self._send("GET", url, cache, timeout, params=params, **kwargs)
 
     async def post(
         self,
@@ -228,36 +455,91 @@ class ModelScopeClient:
         **kwargs,
     ) -> dict[str, Any]:
         """Perform POST request using the global connection pool."""
-        client = await self._ensure_global_client()
-
-        try:
-            response = await client.post(url, json=json_data, timeout=timeout or self.timeout, **kwargs)
-            return response.json()
-        except httpx.TimeoutException as e:
-            raise TimeoutError("Request timeout - please try again later") from e
+        return await self._send("POST", url, None, timeout, json=json_data, **kwargs)
 
     async def put(
-        self, url: str, json_data: dict[str, Any] | None = None, timeout: int | None = None, **kwargs
+        self,
+        url: str,
+        json_data: dict[str, Any] | None = None,
+        timeout: int | None = None,
+        cache: CachePolicy | None = None,
+        **kwargs,
     ) -> dict[str, Any]:
-        """Perform PUT request using the global connection pool."""
-        client = await self._ensure_global_client()
+        """Perform PUT request using the global connection pool.
 
-        try:
-            response = await client.put(url, json=json_data, timeout=timeout or self.timeout, **kwargs)
-            return response.json()
-        except httpx.TimeoutException as e:
-            raise TimeoutError("Request timeout - please try again later") from e
+        Some read-only search endpoints use PUT, so a cache policy can be given as for GET.
+        """
+        return await self._send("PUT", url, cache, timeout, json=json_data, **kwargs)
+
+    @classmethod
+    async def warm_up(cls, connections: int, timeout: float) -> list[WarmupReport]:
+        """Open connections to the upstream domains before the first tool calls need them.
+
+        Sends `connections` concurrent HEAD probes to the root of each domain and times the TCP
+        connect and TLS handshake of the connections they open. Over HTTP/2 the probes to a
+        domain share one multiplexed connection.
+
+        Args:
+            connections: Number of probes sent to each domain
+            timeout: Timeout of each probe in seconds
+
+        Returns:
+            A report per domain
+
+        """
+        client = await cls._ensure_global_client()
+        domains = [settings.main_domain, settings.api_inference_domain]
+        reports = await asyncio.gather(
+            *(cls._warm_up_domain(client, domain, connections, timeout) for domain in domains)
+        )
+        for report in reports:
+            log = logger.warning if report.failures else logger.info
+            log(f"Warmed up connections to {report}")
+        return list(reports)
+
+    @staticmethod
+    async def _warm_up_domain(client: httpx.AsyncClient, domain: str, probes: int, timeout: float) -> WarmupReport:
+        report = WarmupReport(domain=domain, probes=probes)
+        started_at = time.monotonic()
+
+        async def probe() -> None:
+            phase_starts: dict[str, float] = {}
+
+            async def trace(event: str, info: dict[str, Any]) -> None:
+                phase, _, stage = event.rpartition(".")
+                if stage == "started":
+                    phase_starts[phase] = time.monotonic()
+                elif stage == "complete" and phase in phase_starts:
+                    duration = time.monotonic() - phase_starts[phase]
+                    if phase == "connection.connect_tcp":
+                        report.connections += 1
+                        report.connect_seconds.append(duration)
+                    elif phase == "connection.start_tls":
+                        report.tls_seconds.append(duration)
+
+            try:
+                await client.head(domain, timeout=timeout, follow_redirects=False, extensions={"trace": trace})
+            except httpx.HTTPStatusError:
+                # Any answer means the connection is up
+                pass
+            except httpx.HTTPError as e:
+                report.failures += 1
+                logger.debug(f"Warm-up probe to {domain} failed: {e!r}")
+
+        await asyncio.gather(*(probe() for _ in range(probes)))
+        report.elapsed = time.monotonic() - started_at
+        return report
 
     @classmethod
     async def close_global_pool(cls) -> None:
-        """Close the global connection pool gracefully.
+        """Close the connection pool of the running event loop gracefully.
 
-        Should be called during application shutdown.
+        Should be called during application shutdown. Pools of event loops shut down without
+        calling it are closed with their loop.
         """
-        if cls._global_client and not cls._global_client.is_closed:
-            logger.info("Closing global connection pool")
-            await cls._global_client.aclose()
-            cls._global_client = None
+        pool = cls._get_loop_pool()
+        if pool.closer is not None:
+            await pool.closer.aclose()
 
 
 def get_client() -> ModelScopeClient:
@@ -17,3 +17,108 @@ DEFAULT_TASK_POLL_INTERVAL_SECONDS = 5
 
 # Maximum number of polling attempts for async tasks
 DEFAULT_MAX_POLL_ATTEMPTS = 60  # 60 attempts * 5 seconds = 5 minutes max
+
+# Maximum number of concurrent upstream requests per batch tool call
+DEFAULT_BATCH_MAX_CONCURRENCY = 8
+
+# README bytes returned by MCP server detail tools, the rest is fetched by section or byte range
+DEFAULT_README_PREVIEW_BYTES = 2048
+DEFAULT_README_CHUNK_BYTES = 8192
+
+# Request rate limits (tokens per second / bucket capacity), see middleware.rate_limit
+DEFAULT_RATE_LIMIT_GLOBAL_RATE = 10.0
+DEFAULT_RATE_LIMIT_GLOBAL_BURST = 20.0
+DEFAULT_RATE_LIMIT_SESSION_RATE = 5.0
+DEFAULT_RATE_LIMIT_SESSION_BURST = 20.0
+
+# Tokens per call of tools that do not cost 1
+DEFAULT_RATE_LIMIT_TOOL_COSTS = {
+    "generate_image": 5.0,
+    "get_environment_info": 0.2,
+}
+
+# Admission control of tool calls, see middleware.admission
+DEFAULT_ADMISSION_INITIAL_LIMIT = 32
+DEFAULT_ADMISSION_MIN_LIMIT = 4
+DEFAULT_ADMISSION_MAX_LIMIT = 256
+DEFAULT_ADMISSION_LATENCY_TARGET_SECONDS = 3.0
+DEFAULT_ADMISSION_MAX_QUEUE = 64
+DEFAULT_ADMISSION_MAX_QUEUE_WAIT_SECONDS = 1.0
+
+# Fan-out and batch tools, shed first under overload
+DEFAULT_ADMISSION_LOW_PRIORITY_TOOLS = ["search_all", "get_mcp_server_details"]
+
+# Tools served locally, or long-running with their own polling timeout
+DEFAULT_ADMISSION_EXEMPT_TOOLS = [
+    "generate_image",
+    "get_environment_info",
+    "get_leaderboard",
+    "search_catalog",
+    "analyze_catalog",
+]
+
+# Memoization of read-only tool results, see middleware.memoize
+DEFAULT_MEMO_TTL_SECONDS = 30
+DEFAULT_MEMO_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MEMO_MAX_RESULT_BYTES = 1024 * 1024
+
+# TTLs of tools whose results change more or less often than search results, 0 disables;
+# local tools are cheap and must pick up refreshed catalog snapshots and leaderboards at once
+DEFAULT_MEMO_TOOL_TTLS = {
+    "get_current_user": 300,
+    "get_environment_info": 0,
+    "get_leaderboard": 0,
+    "search_catalog": 0,
+    "analyze_catalog": 0,
+}
+
+# Leaderboard views
+DEFAULT_LEADERBOARD_SIZE = 30
+DEFAULT_LEADERBOARD_MAX_AGE_SECONDS = 600
+
+# Unified cross-catalog search deadlines (seconds)
+DEFAULT_SEARCH_ALL_TIMEOUT_SECONDS = 4.0
+DEFAULT_SEARCH_ALL_SOURCE_TIMEOUT_SECONDS = 3.0
+
+# Client response cache (seconds / entries)
+DEFAULT_CACHE_SOFT_TTL_SECONDS = 60
+DEFAULT_CACHE_HARD_TTL_SECONDS = 600
+DEFAULT_CACHE_STALE_IF_ERROR_SECONDS = 3600
+DEFAULT_CACHE_MAX_ENTRIES = 2048
+DEFAULT_CACHE_DISK_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_BACKEND_TIMEOUT_SECONDS = 0.05
+DEFAULT_CACHE_NEGATIVE_TTL_SECONDS = 30
+DEFAULT_CACHE_NEGATIVE_MAX_ENTRIES = 1024
+
+# Speculative prefetching of follow-up requests
+DEFAULT_PREFETCH_MAX_CONCURRENCY = 2
+DEFAULT_PREFETCH_MCP_SERVER_DETAILS = 3
+
+# Worker processes of the HTTP transports (seconds), see workers
+DEFAULT_WORKER_HEALTHCHECK_TIMEOUT_SECONDS = 5
+
+# Upstream connection pool limits, keep-alive expiry and timeouts (seconds)
+DEFAULT_HTTP_MAX_CONNECTIONS = 200
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_HTTP_READ_TIMEOUT_SECONDS = 30.0
+DEFAULT_HTTP_WRITE_TIMEOUT_SECONDS = 30.0
+DEFAULT_HTTP_POOL_TIMEOUT_SECONDS = 5.0
+
+# Adaptive keep-alive sizing, see pool
+DEFAULT_POOL_ADAPTIVE_MIN_KEEPALIVE = 10
+DEFAULT_POOL_ADAPTIVE_INTERVAL_SECONDS = 10.0
+DEFAULT_POOL_ADAPTIVE_WAIT_TARGET_SECONDS = 0.05
+
+# Callers' own ModelScope tokens, see tenant
+DEFAULT_TENANT_TOKEN_HEADER = "X-ModelScope-Token"
+DEFAULT_TENANT_MAX_CLIENTS = 1024
+DEFAULT_TENANT_IDLE_SECONDS = 600
+
+# Upstream connections opened per domain at startup (0 disables) and probe timeout (seconds)
+DEFAULT_WARMUP_CONNECTIONS = 0
+DEFAULT_WARMUP_TIMEOUT_SECONDS = 5.0
+
+# Time in-flight tool calls get to finish on shutdown (seconds), see shutdown
+DEFAULT_SHUTDOWN_TIMEOUT_SECONDS = 10
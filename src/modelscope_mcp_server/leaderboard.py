@@ -0,0 +1,216 @@
+"""Precomputed leaderboard views for popular ranking queries.
+
+Frequent questions such as "most downloaded text-generation models" or "hottest papers" map to
+a small, fixed set of upstream queries. Each leaderboard view materializes one of them in memory
+together with the time it was refreshed. A background task keeps the views fresh, so matching
+tool calls are answered without a network round trip.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Generic
+
+from fastmcp.utilities import logging
+
+from .settings import settings
+from .utils.projection import ModelT
+
+logger = logging.get_logger(__name__)
+
+# Category used for views that are not filtered by task or domain
+ALL_CATEGORY = "all"
+
+STUDIO_DOMAINS = ["multi-modal", "cv", "nlp", "audio", "AutoML"]
+
+
+@dataclass
+class LeaderboardView(Generic[ModelT]):
+    """A materialized leaderboard."""
+
+    board: str
+    category: str
+    ranked_by: str
+    items: list[ModelT]
+    refreshed_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the view was refreshed."""
+        return time.time() - self.refreshed_at
+
+
+@dataclass
+class LeaderboardSpec:
+    """Definition of a leaderboard view and how to fetch it."""
+
+    board: str
+    category: str
+    ranked_by: str
+    fetch: Callable[[int], Awaitable[list]]
+
+    @property
+    def key(self) -> str:
+        """Unique view key."""
+        return f"{self.board}:{self.category}"
+
+
+def _default_specs() -> list[LeaderboardSpec]:
+    """Build the default set of leaderboard views."""
+    # Imported here since the search tools themselves serve from the leaderboard store
+    from .tools.dataset import fetch_datasets
+    from .tools.model import MODEL_TASK_MAPPING, fetch_models
+    from .tools.paper import fetch_papers
+    from .tools.studio import fetch_studios
+
+    specs = [
+        LeaderboardSpec(
+            "models", ALL_CATEGORY, "downloads", lambda size: fetch_models(sort="DownloadsCount", limit=size)
+        ),
+        LeaderboardSpec(
+            "datasets", ALL_CATEGORY, "downloads", lambda size: fetch_datasets(sort="downloads", limit=size)
+        ),
+        LeaderboardSpec("studios", ALL_CATEGORY, "visits", lambda size: fetch_studios(sort="VisitsCount", limit=size)),
+        LeaderboardSpec("papers", ALL_CATEGORY, "hot", lambda size: fetch_papers(query="", sort="hot", limit=size)),
+    ]
+
+    # Per task category model leaderboards
+    for task in MODEL_TASK_MAPPING:
+        specs.append(
+            LeaderboardSpec(
+                "models",
+                task,
+                "downloads",
+                lambda size, task=task: fetch_models(task=task, sort="DownloadsCount", limit=size),
+            )
+        )
+
+    # Per domain studio leaderboards
+    for domain in STUDIO_DOMAINS:
+        specs.append(
+            LeaderboardSpec(
+                "studios",
+                domain,
+                "visits",
+                lambda size, domain=domain: fetch_studios(domains=[domain], sort="VisitsCount", limit=size),
+            )
+        )
+
+    return specs
+
+
+@dataclass
+class LeaderboardStore:
+    """In-memory leaderboard views with a background refresher."""
+
+    specs: list[LeaderboardSpec] = field(default_factory=list)
+    # Views of all boards, each holding the result model of its board
+    views: dict[str, LeaderboardView[Any]] = field(default_factory=dict)
+    # On-demand refreshes in progress, shared by concurrent callers
+    _refreshing: dict[str, asyncio.Task[LeaderboardView[Any]]] = field(default_factory=dict)
+    _task: asyncio.Task | None = None
+
+    def get_specs(self) -> list[LeaderboardSpec]:
+        """Return the view definitions, using the default set if none were given."""
+        if not self.specs:
+            self.specs = _default_specs()
+        return self.specs
+
+    def _get_spec(self, board: str, category: str) -> LeaderboardSpec:
+        for spec in self.get_specs():
+            if spec.board == board and spec.category == category:
+                return spec
+        raise ValueError(f"Unknown leaderboard: {board} ({category})")
+
+    def lookup(self, board: str, category: str = ALL_CATEGORY, limit: int = 0) -> LeaderboardView[Any] | None:
+        """Return a view if it is fresh enough and holds at least `limit` items.
+
+        A view with fewer items than the leaderboard size already contains every upstream entry,
+        so it can serve any limit.
+        """
+        view = self.views.get(f"{board}:{category}")
+        if view is None or view.age_seconds > settings.leaderboard_max_age_seconds:
+            return None
+        if limit > len(view.items) and len(view.items) >= settings.leaderboard_size:
+            return None
+        return view
+
+    async def refresh(self, board: str, category: str = ALL_CATEGORY) -> LeaderboardView[Any]:
+        """Fetch a single view from upstream and store it."""
+        spec = self._get_spec(board, category)
+        items = await spec.fetch(settings.leaderboard_size)
+        view = LeaderboardView(
+            board=board, category=category, ranked_by=spec.ranked_by, items=items, refreshed_at=time.time()
+        )
+        self.views[spec.key] = view
+        return view
+
+    async def get(self, board: str, category: str = ALL_CATEGORY) -> LeaderboardView[Any]:
+        """Return a fresh view, refreshing it on demand if needed.
+
+        Concurrent callers of a missing or stale view share one refresh.
+        """
+        view = self.lookup(board, category)
+        if view is not None:
+            return view
+
+        key = f"{board}:{category}"
+        task = self._refreshing.get(key)
+        # A refresh of another event loop cannot be awaited here
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self.refresh(board, category))
+            self._refreshing[key] = task
+
+            def forget(done: asyncio.Task[LeaderboardView[Any]]) -> None:
+                if self._refreshing.get(key) is done:
+                    del self._refreshing[key]
+
+            task.add_done_callback(forget)
+        # Shield so that a cancelled caller does not cancel the refresh for the others
+        return await asyncio.shield(task)
+
+    async def refresh_all(self) -> None:
+        """Refresh all views concurrently, keeping the previous view if a refresh fails."""
+        start_time = time.perf_counter()
+        specs = self.get_specs()
+        results = await asyncio.gather(
+            *(self.refresh(spec.board, spec.category) for spec in specs),
+            return_exceptions=True,
+        )
+        for spec, result in zip(specs, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to refresh leaderboard {spec.key}: {result}")
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Refreshed {len(specs)} leaderboard views in {elapsed:.3f}s")
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as e:
+                logger.error(f"Leaderboard refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        """Start the background refresher if enabled in settings."""
+        interval = settings.leaderboard_refresh_interval_seconds
+        if interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        logger.info(f"Starting leaderboard refresher (interval: {interval}s, views: {len(self.get_specs())})")
+        self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Global leaderboard store
+leaderboards = LeaderboardStore()
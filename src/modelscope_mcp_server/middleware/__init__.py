@@ -0,0 +1,22 @@
+"""Request middleware for the ModelScope MCP Server."""
+
+from .admission import AdmissionController, AdmissionControlMiddleware, AIMDLimit, OverloadedError
+from .drain import DrainMiddleware, DrainReport, ShuttingDownError
+from .memoize import MemoizationMiddleware
+from .rate_limit import RateLimitExceededError, RateLimitMiddleware, TokenBucket
+from .tenant import TenantMiddleware
+
+__all__ = [
+    "AIMDLimit",
+    "AdmissionControlMiddleware",
+    "AdmissionController",
+    "DrainMiddleware",
+    "DrainReport",
+    "MemoizationMiddleware",
+    "OverloadedError",
+    "RateLimitExceededError",
+    "RateLimitMiddleware",
+    "ShuttingDownError",
+    "TenantMiddleware",
+    "TokenBucket",
+]
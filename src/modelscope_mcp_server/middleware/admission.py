@@ -0,0 +1,262 @@
+"""Admission control for tool calls that do upstream work.
+
+Tool calls are admitted while fewer than the concurrency limit are in flight; further calls
+wait in a short FIFO queue. The limit adapts with AIMD (additive increase, multiplicative
+decrease): it grows while calls complete quickly and the limit is in use, and shrinks when
+calls are slower than the latency target or fail with timeouts or overload responses. That
+keeps requests from piling up behind an exhausted connection pool.
+
+When the server is saturated, low-priority calls are shed at once and other calls are shed
+after the maximum queue wait, with a fast overload error carrying a retry hint rather than
+every caller running into upstream timeouts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.utilities import logging
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from ..settings import settings
+
+logger = logging.get_logger(__name__)
+
+# Upstream responses that signal overload
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Factor applied to the limit when an overload is detected
+BACKOFF_RATIO = 0.9
+
+# Weight of the latest call in the average latency
+LATENCY_SMOOTHING = 0.2
+
+
+class OverloadedError(McpError):
+    """Rejection of a tool call shed by admission control."""
+
+    def __init__(self, reason: str, tool: str, limit: int, in_flight: int, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            reason: Why the call was shed: "low_priority", "queue_full" or "queue_timeout"
+            tool: Name of the called tool
+            limit: Current concurrency limit
+            in_flight: Number of calls in flight
+            retry_after: Suggested seconds to wait before retrying
+
+        """
+        message = f"Server overloaded, tool '{tool}' was not run ({reason}), retry after {retry_after:.2f}s"
+        data = {
+            "reason": reason,
+            "tool": tool,
+            "limit": limit,
+            "in_flight": in_flight,
+            "retry_after_seconds": round(retry_after, 3),
+        }
+        super().__init__(ErrorData(code=-32000, message=message, data=data))
+        self.reason = reason
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error, or one of its causes, is an upstream timeout or overload response."""
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, asyncio.TimeoutError | TimeoutError | httpx.TimeoutException):
+            return True
+        if isinstance(current, httpx.HTTPStatusError) and current.response.status_code in OVERLOAD_STATUS_CODES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class AIMDLimit:
+    """Concurrency limit adapted with additive increase and multiplicative decrease."""
+
+    def __init__(self, initial: float, min_limit: float, max_limit: float, latency_target: float) -> None:
+        """Initialize the limit.
+
+        Args:
+            initial: Starting limit
+            min_limit: Lower bound of the limit
+            max_limit: Upper bound of the limit
+            latency_target: Calls slower than this many seconds count as overload
+
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self._limit = min(max(initial, min_limit), max_limit)
+
+    @property
+    def value(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def update(self, latency: float, in_flight: int, overloaded: bool) -> None:
+        """Adapt the limit to a completed call.
+
+        Args:
+            latency: Duration of the call in seconds
+            in_flight: Number of calls in flight when it completed, including itself
+            overloaded: Whether the call failed with a timeout or overload response
+
+        """
+        if overloaded or latency > self.latency_target:
+            self._limit = max(self.min_limit, self._limit * BACKOFF_RATIO)
+        elif in_flight * 2 >= self._limit:
+            # Only grow while the limit is in use, an idle server learns nothing about capacity
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+
+@dataclass
+class AdmissionStatistics:
+    """Counters of admission decisions."""
+
+    admitted: int = 0
+    queued: int = 0
+    shed: int = 0
+    total_queue_wait: float = 0.0
+
+
+class AdmissionController:
+    """Bounds the tool calls in flight, queueing or shedding the rest."""
+
+    def __init__(self, limit: AIMDLimit, max_queue: int, max_queue_wait: float) -> None:
+        """Initialize the controller.
+
+        Args:
+            limit: Adaptive concurrency limit
+            max_queue: Maximum number of waiting calls, further calls are shed
+            max_queue_wait: Seconds a call waits for a slot before it is shed
+
+        """
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.in_flight = 0
+        self.stats = AdmissionStatistics()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._average_latency = 0.0
+
+    def _retry_after(self) -> float:
+        # One average call should free a slot; fall back to the queue wait before any call completed
+        return self._average_latency or self.max_queue_wait
+
+    def _shed(self, reason: str, tool: str) -> OverloadedError:
+        self.stats.shed += 1
+        logger.warning(f"Shedding call to {tool} ({reason}): {self.in_flight} in flight, limit {self.limit.value}")
+        return OverloadedError(reason, tool, self.limit.value, self.in_flight, self._retry_after())
+
+    async def acquire(self, tool: str, low_priority: bool = False) -> float:
+        """Wait for a slot, returning the time waited, or raise OverloadedError.
+
+        Low-priority calls are never queued.
+        """
+        if self.in_flight < self.limit.value and not self._waiters:
+            self.in_flight += 1
+            self.stats.admitted += 1
+            return 0.0
+        if low_priority:
+            raise self._shed("low_priority", tool)
+        if len(self._waiters) >= self.max_queue:
+            raise self._shed("queue_full", tool)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats.queued += 1
+        start_time = time.monotonic()
+        try:
+            await asyncio.wait([waiter], timeout=self.max_queue_wait)
+        except asyncio.CancelledError:
+            # A slot handed over just before the caller was cancelled must be given back
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+
+        if waiter.cancelled():
+            raise self._shed("queue_timeout", tool)
+        waited = time.monotonic() - start_time
+        self.stats.admitted += 1
+        self.stats.total_queue_wait += waited
+        return waited
+
+    def release(self, latency: float | None = None, overloaded: bool = False) -> None:
+        """Free a slot, adapting the limit to the call's latency, and admit waiting calls."""
+        if latency is not None:
+            self.limit.update(latency, self.in_flight, overloaded)
+            self._average_latency += LATENCY_SMOOTHING * (latency - self._average_latency)
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.limit.value:
+            waiter = self._waiters.popleft()
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+class AdmissionControlMiddleware(Middleware):
+    """Middleware applying an admission controller to tool calls."""
+
+    def __init__(
+        self,
+        controller: AdmissionController,
+        low_priority_tools: Iterable[str] = (),
+        exempt_tools: Iterable[str] = (),
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            controller: Admission controller shared by all tool calls
+            low_priority_tools: Tools shed first when the server is saturated
+            exempt_tools: Tools that do no upstream work or manage it themselves, never limited
+
+        """
+        self.controller = controller
+        self.low_priority_tools = frozenset(low_priority_tools)
+        self.exempt_tools = frozenset(exempt_tools)
+
+    @classmethod
+    def from_settings(cls) -> AdmissionControlMiddleware:
+        """Create the middleware with the limits configured in settings."""
+        limit = AIMDLimit(
+            initial=settings.admission_initial_limit,
+            min_limit=settings.admission_min_limit,
+            max_limit=settings.admission_max_limit,
+            latency_target=settings.admission_latency_target_seconds,
+        )
+        controller = AdmissionController(
+            limit, max_queue=settings.admission_max_queue, max_queue_wait=settings.admission_max_queue_wait_seconds
+        )
+        return cls(
+            controller,
+            low_priority_tools=settings.admission_low_priority_tools,
+            exempt_tools=settings.admission_exempt_tools,
+        )
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Run a tool call once admitted."""
+        tool = context.message.name
+        if tool in self.exempt_tools:
+            return await call_next(context)
+
+        await self.controller.acquire(tool, low_priority=tool in self.low_priority_tools)
+        start_time = time.monotonic()
+        overloaded = False
+        try:
+            return await call_next(context)
+        except Exception as e:
+            overloaded = is_overload_error(e)
+            raise
+        finally:
+            self.controller.release(time.monotonic() - start_time, overloaded)
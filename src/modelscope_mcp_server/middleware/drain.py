@@ -0,0 +1,141 @@
+"""Draining of in-flight tool calls on shutdown.
+
+Once draining begins, new tool calls are rejected with a retryable error, so that clients
+move to another replica, while calls already running may finish until the drain deadline.
+Calls still running at the deadline are cancelled, answered with the same error and reported
+as abandoned, as are calls cancelled by the transport while draining.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.utilities import logging
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+logger = logging.get_logger(__name__)
+
+
+class ShuttingDownError(McpError):
+    """Rejection of a tool call received while the server is shutting down, or abandoned by the drain."""
+
+    def __init__(self, tool: str, abandoned: bool = False) -> None:
+        """Initialize the error.
+
+        Args:
+            tool: Name of the called tool
+            abandoned: Whether the call was started and cancelled at the drain deadline
+
+        """
+        if abandoned:
+            message = f"Server shut down before tool '{tool}' finished"
+        else:
+            message = f"Server is shutting down, tool '{tool}' was not run"
+        super().__init__(ErrorData(code=-32000, message=message, data={"reason": "shutting_down", "tool": tool}))
+
+
+@dataclass
+class DrainReport:
+    """Outcome of draining the in-flight tool calls."""
+
+    duration: float
+    completed: int
+    abandoned: int
+
+
+class DrainMiddleware(Middleware):
+    """Middleware tracking in-flight tool calls so that shutdown can wait for them."""
+
+    def __init__(self) -> None:
+        """Initialize the middleware."""
+        self.draining = False
+        self.completed = 0
+        self.abandoned = 0
+        self._in_flight: set[asyncio.Future[Any]] = set()
+        self._abandoning: set[asyncio.Future[Any]] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._started_at = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tool calls running."""
+        return len(self._in_flight)
+
+    def resume(self) -> None:
+        """Accept tool calls again, when the server is started after a shutdown."""
+        self.draining = False
+        self.completed = 0
+        self.abandoned = 0
+
+    def begin_drain(self) -> None:
+        """Reject new tool calls from now on, the drain deadline starts counting."""
+        if self.draining:
+            return
+        self.draining = True
+        self._started_at = time.monotonic()
+        logger.info(f"Draining {self.in_flight} in-flight tool calls")
+
+    async def drain(self, timeout: float) -> DrainReport:
+        """Wait for in-flight tool calls until `timeout` seconds after draining began, then cancel the rest.
+
+        Args:
+            timeout: Drain deadline in seconds, counted from begin_drain
+
+        Returns:
+            Drain duration and the numbers of calls completed and abandoned while draining
+
+        """
+        self.begin_drain()
+        remaining = self._started_at + timeout - time.monotonic()
+        if self._in_flight and remaining > 0:
+            try:
+                await asyncio.wait_for(self._idle.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+        leftover = list(self._in_flight)
+        self._abandoning.update(leftover)
+        for task in leftover:
+            task.cancel()
+        await asyncio.gather(*leftover, return_exceptions=True)
+        return DrainReport(
+            duration=time.monotonic() - self._started_at, completed=self.completed, abandoned=self.abandoned
+        )
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Run a tool call unless draining, tracking it until it finishes."""
+        if self.draining:
+            raise ShuttingDownError(context.message.name)
+
+        # The call runs in a task of its own, so that abandoning it at the drain deadline
+        # still answers the request with an error instead of dropping it
+        task = asyncio.ensure_future(call_next(context))
+        self._in_flight.add(task)
+        self._idle.clear()
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if self.draining:
+                self.abandoned += 1
+            if task in self._abandoning:
+                raise ShuttingDownError(context.message.name, abandoned=True) from None
+            raise
+        except Exception:
+            if self.draining:
+                self.completed += 1
+            raise
+        else:
+            if self.draining:
+                self.completed += 1
+            return result
+        finally:
+            self._in_flight.discard(task)
+            self._abandoning.discard(task)
+            if not self._in_flight:
+                self._idle.set()
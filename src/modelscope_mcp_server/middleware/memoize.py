@@ -0,0 +1,224 @@
+"""Memoization of complete tool results.
+
+The response cache saves upstream requests, but a repeated tool call still pays for argument
+validation, response mapping and result serialization. This middleware keeps the final
+ToolResult of recent calls and answers identical calls from it.
+
+A tool is memoized if its annotations declare it read-only, or non-destructive and
+idempotent. Other tools, such as generate_image, which creates a new image on every call,
+are never memoized, as the MCP defaults assume a tool may modify its environment.
+
+Calls are keyed by tool name and their arguments with the tool's parameter defaults filled
+in, serialized canonically, so calls that only differ in spelled-out defaults or key order
+share an entry. Error results are not memoized. Callers passing their own token (see tenant)
+have their own entries, since results such as get_current_user's depend on the token;
+responses they share with other callers are still shared through the response cache.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import Tool, ToolResult
+from fastmcp.utilities import logging
+
+from ..settings import settings
+from ..tenant import get_tenant_id
+
+logger = logging.get_logger(__name__)
+
+
+def is_memoizable(tool: Tool) -> bool:
+    """Whether a tool's annotations allow replaying its results."""
+    annotations = tool.annotations
+    if annotations is None or annotations.idempotentHint is False:
+        return False
+    if annotations.readOnlyHint:
+        return True
+    return annotations.destructiveHint is False and annotations.idempotentHint is True
+
+
+def make_memo_key(
+    tool: str, arguments: Mapping[str, Any] | None, defaults: Mapping[str, Any], tenant: str | None = None
+) -> str:
+    """Build the key of a tool call from its name and arguments, with unset parameters at their defaults.
+
+    Calls of a tenant are keyed separately from other tenants' and from calls with the server's token.
+    """
+    payload = json.dumps({**defaults, **(arguments or {})}, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{tool} {payload}" if tenant is None else f"{tenant}:{tool} {payload}"
+
+
+def get_result_size(result: ToolResult) -> int:
+    """Return the approximate size in bytes of a result's content blocks."""
+    size = 0
+    for block in result.content:
+        text = getattr(block, "text", None) or getattr(block, "data", None) or ""
+        size += len(text.encode("utf-8")) if isinstance(text, str) else len(text)
+    return size
+
+
+@dataclass(frozen=True)
+class MemoPolicy:
+    """Memoization policy of a tool."""
+
+    ttl: float
+    max_result_bytes: int
+    # Parameter defaults from the tool's input schema, filled into the key
+    defaults: Mapping[str, Any]
+
+
+@dataclass
+class MemoEntry:
+    """A memoized tool result."""
+
+    result: ToolResult
+    expires_at: float
+    size: int
+
+
+@dataclass
+class MemoStatistics:
+    """Counters describing memoization effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # Results not memoized because they exceeded the tool's size limit
+    oversized: int = 0
+
+
+class MemoizationMiddleware(Middleware):
+    """Middleware serving repeated read-only tool calls from recent results."""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_bytes: int,
+        max_result_bytes: int,
+        tool_ttls: Mapping[str, float] | None = None,
+        tool_max_result_bytes: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize the limits.
+
+        Args:
+            ttl: Seconds results are replayed
+            max_bytes: Maximum total size of memoized results, least recently used ones are evicted
+            max_result_bytes: Results larger than this are not memoized
+            tool_ttls: TTL by tool name, 0 disables memoization of a tool
+            tool_max_result_bytes: Maximum result size by tool name
+
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_result_bytes = max_result_bytes
+        self.tool_ttls = dict(tool_ttls or {})
+        self.tool_max_result_bytes = dict(tool_max_result_bytes or {})
+        self.stats = MemoStatistics()
+        self.size = 0
+        self._entries: OrderedDict[str, MemoEntry] = OrderedDict()
+        self._policies: dict[str, MemoPolicy | None] = {}
+
+    @classmethod
+    def from_settings(cls) -> MemoizationMiddleware:
+        """Create the middleware with the limits configured in settings."""
+        return cls(
+            ttl=settings.memo_ttl_seconds,
+            max_bytes=settings.memo_max_bytes,
+            max_result_bytes=settings.memo_max_result_bytes,
+            tool_ttls=settings.memo_tool_ttls,
+            tool_max_result_bytes=settings.memo_tool_max_result_bytes,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of memoized results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        self._entries.clear()
+        self.size = 0
+
+    def get_policy(self, tool: Tool) -> MemoPolicy | None:
+        """Return the memoization policy of a tool, None if its results are not memoized."""
+        ttl = self.tool_ttls.get(tool.name, self.ttl)
+        if ttl <= 0 or not is_memoizable(tool):
+            return None
+        properties = tool.parameters.get("properties", {})
+        defaults = {name: schema["default"] for name, schema in properties.items() if "default" in schema}
+        max_result_bytes = self.tool_max_result_bytes.get(tool.name, self.max_result_bytes)
+        return MemoPolicy(ttl=ttl, max_result_bytes=max_result_bytes, defaults=defaults)
+
+    async def load_policies(self, server: FastMCP) -> None:
+        """Resolve the policies of all tools of a server, so that calls need not look up their tool."""
+        for tool in (await server.get_tools()).values():
+            self._policies[tool.name] = self.get_policy(tool)
+
+    async def _resolve_policy(self, context: MiddlewareContext) -> MemoPolicy | None:
+        name = context.message.name
+        if name not in self._policies:
+            if context.fastmcp_context is None:
+                return None
+            try:
+                tool = await context.fastmcp_context.fastmcp.get_tool(name)
+            except NotFoundError:
+                return None
+            self._policies[name] = self.get_policy(tool)
+        return self._policies[name]
+
+    def _get(self, key: str) -> ToolResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def _store(self, key: str, result: ToolResult, policy: MemoPolicy) -> None:
+        size = get_result_size(result)
+        if size > policy.max_result_bytes or size > self.max_bytes:
+            self.stats.oversized += 1
+            return
+        self._remove(key)
+        self._entries[key] = MemoEntry(result=result, expires_at=time.monotonic() + policy.ttl, size=size)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Replay a memoized result, or run the call and memoize its result."""
+        policy = await self._resolve_policy(context)
+        if policy is None:
+            return await call_next(context)
+
+        key = make_memo_key(context.message.name, context.message.arguments, policy.defaults, get_tenant_id())
+        cached = self._get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            logger.debug(f"Replaying memoized result of {context.message.name}")
+            # Results are copied in and out, so that other middleware cannot modify memoized ones
+            return copy.deepcopy(cached)
+
+        self.stats.misses += 1
+        # Failed calls raise, so only successful results are stored
+        result = await call_next(context)
+        if isinstance(result, ToolResult):
+            self._store(key, copy.deepcopy(result), policy)
+        return result
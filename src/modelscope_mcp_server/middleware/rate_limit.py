@@ -0,0 +1,229 @@
+"""Token bucket rate limiting per session, per tool and globally.
+
+Every request draws from the global bucket and from the bucket of its client session; tool
+calls also draw from the tool's own bucket, if one is configured. Tool calls cost their
+configured weight in tokens (1 by default), so expensive tools use up a budget faster than
+cheap ones. Over-limit requests are rejected without being queued, with a structured hint
+telling the client when to retry.
+
+In stateless HTTP mode requests carry no session, so "session" buckets are kept per client
+address instead. The X-Forwarded-For header is only honored for requests from configured
+trusted proxies, since any client can send it.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from fastmcp.server.dependencies import get_http_request
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.rate_limiting import RateLimitError
+from fastmcp.utilities import logging
+
+from ..settings import settings
+
+logger = logging.get_logger(__name__)
+
+# Session used when a request carries no session
+DEFAULT_SESSION = "default"
+
+# Number of session buckets kept; evicted buckets were the least recently used, and a new
+# bucket starts full just as an idle one would have refilled
+MAX_SESSION_BUCKETS = 10000
+
+
+@lru_cache(maxsize=8)
+def _get_proxy_networks(proxies: tuple[str, ...]) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(ipaddress.ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def is_trusted_proxy(address: str) -> bool:
+    """Return whether an address belongs to one of the trusted proxies configured in settings."""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _get_proxy_networks(tuple(settings.trusted_proxies)))
+
+
+def get_client_address() -> str | None:
+    """Return the address of the client of the current HTTP request, None outside HTTP requests.
+
+    This is the address the request came from, unless it came from a trusted proxy: then the
+    X-Forwarded-For entries are followed back from the nearest proxy to the first address that
+    is not a trusted proxy. Entries before that one may be forged by the client.
+    """
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return None
+    address = request.client.host if request.client else None
+    if address is None or not is_trusted_proxy(address):
+        return address
+    for entry in reversed(request.headers.get("x-forwarded-for", "").split(",")):
+        if not entry.strip():
+            continue
+        address = entry.strip()
+        if not is_trusted_proxy(address):
+            break
+    return address
+
+
+class RateLimitExceededError(RateLimitError):
+    """Rejection of an over-limit request, with a retry hint in the error data."""
+
+    def __init__(self, scope: str, retry_after: float, tool: str | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            scope: Exhausted limit: "global", "session" or "tool"
+            retry_after: Seconds until the request would be admitted
+            tool: Name of the called tool, if any
+
+        """
+        target = f" for tool '{tool}'" if tool else ""
+        message = f"Rate limit exceeded ({scope}){target}, retry after {retry_after:.2f}s"
+        super().__init__(message)
+        self.error.data = {"scope": scope, "retry_after_seconds": round(retry_after, 3), "tool": tool}
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, which bounds bursts
+
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def wait_time(self, cost: float, now: float) -> float:
+        """Refill the bucket and return the seconds until `cost` tokens are available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        # A call costing more than the capacity only needs a full bucket
+        cost = min(cost, self.capacity)
+        if self.tokens >= cost:
+            return 0.0
+        return (cost - self.tokens) / self.rate if self.rate > 0 else math.inf
+
+    def take(self, cost: float) -> None:
+        """Remove tokens, after wait_time returned 0 for the same cost."""
+        self.tokens -= min(cost, self.capacity)
+
+
+class RateLimitMiddleware(Middleware):
+    """Middleware applying global, per-session and per-tool token buckets."""
+
+    def __init__(
+        self,
+        global_rate: float,
+        global_burst: float,
+        session_rate: float,
+        session_burst: float,
+        tool_rates: Mapping[str, float] | None = None,
+        tool_costs: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the limits, a rate of 0 disables the corresponding bucket.
+
+        Args:
+            global_rate: Tokens per second shared by all requests
+            global_burst: Capacity of the global bucket
+            session_rate: Tokens per second for each client session
+            session_burst: Capacity of each session bucket
+            tool_rates: Tokens per second for specific tools across all sessions, each bucket
+                holds two seconds' worth of tokens
+            tool_costs: Tokens a call of each tool costs, 1 for tools not listed
+
+        """
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.tool_costs = dict(tool_costs or {})
+
+        self.global_bucket = TokenBucket(global_rate, global_burst) if global_rate > 0 else None
+        self.tool_buckets = {
+            tool: TokenBucket(rate, max(rate * 2, self.tool_costs.get(tool, 1.0)))
+            for tool, rate in (tool_rates or {}).items()
+            if rate > 0
+        }
+        self.session_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls) -> RateLimitMiddleware:
+        """Create the middleware with the limits configured in settings."""
+        return cls(
+            global_rate=settings.rate_limit_global_rate,
+            global_burst=settings.rate_limit_global_burst,
+            session_rate=settings.rate_limit_session_rate,
+            session_burst=settings.rate_limit_session_burst,
+            tool_rates=settings.rate_limit_tool_rates,
+            tool_costs=settings.rate_limit_tool_costs,
+        )
+
+    def _get_session_id(self, context: MiddlewareContext) -> str:
+        if settings.stateless_http:
+            return get_client_address() or DEFAULT_SESSION
+        if context.fastmcp_context is None:
+            return DEFAULT_SESSION
+        try:
+            return context.fastmcp_context.session_id
+        except RuntimeError:
+            return DEFAULT_SESSION
+
+    def _get_session_bucket(self, session_id: str) -> TokenBucket:
+        bucket = self.session_buckets.get(session_id)
+        if bucket is None:
+            bucket = TokenBucket(self.session_rate, self.session_burst)
+            self.session_buckets[session_id] = bucket
+            if len(self.session_buckets) > MAX_SESSION_BUCKETS:
+                self.session_buckets.popitem(last=False)
+        else:
+            self.session_buckets.move_to_end(session_id)
+        return bucket
+
+    def acquire(self, session_id: str, tool: str | None = None) -> None:
+        """Take the tokens for a request from all applicable buckets, or raise RateLimitExceededError.
+
+        Tokens are only taken if every bucket can admit the request, so a rejected request
+        does not use up any budget.
+        """
+        buckets: list[tuple[str, TokenBucket]] = []
+        if self.global_bucket is not None:
+            buckets.append(("global", self.global_bucket))
+        if self.session_rate > 0:
+            buckets.append(("session", self._get_session_bucket(session_id)))
+        if tool is not None and tool in self.tool_buckets:
+            buckets.append(("tool", self.tool_buckets[tool]))
+
+        cost = self.tool_costs.get(tool, 1.0) if tool is not None else 1.0
+        now = time.monotonic()
+        waits = [(bucket.wait_time(cost, now), scope) for scope, bucket in buckets]
+        retry_after, scope = max(waits, default=(0.0, ""))
+        if retry_after > 0:
+            logger.debug(f"Rejecting request from session {session_id}: {scope} limit, retry after {retry_after:.2f}s")
+            raise RateLimitExceededError(scope, retry_after, tool)
+
+        for _, bucket in buckets:
+            bucket.take(cost)
+
+    async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Apply the limits to a request."""
+        tool = getattr(context.message, "name", None) if context.method == "tools/call" else None
+        self.acquire(self._get_session_id(context), tool)
+        return await call_next(context)
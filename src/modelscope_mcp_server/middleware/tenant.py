@@ -0,0 +1,55 @@
+"""Selection of the caller's ModelScope token for each MCP request.
+
+Callers of the HTTP transports pass their token in the configured header, as a bare token
+or as "Bearer <token>". MCP clients send the headers configured for a server with every
+request of a session, so a session keeps its token. Requests without the header, and
+requests over stdio, use the server's token.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastmcp.server.dependencies import get_http_request
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from ..settings import settings
+from ..tenant import use_token
+
+
+class TenantMiddleware(Middleware):
+    """Middleware serving each request with the ModelScope token passed by its caller."""
+
+    def __init__(self, header: str) -> None:
+        """Initialize the middleware.
+
+        Args:
+            header: Name of the HTTP header holding the caller's token
+
+        """
+        self.header = header
+
+    @classmethod
+    def from_settings(cls) -> TenantMiddleware:
+        """Create the middleware with the header configured in settings."""
+        return cls(header=settings.tenant_token_header)
+
+    def get_token(self) -> str | None:
+        """Return the token passed with the current HTTP request, None if there is none."""
+        try:
+            request = get_http_request()
+        except RuntimeError:
+            return None
+        value = request.headers.get(self.header, "").strip()
+        scheme, _, credentials = value.partition(" ")
+        if credentials and scheme.lower() == "bearer":
+            value = credentials.strip()
+        return value or None
+
+    async def on_message(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Handle the message with the caller's token."""
+        token = self.get_token()
+        if token is None:
+            return await call_next(context)
+        with use_token(token):
+            return await call_next(context)
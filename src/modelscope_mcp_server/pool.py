@@ -0,0 +1,250 @@
+"""Metering and adaptive keep-alive sizing of the upstream connection pools.
+
+MeteredTransport wraps the HTTP transport of a pool and records, for every request:
+
+- Pool wait: the time until the request is sent on a connection, including the time to open
+  one when no idle connection is available.
+- Pool utilization: the requests in flight, relative to the pool's max_connections, when the
+  request starts.
+
+Both are kept in histograms shared by all pools (pool_stats), returned by get_environment_info
+and logged on shutdown.
+
+In adaptive mode, KeepaliveTuner resizes the number of idle connections a pool keeps alive at
+the end of each interval: to the peak concurrency of the interval plus headroom, at least
+doubled while requests waited for connections longer than the wait target. Shrinking is
+gradual, so that a short lull does not close connections the next burst needs. Over HTTP/2,
+requests to a host share one multiplexed connection, so resizing matters mostly for hosts
+answering over HTTP/1.1.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from fastmcp.utilities import logging
+
+logger = logging.get_logger(__name__)
+
+# Upper bounds of the histogram buckets
+WAIT_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+UTILIZATION_BUCKETS = (0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+# Trace events marking a request being sent on a connection
+SEND_EVENTS = {"http11.send_request_headers.started", "http2.send_request_headers.started"}
+
+# Keep-alive headroom over the peak concurrency of an interval
+KEEPALIVE_HEADROOM = 1.25
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize the histogram.
+
+        Args:
+            bounds: Increasing upper bounds of the buckets, values above the last fall in +Inf
+
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values, 0 if there are none."""
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative(self) -> dict[str, int]:
+        """Return the number of values at or below each bound, Prometheus style."""
+        labels = [f"{bound:g}" for bound in self.bounds] + ["+Inf"]
+        totals, total = {}, 0
+        for label, count in zip(labels, self.counts, strict=True):
+            total += count
+            totals[label] = total
+        return totals
+
+
+@dataclass
+class PoolStatistics:
+    """Counters and histograms of the upstream connection pools."""
+
+    requests: int = 0
+    max_in_flight: int = 0
+    keepalive_resizes: int = 0
+    wait_seconds: Histogram = field(default_factory=lambda: Histogram(WAIT_BUCKETS_SECONDS))
+    utilization: Histogram = field(default_factory=lambda: Histogram(UTILIZATION_BUCKETS))
+
+
+pool_stats = PoolStatistics()
+
+
+class KeepaliveTuner:
+    """Resizes a pool's keep-alive connections from its observed concurrency and pool wait."""
+
+    def __init__(self, min_keepalive: int, max_keepalive: int, interval: float, wait_target: float) -> None:
+        """Initialize the tuner.
+
+        Args:
+            min_keepalive: Fewest idle connections kept alive
+            max_keepalive: Most idle connections kept alive, the pool's max_connections
+            interval: Seconds between resizes
+            wait_target: Mean pool wait in seconds above which the keep-alive set grows
+
+        """
+        self.min_keepalive = min_keepalive
+        self.max_keepalive = max_keepalive
+        self.interval = interval
+        self.wait_target = wait_target
+        self._window_start = time.monotonic()
+        self._peak_in_flight = 0
+        self._waits = 0
+        self._total_wait = 0.0
+
+    def observe(self, in_flight: int, wait: float | None) -> None:
+        """Record the concurrency at the start of a request and its pool wait, if it was sent."""
+        self._peak_in_flight = max(self._peak_in_flight, in_flight)
+        if wait is not None:
+            self._waits += 1
+            self._total_wait += wait
+
+    def resize(self, current: int) -> int | None:
+        """Return the new keep-alive size at the end of an interval, None if it is unchanged."""
+        now = time.monotonic()
+        if now - self._window_start < self.interval:
+            return None
+        mean_wait = self._total_wait / self._waits if self._waits else 0.0
+        target = math.ceil(self._peak_in_flight * KEEPALIVE_HEADROOM)
+        if mean_wait > self.wait_target:
+            target = max(target, current * 2)
+        elif target < current:
+            # Close half the surplus per interval
+            target = current - (current - target) // 2
+        target = min(max(target, self.min_keepalive), self.max_keepalive)
+
+        self._window_start = now
+        self._peak_in_flight = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        return target if target != current else None
+
+
+class MeteredStream(httpx.AsyncByteStream):
+    """Response body stream reporting when the connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        """Wrap a response stream, calling `on_close` once when it is closed."""
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate over the body chunks."""
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        """Close the stream, releasing its connection."""
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport recording pool wait and utilization, and resizing the keep-alive set if adaptive."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, limits: httpx.Limits, tuner: KeepaliveTuner | None) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: Pooled HTTP transport to send requests with
+            limits: Limits of the transport's pool
+            tuner: Keep-alive tuner, None for a fixed keep-alive size
+
+        """
+        self._transport = transport
+        self.max_connections = limits.max_connections
+        self.tuner = tuner
+        self.in_flight = 0
+
+    @property
+    def max_keepalive_connections(self) -> int:
+        """Number of idle connections the pool keeps alive."""
+        return self._transport._pool._max_keepalive_connections
+
+    @max_keepalive_connections.setter
+    def max_keepalive_connections(self, value: int) -> None:
+        self._transport._pool._max_keepalive_connections = value
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, recording how long it waited for a connection."""
+        started_at = time.monotonic()
+        self.in_flight += 1
+        in_flight = self.in_flight
+        pool_stats.requests += 1
+        pool_stats.max_in_flight = max(pool_stats.max_in_flight, in_flight)
+        if self.max_connections:
+            pool_stats.utilization.observe(in_flight / self.max_connections)
+
+        wait: float | None = None
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            nonlocal wait
+            if wait is None and event in SEND_EVENTS:
+                wait = time.monotonic() - started_at
+                pool_stats.wait_seconds.observe(wait)
+            if outer_trace is not None:
+                await outer_trace(event, info)
+
+        request.extensions["trace"] = trace
+
+        def release() -> None:
+            self.in_flight -= 1
+            if self.tuner is not None:
+                self.tuner.observe(in_flight, wait)
+                self._resize()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        # Responses of the async transport always have async streams
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=MeteredStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def _resize(self) -> None:
+        if self.tuner is None:
+            return
+        current = self.max_keepalive_connections
+        size = self.tuner.resize(current)
+        if size is not None:
+            self.max_keepalive_connections = size
+            pool_stats.keepalive_resizes += 1
+            logger.info(f"Resized keep-alive connections from {current} to {size}")
+
+    async def aclose(self) -> None:
+        """Close the pool's connections."""
+        await self._transport.aclose()
@@ -1,29 +1,64 @@
 """ModelScope MCP Server implementation."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import cast
 
 from fastmcp import FastMCP
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
 from fastmcp.server.middleware.logging import LoggingMiddleware
-from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware
 from fastmcp.server.middleware.timing import TimingMiddleware
 from fastmcp.settings import LOG_LEVEL
 from fastmcp.utilities import logging
 from fastmcp.utilities.logging import configure_logging
 
+from .client import ModelScopeClient
+from .leaderboard import leaderboards
+from .middleware import (
+    AdmissionControlMiddleware,
+    DrainMiddleware,
+    MemoizationMiddleware,
+    RateLimitMiddleware,
+    TenantMiddleware,
+)
 from .settings import settings
+from .shutdown import drain_on_signals, find_middleware, shutdown
 from .tools.aigc import register_aigc_tools
+from .tools.catalog import register_catalog_tools
 from .tools.context import register_context_tools
 from .tools.dataset import register_dataset_tools
+from .tools.leaderboard import register_leaderboard_tools
 from .tools.mcp import register_mcp_tools
 from .tools.model import register_model_tools
 from .tools.paper import register_paper_tools
+from .tools.search import register_search_tools
 from .tools.studio import register_studio_tools
 from .utils.metadata import get_server_name_with_version
 
 logger = logging.get_logger(__name__)
 
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up and start background services, and shut down gracefully at the end of the server's lifetime.
+
+    The transports only report ready once the lifespan has started, so they wait for the warm-up.
+    """
+    memo = find_middleware(server, MemoizationMiddleware)
+    if memo is not None:
+        await memo.load_policies(server)
+    drain = find_middleware(server, DrainMiddleware)
+    drain.resume()
+    if settings.warmup_connections:
+        await ModelScopeClient.warm_up(settings.warmup_connections, settings.warmup_timeout_seconds)
+    leaderboards.start()
+    try:
+        with drain_on_signals(drain):
+            yield
+    finally:
+        await shutdown(server)
+
+
 def create_mcp_server() -> FastMCP:
     """Create and configure the MCP server with all ModelScope tools."""
     configure_logging(level=cast(LOG_LEVEL, settings.log_level))
@@ -31,11 +66,19 @@ def create_mcp_server() -> FastMCP:
     mcp = FastMCP(
         name=get_server_name_with_version(),
         instructions="This server provides tools for calling ModelScope (魔搭社区) API.",
+        lifespan=server_lifespan,
     )
 
     # Add middleware in logical order
     mcp.add_middleware(ErrorHandlingMiddleware(logger=logger))
-    mcp.add_middleware(RateLimitingMiddleware(max_requests_per_second=10))
+    mcp.add_middleware(DrainMiddleware())
+    if settings.tenant_tokens_enabled:
+        mcp.add_middleware(TenantMiddleware.from_settings())
+    mcp.add_middleware(RateLimitMiddleware.from_settings())
+    if settings.memo_enabled:
+        mcp.add_middleware(MemoizationMiddleware.from_settings())
+    if settings.admission_enabled:
+        mcp.add_middleware(AdmissionControlMiddleware.from_settings())
     mcp.add_middleware(TimingMiddleware())
     mcp.add_middleware(LoggingMiddleware())
 
@@ -47,5 +90,10 @@ def create_mcp_server() -> FastMCP:
     register_paper_tools(mcp)
     register_mcp_tools(mcp)
     register_aigc_tools(mcp)
+    # Local catalog tools are only useful with snapshots to serve
+    if settings.catalog_dir:
+        register_catalog_tools(mcp)
+    register_leaderboard_tools(mcp)
+    register_search_tools(mcp)
 
     return mcp
@@ -1,17 +1,69 @@
 """Global settings management for ModelScope MCP Server."""
 
+import ipaddress
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .constants import (
+    DEFAULT_ADMISSION_EXEMPT_TOOLS,
+    DEFAULT_ADMISSION_INITIAL_LIMIT,
+    DEFAULT_ADMISSION_LATENCY_TARGET_SECONDS,
+    DEFAULT_ADMISSION_LOW_PRIORITY_TOOLS,
+    DEFAULT_ADMISSION_MAX_LIMIT,
+    DEFAULT_ADMISSION_MAX_QUEUE,
+    DEFAULT_ADMISSION_MAX_QUEUE_WAIT_SECONDS,
+    DEFAULT_ADMISSION_MIN_LIMIT,
     DEFAULT_API_TIMEOUT_SECONDS,
+    DEFAULT_BATCH_MAX_CONCURRENCY,
+    DEFAULT_CACHE_BACKEND_TIMEOUT_SECONDS,
+    DEFAULT_CACHE_DISK_MAX_BYTES,
+    DEFAULT_CACHE_HARD_TTL_SECONDS,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_NEGATIVE_MAX_ENTRIES,
+    DEFAULT_CACHE_NEGATIVE_TTL_SECONDS,
+    DEFAULT_CACHE_SOFT_TTL_SECONDS,
+    DEFAULT_CACHE_STALE_IF_ERROR_SECONDS,
+    DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_POOL_TIMEOUT_SECONDS,
+    DEFAULT_HTTP_READ_TIMEOUT_SECONDS,
+    DEFAULT_HTTP_WRITE_TIMEOUT_SECONDS,
     DEFAULT_IMAGE_GENERATION_TIMEOUT_SECONDS,
     DEFAULT_IMAGE_TO_IMAGE_MODEL,
+    DEFAULT_LEADERBOARD_MAX_AGE_SECONDS,
+    DEFAULT_LEADERBOARD_SIZE,
     DEFAULT_MAX_POLL_ATTEMPTS,
+    DEFAULT_MEMO_MAX_BYTES,
+    DEFAULT_MEMO_MAX_RESULT_BYTES,
+    DEFAULT_MEMO_TOOL_TTLS,
+    DEFAULT_MEMO_TTL_SECONDS,
     DEFAULT_MODELSCOPE_API_INFERENCE_DOMAIN,
     DEFAULT_MODELSCOPE_DOMAIN,
+    DEFAULT_POOL_ADAPTIVE_INTERVAL_SECONDS,
+    DEFAULT_POOL_ADAPTIVE_MIN_KEEPALIVE,
+    DEFAULT_POOL_ADAPTIVE_WAIT_TARGET_SECONDS,
+    DEFAULT_PREFETCH_MAX_CONCURRENCY,
+    DEFAULT_PREFETCH_MCP_SERVER_DETAILS,
+    DEFAULT_RATE_LIMIT_GLOBAL_BURST,
+    DEFAULT_RATE_LIMIT_GLOBAL_RATE,
+    DEFAULT_RATE_LIMIT_SESSION_BURST,
+    DEFAULT_RATE_LIMIT_SESSION_RATE,
+    DEFAULT_RATE_LIMIT_TOOL_COSTS,
+    DEFAULT_README_PREVIEW_BYTES,
+    DEFAULT_SEARCH_ALL_SOURCE_TIMEOUT_SECONDS,
+    DEFAULT_SEARCH_ALL_TIMEOUT_SECONDS,
+    DEFAULT_SHUTDOWN_TIMEOUT_SECONDS,
     DEFAULT_TASK_POLL_INTERVAL_SECONDS,
+    DEFAULT_TENANT_IDLE_SECONDS,
+    DEFAULT_TENANT_MAX_CLIENTS,
+    DEFAULT_TENANT_TOKEN_HEADER,
     DEFAULT_TEXT_TO_IMAGE_MODEL,
+    DEFAULT_WARMUP_CONNECTIONS,
+    DEFAULT_WARMUP_TIMEOUT_SECONDS,
+    DEFAULT_WORKER_HEALTHCHECK_TIMEOUT_SECONDS,
 )
 
 
@@ -28,6 +80,23 @@ class Settings(BaseSettings):
 
     # Authentication settings
     api_token: str | None = Field(default=None, description="ModelScope API token for authentication")
+    tenant_tokens_enabled: bool = Field(
+        default=False,
+        description="Whether callers of the HTTP transports may pass their own ModelScope token, "
+        "used instead of api_token for their requests",
+    )
+    tenant_token_header: str = Field(
+        default=DEFAULT_TENANT_TOKEN_HEADER,
+        description="HTTP header holding a caller's ModelScope token",
+    )
+    tenant_max_clients: int = Field(
+        default=DEFAULT_TENANT_MAX_CLIENTS,
+        description="Maximum number of callers' token clients kept, least recently used ones are evicted",
+    )
+    tenant_idle_seconds: float = Field(
+        default=DEFAULT_TENANT_IDLE_SECONDS,
+        description="Seconds a caller's token client is kept unused before it is evicted",
+    )
 
     # Domain settings
     main_domain: str = Field(
@@ -58,6 +127,14 @@ class Settings(BaseSettings):
         default=DEFAULT_IMAGE_GENERATION_TIMEOUT_SECONDS,
         description="Default timeout for image generation requests",
     )
+    search_all_timeout_seconds: float = Field(
+        default=DEFAULT_SEARCH_ALL_TIMEOUT_SECONDS,
+        description="Overall deadline for unified cross-catalog searches",
+    )
+    search_all_source_timeout_seconds: float = Field(
+        default=DEFAULT_SEARCH_ALL_SOURCE_TIMEOUT_SECONDS,
+        description="Per-source deadline for unified cross-catalog searches",
+    )
 
     # Task polling
     task_poll_interval_seconds: int = Field(
@@ -69,6 +146,262 @@ class Settings(BaseSettings):
         description="Maximum number of polling attempts for async tasks",
     )
 
+    # Batch tool settings
+    batch_max_concurrency: int = Field(
+        default=DEFAULT_BATCH_MAX_CONCURRENCY,
+        description="Maximum number of concurrent upstream requests per batch tool call",
+    )
+
+    # Rate limit settings
+    rate_limit_global_rate: float = Field(
+        default=DEFAULT_RATE_LIMIT_GLOBAL_RATE,
+        description="Requests per second admitted across all clients, 0 to disable the global limit",
+    )
+    rate_limit_global_burst: float = Field(
+        default=DEFAULT_RATE_LIMIT_GLOBAL_BURST,
+        description="Burst capacity of the global limit",
+    )
+    rate_limit_session_rate: float = Field(
+        default=DEFAULT_RATE_LIMIT_SESSION_RATE,
+        description="Requests per second admitted per client session, 0 to disable the session limit",
+    )
+    rate_limit_session_burst: float = Field(
+        default=DEFAULT_RATE_LIMIT_SESSION_BURST,
+        description="Burst capacity of each session limit",
+    )
+    rate_limit_tool_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description="Calls per second admitted for specific tools across all sessions, by tool name",
+    )
+    rate_limit_tool_costs: dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_RATE_LIMIT_TOOL_COSTS),
+        description="Cost of a call in requests, by tool name (1 for other tools)",
+    )
+
+    # Admission control settings
+    admission_enabled: bool = Field(default=True, description="Whether to bound concurrent tool calls")
+    admission_initial_limit: int = Field(
+        default=DEFAULT_ADMISSION_INITIAL_LIMIT,
+        description="Initial number of concurrent tool calls, adapted to upstream latency and errors",
+    )
+    admission_min_limit: int = Field(
+        default=DEFAULT_ADMISSION_MIN_LIMIT,
+        description="Lower bound of the adaptive concurrency limit",
+    )
+    admission_max_limit: int = Field(
+        default=DEFAULT_ADMISSION_MAX_LIMIT,
+        description="Upper bound of the adaptive concurrency limit",
+    )
+    admission_latency_target_seconds: float = Field(
+        default=DEFAULT_ADMISSION_LATENCY_TARGET_SECONDS,
+        description="Tool calls slower than this lower the concurrency limit",
+    )
+    admission_max_queue: int = Field(
+        default=DEFAULT_ADMISSION_MAX_QUEUE,
+        description="Maximum number of tool calls waiting for a slot, further calls are rejected",
+    )
+    admission_max_queue_wait_seconds: float = Field(
+        default=DEFAULT_ADMISSION_MAX_QUEUE_WAIT_SECONDS,
+        description="Seconds a tool call waits for a slot before it is rejected",
+    )
+    admission_low_priority_tools: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_ADMISSION_LOW_PRIORITY_TOOLS),
+        description="Tools rejected without waiting when no slot is free",
+    )
+    admission_exempt_tools: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_ADMISSION_EXEMPT_TOOLS),
+        description="Tools not subject to admission control",
+    )
+
+    # Tool result memoization settings
+    memo_enabled: bool = Field(default=True, description="Whether to replay results of repeated read-only tool calls")
+    memo_ttl_seconds: float = Field(
+        default=DEFAULT_MEMO_TTL_SECONDS,
+        description="Seconds tool results are replayed",
+    )
+    memo_max_bytes: int = Field(
+        default=DEFAULT_MEMO_MAX_BYTES,
+        description="Maximum total size in bytes of memoized tool results",
+    )
+    memo_max_result_bytes: int = Field(
+        default=DEFAULT_MEMO_MAX_RESULT_BYTES,
+        description="Tool results larger than this many bytes are not memoized",
+    )
+    memo_tool_ttls: dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_MEMO_TOOL_TTLS),
+        description="Seconds results are replayed by tool name, 0 disables memoization of a tool",
+    )
+    memo_tool_max_result_bytes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum size in bytes of memoized results by tool name",
+    )
+
+    # README retrieval settings
+    readme_preview_bytes: int = Field(
+        default=DEFAULT_README_PREVIEW_BYTES,
+        description="Bytes of an MCP server README included in detail results, alongside its outline",
+    )
+
+    # Response cache settings
+    cache_enabled: bool = Field(default=True, description="Whether to cache read-only upstream responses")
+    cache_soft_ttl_seconds: float = Field(
+        default=DEFAULT_CACHE_SOFT_TTL_SECONDS,
+        description="Age in seconds after which cached responses are revalidated in the background",
+    )
+    cache_hard_ttl_seconds: float = Field(
+        default=DEFAULT_CACHE_HARD_TTL_SECONDS,
+        description="Age in seconds after which cached responses are refetched synchronously",
+    )
+    cache_stale_if_error_seconds: float = Field(
+        default=DEFAULT_CACHE_STALE_IF_ERROR_SECONDS,
+        description="Seconds past the hard TTL during which stale responses are served if the upstream fails",
+    )
+    cache_max_entries: int = Field(
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        description="Maximum number of cached responses",
+    )
+    cache_negative_ttl_seconds: float = Field(
+        default=DEFAULT_CACHE_NEGATIVE_TTL_SECONDS,
+        description="Seconds not-found errors and empty search results are cached",
+    )
+    cache_negative_max_entries: int = Field(
+        default=DEFAULT_CACHE_NEGATIVE_MAX_ENTRIES,
+        description="Maximum number of cached not-found errors and empty search results",
+    )
+    cache_dir: str | None = Field(
+        default=None,
+        description="Directory for the persistent disk cache tier shared by worker processes (disabled if unset)",
+    )
+    cache_disk_max_bytes: int = Field(
+        default=DEFAULT_CACHE_DISK_MAX_BYTES,
+        description="Maximum total size in bytes of compressed responses in the disk cache tier",
+    )
+    cache_redis_url: str | None = Field(
+        default=None,
+        description="URL of a Redis-compatible server shared by all replicas as cache backend, "
+        "takes precedence over cache_dir (e.g. redis://localhost:6379/0)",
+    )
+    cache_backend_timeout_seconds: float = Field(
+        default=DEFAULT_CACHE_BACKEND_TIMEOUT_SECONDS,
+        description="Client-side timeout in seconds for cache backend operations, slower answers count as misses",
+    )
+
+    # Prefetch settings
+    prefetch_enabled: bool = Field(
+        default=False,
+        description="Whether to prefetch likely follow-up requests in the background to warm the response cache",
+    )
+    prefetch_max_concurrency: int = Field(
+        default=DEFAULT_PREFETCH_MAX_CONCURRENCY,
+        description="Maximum number of concurrent prefetches, further prefetches are dropped",
+    )
+    prefetch_mcp_server_details: int = Field(
+        default=DEFAULT_PREFETCH_MCP_SERVER_DETAILS,
+        description="Number of top MCP server search hits whose details are prefetched",
+    )
+
+    # Local catalog settings
+    catalog_dir: str | None = Field(
+        default=None,
+        description="Directory containing memory-mapped catalog snapshot files, the local catalog tools "
+        "are only available when it is set",
+    )
+
+    # Leaderboard settings
+    leaderboard_refresh_interval_seconds: int = Field(
+        default=0,
+        description="Interval in seconds for refreshing leaderboard views in the background (0 disables)",
+    )
+    leaderboard_max_age_seconds: int = Field(
+        default=DEFAULT_LEADERBOARD_MAX_AGE_SECONDS,
+        description="Maximum age in seconds of a leaderboard view before it is no longer served",
+    )
+    leaderboard_size: int = Field(
+        default=DEFAULT_LEADERBOARD_SIZE,
+        description="Number of entries materialized per leaderboard view",
+    )
+
+    # HTTP transport settings
+    stateless_http: bool = Field(
+        default=False,
+        description="Whether the streamable HTTP transport keeps no session state between requests, "
+        "so that any replica can serve any request",
+    )
+    trusted_proxies: list[str] = Field(
+        default_factory=list,
+        description="Addresses or networks of reverse proxies whose X-Forwarded-For header gives the client "
+        'address (e.g. ["10.0.0.0/8"]), the header is ignored if empty',
+    )
+
+    # Worker process settings
+    worker_healthcheck_timeout_seconds: int = Field(
+        default=DEFAULT_WORKER_HEALTHCHECK_TIMEOUT_SECONDS,
+        description="Seconds a worker process has to answer a health check before it is restarted",
+    )
+
+    # Connection pool settings
+    http_max_connections: int = Field(
+        default=DEFAULT_HTTP_MAX_CONNECTIONS,
+        description="Maximum number of concurrent upstream connections",
+    )
+    http_max_keepalive_connections: int = Field(
+        default=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        description="Maximum number of idle upstream connections kept alive, the initial size in adaptive mode",
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        description="Seconds an idle upstream connection is kept alive",
+    )
+    http_connect_timeout_seconds: float = Field(
+        default=DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS,
+        description="Timeout for establishing an upstream connection",
+    )
+    http_read_timeout_seconds: float = Field(
+        default=DEFAULT_HTTP_READ_TIMEOUT_SECONDS,
+        description="Timeout for reading a response, for requests without a timeout of their own",
+    )
+    http_write_timeout_seconds: float = Field(
+        default=DEFAULT_HTTP_WRITE_TIMEOUT_SECONDS,
+        description="Timeout for sending a request",
+    )
+    http_pool_timeout_seconds: float = Field(
+        default=DEFAULT_HTTP_POOL_TIMEOUT_SECONDS,
+        description="Timeout for acquiring a connection from the pool",
+    )
+    pool_adaptive_enabled: bool = Field(
+        default=False,
+        description="Whether the keep-alive connections are resized from observed concurrency and pool wait",
+    )
+    pool_adaptive_min_keepalive: int = Field(
+        default=DEFAULT_POOL_ADAPTIVE_MIN_KEEPALIVE,
+        description="Fewest idle connections kept alive in adaptive mode",
+    )
+    pool_adaptive_interval_seconds: float = Field(
+        default=DEFAULT_POOL_ADAPTIVE_INTERVAL_SECONDS,
+        description="Seconds between keep-alive resizes in adaptive mode",
+    )
+    pool_adaptive_wait_target_seconds: float = Field(
+        default=DEFAULT_POOL_ADAPTIVE_WAIT_TARGET_SECONDS,
+        description="Mean pool wait above which adaptive mode grows the keep-alive connections",
+    )
+
+    # Connection warm-up settings
+    warmup_connections: int = Field(
+        default=DEFAULT_WARMUP_CONNECTIONS,
+        description="Connections opened to each upstream domain at startup, before the server reports ready; "
+        "0 disables the warm-up",
+    )
+    warmup_timeout_seconds: float = Field(
+        default=DEFAULT_WARMUP_TIMEOUT_SECONDS,
+        description="Timeout of each warm-up probe",
+    )
+
+    # Shutdown settings
+    shutdown_timeout_seconds: float = Field(
+        default=DEFAULT_SHUTDOWN_TIMEOUT_SECONDS,
+        description="Seconds in-flight tool calls have to finish on shutdown before they are abandoned",
+    )
+
     # Logging settings
     log_level: str = Field(default="INFO", description="Logging level")
 
@@ -92,6 +425,14 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {allowed_levels}")
         return v
 
+    @field_validator("trusted_proxies")
+    @classmethod
+    def validate_trusted_proxies(cls, v: list[str]) -> list[str]:
+        """Validate trusted proxy addresses and networks."""
+        for proxy in v:
+            ipaddress.ip_network(proxy, strict=False)
+        return v
+
     def is_api_token_configured(self) -> bool:
         """Check if API token is configured."""
         return self.api_token is not None and len(self.api_token) > 0
@@ -106,6 +447,8 @@ class Settings(BaseSettings):
         print("🔑 API Configuration:")
         token_status = "Configured" if self.api_token else "Not configured"
         print(f"  • Token: {token_status}")
+        if self.tenant_tokens_enabled:
+            print(f"  • Caller Tokens: {self.tenant_token_header} header")
         print(f"  • Main Domain: {self.main_domain}")
         print(f"  • API Inference Domain: {self.api_inference_domain}")
         print()
@@ -119,6 +462,12 @@ class Settings(BaseSettings):
         # System Settings
         print("⚙️ System Settings:")
         print(f"  • Log Level: {self.log_level}")
+        cache_backend = "redis" if self.cache_redis_url else "disk" if self.cache_dir else "Not configured"
+        print(f"  • Cache Backend: {cache_backend}")
+        print(f"  • Catalog Directory: {self.catalog_dir or 'Not configured'}")
+        print(
+            f"  • Rate Limit: {self.rate_limit_global_rate:g}/s global, {self.rate_limit_session_rate:g}/s per session"
+        )
         print("=" * 60)
         print()
 
@@ -0,0 +1,110 @@
+"""Graceful shutdown sequence of the server.
+
+On SIGINT or SIGTERM the server stops accepting tool calls at once, then, when the transport
+stops the server:
+
+1. In-flight tool calls are drained until settings.shutdown_timeout_seconds after the signal,
+   calls still running are abandoned.
+2. Background services are stopped and pending cache writes are flushed.
+3. Final statistics are logged.
+4. The upstream connection pool is closed, ending keep-alive connections cleanly.
+
+The HTTP transports wait for open requests for the same timeout before stopping the server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any
+
+from fastmcp import FastMCP
+from fastmcp.utilities import logging
+
+from .cache import response_cache
+from .client import ModelScopeClient
+from .leaderboard import leaderboards
+from .middleware import AdmissionControlMiddleware, DrainMiddleware, MemoizationMiddleware
+from .pool import pool_stats
+from .settings import settings
+
+logger = logging.get_logger(__name__)
+
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def find_middleware(server: FastMCP, middleware_type: type[Any]) -> Any:
+    """Return the server's middleware of a type, None if it is not installed."""
+    return next((m for m in server.middleware if isinstance(m, middleware_type)), None)
+
+
+@contextmanager
+def drain_on_signals(drain: DrainMiddleware) -> Iterator[None]:
+    """Begin draining when a shutdown signal is received, then pass it on to the installed handler.
+
+    Signals can only be handled in the main thread, elsewhere draining begins at shutdown.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    previous_handlers = {sig: signal.getsignal(sig) for sig in SHUTDOWN_SIGNALS}
+
+    def handle_signal(sig: int, frame: FrameType | None) -> None:
+        loop.call_soon_threadsafe(drain.begin_drain)
+        handler = previous_handlers[signal.Signals(sig)]
+        if callable(handler):
+            handler(sig, frame)
+        elif handler == signal.SIG_DFL:
+            # Exit as the default action would, but through the shutdown sequence
+            raise SystemExit(128 + sig)
+
+    for sig in SHUTDOWN_SIGNALS:
+        signal.signal(sig, handle_signal)
+    try:
+        yield
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+
+
+def log_statistics(server: FastMCP) -> None:
+    """Log the final statistics of the caches, admission control and connection pool."""
+    stats = response_cache.stats
+    logger.info(
+        f"Response cache: {stats.hits} hits, {stats.stale_hits} stale hits, {stats.misses} misses, "
+        f"{stats.evictions} evictions"
+    )
+    memo = find_middleware(server, MemoizationMiddleware)
+    if memo is not None:
+        logger.info(f"Memoized tool results: {memo.stats.hits} hits, {memo.stats.misses} misses")
+    admission = find_middleware(server, AdmissionControlMiddleware)
+    if admission is not None:
+        admission_stats = admission.controller.stats
+        logger.info(
+            f"Admission control: {admission_stats.admitted} admitted, {admission_stats.queued} queued, "
+            f"{admission_stats.shed} shed, final limit {admission.controller.limit.value}"
+        )
+    logger.info(
+        f"Connection pool: {pool_stats.requests} requests, peak {pool_stats.max_in_flight} in flight, "
+        f"mean wait {pool_stats.wait_seconds.mean * 1000:.1f}ms, {pool_stats.keepalive_resizes} keep-alive resizes"
+    )
+
+
+async def shutdown(server: FastMCP) -> None:
+    """Drain tool calls, stop background services, flush caches and close the connection pool."""
+    drain = find_middleware(server, DrainMiddleware)
+    if drain is not None:
+        report = await drain.drain(settings.shutdown_timeout_seconds)
+        log = logger.warning if report.abandoned else logger.info
+        log(f"Drained tool calls in {report.duration:.2f}s: {report.completed} completed, {report.abandoned} abandoned")
+
+    await leaderboards.stop()
+    await response_cache.close()
+    log_statistics(server)
+    await ModelScopeClient.close_global_pool()
@@ -0,0 +1,48 @@
+"""ModelScope tokens of the callers of a multi-user deployment.
+
+With tenant tokens enabled, a caller passes its own ModelScope token in a header of its MCP
+requests (see middleware.tenant), and upstream requests made while serving them use that
+token instead of the server's. Each token gets its own client on the shared connection pool
+(see client), and cache entries of user-specific responses are keyed by tenant.
+
+Tenants are identified by a digest of their token, so that tokens never appear in cache keys
+or logs.
+"""
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .settings import settings
+
+# Token of the caller being served, None to use the server's token
+_current_token: ContextVar[str | None] = ContextVar("modelscope_tenant_token", default=None)
+
+
+def get_tenant_token() -> str | None:
+    """Return the token of the caller being served, None if it passed none."""
+    return _current_token.get()
+
+
+def get_tenant_id(token: str | None = None) -> str | None:
+    """Return the tenant of a token, by default the current caller's, None for the server's own token."""
+    token = token or get_tenant_token()
+    if token is None or token == settings.api_token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def has_api_token() -> bool:
+    """Whether upstream requests are authenticated, with the caller's token or the server's."""
+    return get_tenant_token() is not None or settings.is_api_token_configured()
+
+
+@contextmanager
+def use_token(token: str | None) -> Iterator[None]:
+    """Serve upstream requests in the block, and tasks started in it, with a caller's token."""
+    reset_token = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset_token)
@@ -13,6 +13,7 @@ from pydantic import Field
 
 from ..client import get_client
 from ..settings import settings
+from ..tenant import has_api_token
 from ..types import GenerationType, ImageGenerationResult
 
 logger = logging.get_logger(__name__)
@@ -30,6 +31,7 @@ def register_aigc_tools(mcp: FastMCP) -> None:
         annotations={
             "title": "Generate Image",
             "destructiveHint": False,
+            "idempotentHint": False,
         }
     )
     async def generate_image(
@@ -78,7 +80,7 @@ def register_aigc_tools(mcp: FastMCP) -> None:
         if not model:
             raise ValueError("Model name cannot be empty")
 
-        if not settings.is_api_token_configured():
+        if not has_api_token():
             raise ValueError("API token is not set")
 
         # Step 1: submit async generation task
@@ -0,0 +1,221 @@
+"""ModelScope MCP Server Catalog tools.
+
+Provides tools that are served from the local, memory-mapped catalog snapshots
+instead of calling the ModelScope API.
+"""
+
+from typing import Annotated, Any, Literal
+
+from fastmcp import FastMCP
+from fastmcp.utilities import logging
+from pydantic import Field
+
+from ..catalog import analytics, get_catalog
+from ..settings import settings
+from ..types import CatalogAnalyticsResult, CatalogSearchResult, Dataset, Model
+from .model import MODEL_TASK_MAPPING
+
+logger = logging.get_logger(__name__)
+
+# Map sort options to snapshot columns per catalog kind
+CATALOG_SORT_COLUMNS = {
+    "models": {
+        "downloads": "downloads_count",
+        "stars": "stars_count",
+        "gmt_modified": "updated_at",
+    },
+    "datasets": {
+        "downloads": "downloads_count",
+        "likes": "likes_count",
+        "gmt_modified": "updated_at",
+    },
+}
+
+
+def _build_filters(
+    kind: str, task: str | None, support_inference: bool | None
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Translate tool filter arguments into snapshot (where, contains) filters."""
+    if kind != "models" and (task is not None or support_inference is not None):
+        raise ValueError("Task and inference filters are only supported for models")
+
+    where: dict[str, Any] = {}
+    if support_inference is not None:
+        where["support_inference"] = support_inference
+
+    contains: dict[str, str] = {}
+    if task is not None:
+        contains["tasks"] = MODEL_TASK_MAPPING[task]
+
+    return where, contains
+
+
+def register_catalog_tools(mcp: FastMCP) -> None:
+    """Register all local catalog tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+
+    """
+
+    @mcp.tool(
+        annotations={
+            "title": "Search Local Catalog",
+            "readOnlyHint": True,
+        }
+    )
+    async def search_catalog(
+        kind: Annotated[
+            Literal["models", "datasets"],
+            Field(description="Catalog to search"),
+        ] = "models",
+        query: Annotated[
+            str,
+            Field(
+                description="Case-insensitive keyword matched against IDs and Chinese names. "
+                "Leave empty to match all entries."
+            ),
+        ] = "",
+        task: Annotated[
+            Literal["text-generation", "text-to-image", "image-to-image"] | None,
+            Field(description="Task category to filter by (models only)"),
+        ] = None,
+        support_inference: Annotated[
+            bool | None,
+            Field(description="Filter by inference API support (models only)"),
+        ] = None,
+        sort: Annotated[
+            Literal["default", "downloads", "stars", "likes", "gmt_modified"],
+            Field(description="Sort order, 'stars' applies to models and 'likes' to datasets"),
+        ] = "default",
+        limit: Annotated[int, Field(description="Maximum number of entries to return", ge=1, le=100)] = 10,
+    ) -> CatalogSearchResult:
+        """Search the local catalog snapshot of ModelScope models or datasets.
+
+        Much faster than the online search tools, but only as fresh as the last snapshot build.
+        """
+        snapshot = get_catalog(kind)
+        if snapshot is None:
+            raise ValueError(f"Local {kind} catalog is not available, no snapshot in {settings.catalog_dir}")
+
+        where, contains = _build_filters(kind, task, support_inference)
+
+        sort_by = None
+        if sort != "default":
+            sort_by = CATALOG_SORT_COLUMNS[kind].get(sort)
+            if sort_by is None:
+                raise ValueError(f"Sort order '{sort}' is not supported for {kind}")
+
+        total_count, row_indexes = snapshot.search(
+            query=query,
+            where=where,
+            contains=contains,
+            sort_by=sort_by,
+            limit=limit,
+        )
+
+        result = CatalogSearchResult(
+            kind=kind,
+            snapshot_created_at=int(snapshot.created_at),
+            total_count=total_count,
+        )
+
+        for index in row_indexes:
+            row = snapshot.row(index)
+            modelscope_url = f"{settings.main_domain}/{kind}/{row['path']}/{row['name']}"
+            if kind == "models":
+                row.pop("tasks", None)
+                result.models.append(Model(modelscope_url=modelscope_url, **row))
+            else:
+                result.datasets.append(Dataset(modelscope_url=modelscope_url, **row))
+
+        return result
+
+    @mcp.tool(
+        annotations={
+            "title": "Analyze Local Catalog",
+            "readOnlyHint": True,
+        }
+    )
+    async def analyze_catalog(
+        operation: Annotated[
+            Literal["group_by", "top_k", "histogram", "percentiles"],
+            Field(
+                description="Analytics to run: 'group_by' counts entries (and sums/averages the metric) per value "
+                "of a column, 'top_k' lists entries with the highest metric, 'histogram' buckets the metric, "
+                "'percentiles' computes metric percentiles"
+            ),
+        ],
+        kind: Annotated[
+            Literal["models", "datasets"],
+            Field(description="Catalog to analyze"),
+        ] = "models",
+        column: Annotated[
+            Literal["license", "created_by", "path", "support_inference"] | None,
+            Field(description="Column to group by (required for 'group_by')"),
+        ] = None,
+        metric: Annotated[
+            Literal["downloads_count", "stars_count", "likes_count", "created_at", "updated_at"] | None,
+            Field(description="Numeric column to aggregate (required except for 'group_by')"),
+        ] = None,
+        query: Annotated[
+            str,
+            Field(description="Case-insensitive keyword filter on IDs and Chinese names"),
+        ] = "",
+        task: Annotated[
+            Literal["text-generation", "text-to-image", "image-to-image"] | None,
+            Field(description="Task category to filter by (models only)"),
+        ] = None,
+        support_inference: Annotated[
+            bool | None,
+            Field(description="Filter by inference API support (models only)"),
+        ] = None,
+        limit: Annotated[int, Field(description="Maximum number of groups or entries to return", ge=1, le=100)] = 10,
+        bins: Annotated[int, Field(description="Number of histogram bins", ge=1, le=100)] = 10,
+        log_scale: Annotated[bool, Field(description="Use log-spaced histogram bins")] = False,
+        percentiles: Annotated[
+            list[Annotated[float, Field(ge=0, le=100)]] | None,
+            Field(description="Percentiles to compute, between 0 and 100 (default: 50, 90, 99)"),
+        ] = None,
+    ) -> CatalogAnalyticsResult:
+        """Run aggregate analytics over the local catalog snapshot of ModelScope models or datasets.
+
+        Answers questions such as "top licenses among text-to-image models" or
+        "download distribution of inference-capable models" in a single call.
+        """
+        if not analytics.is_available():
+            raise ValueError("Catalog analytics require NumPy, install the 'analytics' extra")
+
+        snapshot = get_catalog(kind)
+        if snapshot is None:
+            raise ValueError(f"Local {kind} catalog is not available")
+
+        for name in (column, metric):
+            if name is not None and name not in snapshot.column_names:
+                raise ValueError(f"Column '{name}' is not available for {kind}")
+
+        where, contains = _build_filters(kind, task, support_inference)
+        mask = analytics.build_mask(snapshot, query=query, where=where, contains=contains)
+
+        if operation == "group_by":
+            if column is None:
+                raise ValueError("Column is required for 'group_by'")
+            columns, rows = analytics.group_by(snapshot, mask, column, metric, limit)
+        else:
+            if metric is None:
+                raise ValueError(f"Metric is required for '{operation}'")
+            if operation == "top_k":
+                columns, rows = analytics.top_k(snapshot, mask, metric, limit)
+            elif operation == "histogram":
+                columns, rows = analytics.histogram(snapshot, mask, metric, bins, log_scale)
+            else:
+                columns, rows = analytics.percentiles(snapshot, mask, metric, percentiles or [50, 90, 99])
+
+        return CatalogAnalyticsResult(
+            kind=kind,
+            operation=operation,
+            snapshot_created_at=int(snapshot.created_at),
+            matched_count=int(mask.sum()),
+            columns=columns,
+            rows=rows,
+        )
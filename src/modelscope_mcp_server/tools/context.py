@@ -9,13 +9,19 @@ from httpx import HTTPStatusError
 
 from modelscope_mcp_server.client import get_client
 
+from ..pool import Histogram, pool_stats
 from ..settings import settings
-from ..types import EnvironmentInfo, UserInfo
+from ..tenant import has_api_token
+from ..types import ConnectionPoolInfo, EnvironmentInfo, HistogramInfo, UserInfo
 from ..utils.metadata import get_fastmcp_version, get_mcp_protocol_version, get_python_version, get_server_version
 
 logger = logging.get_logger(__name__)
 
 
+def _histogram_info(histogram: Histogram) -> HistogramInfo:
+    return HistogramInfo(buckets=histogram.cumulative(), count=histogram.count, sum=histogram.sum)
+
+
 def register_context_tools(mcp: FastMCP) -> None:
     """Register all context-related tools with the MCP server.
 
@@ -36,7 +42,7 @@ def register_context_tools(mcp: FastMCP) -> None:
         Use this when a request is about the user's own profile for ModelScope.
         Or when information is missing to build other tool calls.
         """
-        if not settings.is_api_token_configured():
+        if not has_api_token():
             return UserInfo(authenticated=False, reason="API token is not set")
 
         url = f"{settings.main_domain}/api/v1/users/login/info"
@@ -75,8 +81,8 @@ def register_context_tools(mcp: FastMCP) -> None:
     async def get_environment_info() -> EnvironmentInfo:
         """Get current MCP server environment information.
 
-        Returns version information for the server, FastMCP framework, MCP protocol, and Python runtime.
-        Useful for debugging and compatibility checking.
+        Returns version information for the server, FastMCP framework, MCP protocol, and Python runtime,
+        and upstream connection pool statistics. Useful for debugging and compatibility checking.
         """
         return EnvironmentInfo(
             server_version=get_server_version(),
@@ -87,4 +93,11 @@ def register_context_tools(mcp: FastMCP) -> None:
             api_inference_domain=settings.api_inference_domain,
             default_text_to_image_model=settings.default_text_to_image_model,
             default_image_to_image_model=settings.default_image_to_image_model,
+            connection_pool=ConnectionPoolInfo(
+                requests=pool_stats.requests,
+                max_in_flight=pool_stats.max_in_flight,
+                keepalive_resizes=pool_stats.keepalive_resizes,
+                wait_seconds=_histogram_info(pool_stats.wait_seconds),
+                utilization=_histogram_info(pool_stats.utilization),
+            ),
         )
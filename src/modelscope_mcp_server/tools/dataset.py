@@ -4,18 +4,80 @@ Provides tools for dataset-related operations in the ModelScope MCP Server,
 such as searching for datasets and retrieving dataset details.
 """
 
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.utilities import logging
 from pydantic import Field
 
+from ..cache import CachePolicy
 from ..client import get_client
+from ..leaderboard import ALL_CATEGORY, leaderboards
 from ..settings import settings
+from ..tenant import get_tenant_id
 from ..types import Dataset
+from ..utils.mapping import ResultMapping, Source
+from ..utils.projection import describe_fields, validate_fields
+from ..utils.table import FORMAT_DESCRIPTION, OutputFormat, Results, format_page, format_results
 
 logger = logging.get_logger(__name__)
 
+SEARCH_DATASETS_CACHE = CachePolicy(
+    "search_datasets", per_tenant=True, is_empty=lambda response: not response.get("Data")
+)
+
+DATASET_MAPPING = ResultMapping(
+    Dataset,
+    {
+        "id": lambda data: f"{data['Namespace']}/{data['Name']}",
+        "path": "Namespace",
+        "name": "Name",
+        "chinese_name": Source("ChineseName", ""),
+        "created_by": Source("CreatedBy", ""),
+        "license": Source("License", ""),
+        "modelscope_url": lambda data: f"{settings.main_domain}/datasets/{data['Namespace']}/{data['Name']}",
+        "downloads_count": Source("Downloads", 0),
+        "likes_count": Source("Likes", 0),
+        "created_at": Source("GmtCreate", 0),
+        "updated_at": Source("LastUpdatedTime", 0),
+    },
+    required=("Namespace", "Name"),
+)
+
+
+async def fetch_datasets_data(
+    query: str = "",
+    sort: str = "default",
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Search for datasets on ModelScope, returning the raw upstream items."""
+    url = f"{settings.main_domain}/api/v1/dolphin/datasets"
+
+    params = {
+        "Query": query,
+        "Sort": sort,
+        "PageNumber": 1,
+        "PageSize": limit,
+    }
+
+    client = get_client()
+    response = await client.get(url, params=params, cache=SEARCH_DATASETS_CACHE)
+
+    return response.get("Data", [])
+
+
+async def fetch_datasets(
+    query: str = "",
+    sort: str = "default",
+    limit: int = 10,
+) -> list[Dataset]:
+    """Search for datasets on ModelScope and map the results.
+
+    Shared by the corresponding search tool and other server components.
+    """
+    datasets_data = await fetch_datasets_data(query=query, sort=sort, limit=limit)
+    return DATASET_MAPPING.map_page(datasets_data)
+
 
 def register_dataset_tools(mcp: FastMCP) -> None:
     """Register all dataset-related tools with the MCP server.
@@ -28,6 +90,7 @@ def register_dataset_tools(mcp: FastMCP) -> None:
     @mcp.tool(
         annotations={
             "title": "Search Datasets",
+            "readOnlyHint": True,
         }
     )
     async def search_datasets(
@@ -43,45 +106,17 @@ def register_dataset_tools(mcp: FastMCP) -> None:
             Field(description="Sort order"),
         ] = "default",
         limit: Annotated[int, Field(description="Maximum number of datasets to return", ge=1, le=30)] = 10,
-    ) -> list[Dataset]:
+        fields: Annotated[list[str] | None, Field(description=describe_fields(Dataset, "dataset"))] = None,
+        format: Annotated[OutputFormat, Field(description=FORMAT_DESCRIPTION)] = "objects",
+    ) -> Results[Dataset]:
         """Search for datasets on ModelScope."""
-        url = f"{settings.main_domain}/api/v1/dolphin/datasets"
+        projection = validate_fields(Dataset, fields)
 
-        params = {
-            "Query": query,
-            "Sort": sort,
-            "PageNumber": 1,
-            "PageSize": limit,
-        }
+        # Serve the most downloaded datasets from the precomputed leaderboard when possible, except to tenants
+        if get_tenant_id() is None and not query and sort == "downloads":
+            view = leaderboards.lookup("datasets", ALL_CATEGORY, limit)
+            if view is not None:
+                return format_results(view.items[:limit], Dataset, projection, format)
 
-        client = get_client()
-        response = await client.get(url, params=params)
-
-        datasets_data = response.get("Data", [])
-
-        datasets = []
-        for dataset_data in datasets_data:
-            path = dataset_data.get("Namespace", "")
-            name = dataset_data.get("Name", "")
-            modelscope_url = f"{settings.main_domain}/datasets/{path}/{name}"
-
-            if not path or not name:
-                logger.warning(f"Skipping dataset with invalid path or name: {dataset_data}")
-                continue
-
-            dataset = Dataset(
-                id=f"{path}/{name}",
-                path=path,
-                name=name,
-                chinese_name=dataset_data.get("ChineseName", ""),
-                created_by=dataset_data.get("CreatedBy", ""),
-                license=dataset_data.get("License", ""),
-                modelscope_url=modelscope_url,
-                downloads_count=dataset_data.get("Downloads", 0),
-                likes_count=dataset_data.get("Likes", 0),
-                created_at=dataset_data.get("GmtCreate", 0),
-                updated_at=dataset_data.get("LastUpdatedTime", 0),
-            )
-            datasets.append(dataset)
-
-        return datasets
+        datasets_data = await fetch_datasets_data(query=query, sort=sort, limit=limit)
+        return format_page(DATASET_MAPPING, datasets_data, projection, format)
@@ -0,0 +1,69 @@
+"""ModelScope MCP Server Leaderboard tools.
+
+Provides tools for ranked views of ModelScope resources, such as the most downloaded models
+per task category, served from precomputed in-memory leaderboards.
+"""
+
+from typing import Annotated, Literal
+
+from fastmcp import FastMCP
+from fastmcp.utilities import logging
+from pydantic import Field
+
+from ..leaderboard import ALL_CATEGORY, leaderboards
+from ..types import Leaderboard
+
+logger = logging.get_logger(__name__)
+
+
+def register_leaderboard_tools(mcp: FastMCP) -> None:
+    """Register all leaderboard-related tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+
+    """
+
+    @mcp.tool(
+        annotations={
+            "title": "Get Leaderboard",
+            "readOnlyHint": True,
+        }
+    )
+    async def get_leaderboard(
+        board: Annotated[
+            Literal["models", "datasets", "studios", "papers"],
+            Field(
+                description="Leaderboard to get: models and datasets are ranked by downloads, "
+                "studios by visits and papers by popularity"
+            ),
+        ],
+        category: Annotated[
+            Literal[
+                "all",
+                "text-generation",
+                "text-to-image",
+                "image-to-image",
+                "multi-modal",
+                "cv",
+                "nlp",
+                "audio",
+                "AutoML",
+            ],
+            Field(description="Task category (models only) or domain (studios only), 'all' for no filter"),
+        ] = ALL_CATEGORY,
+        limit: Annotated[int, Field(description="Maximum number of entries to return", ge=1, le=30)] = 10,
+    ) -> Leaderboard:
+        """Get a ranked leaderboard of ModelScope resources.
+
+        Served from memory and refreshed periodically, check `refreshed_at` for freshness.
+        """
+        view = await leaderboards.get(board, category)
+
+        return Leaderboard(
+            board=view.board,
+            category=view.category,
+            ranked_by=view.ranked_by,
+            refreshed_at=int(view.refreshed_at),
+            **{board: view.items[:limit]},
+        )
@@ -3,18 +3,150 @@
 Provides tools for MCP-related operations in the ModelScope MCP Server, such as searching for MCP servers.
 """
 
-from typing import Annotated, Literal
+import asyncio
+from collections.abc import Mapping
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.utilities import logging
 from pydantic import Field
 
+from ..cache import CachePolicy
 from ..client import get_client
+from ..constants import DEFAULT_README_CHUNK_BYTES
 from ..settings import settings
-from ..types import McpServer, McpServerDetail
+from ..types import McpServer, McpServerDetail, McpServerDetailResult, ReadmeChunk
+from ..utils.mapping import ResultMapping, Source
+from ..utils.projection import Projected, describe_fields, validate_fields
+from ..utils.readme import get_outline, get_preview, get_size, read_bytes
+from ..utils.table import FORMAT_DESCRIPTION, OutputFormat, Results, format_page
 
 logger = logging.get_logger(__name__)
 
+SEARCH_MCP_SERVERS_CACHE = CachePolicy(
+    "search_mcp_servers", is_empty=lambda response: not response.get("data", {}).get("mcp_server_list")
+)
+GET_MCP_SERVER_DETAIL_CACHE = CachePolicy(
+    "get_mcp_server_detail", per_tenant=True, is_empty=lambda response: not response.get("data")
+)
+
+MCP_SERVER_MAPPING = ResultMapping(
+    McpServer,
+    {
+        "id": Source("id", ""),
+        "name": Source("name", ""),
+        "description": Source("description", ""),
+        "tags": lambda data: data.get("tags", []),
+        "logo_url": "logo_url",
+        "modelscope_url": lambda data: f"{settings.main_domain}/mcp/servers/{data.get('id', '')}",
+        "view_count": Source("view_count", 0),
+    },
+)
+
+
+def get_readme(data: Mapping[str, Any]) -> str:
+    """Return the README of an upstream MCP server item."""
+    return data.get("readme") or ""
+
+
+# The README is cut to a preview of `settings.readme_preview_bytes` and comes with its outline,
+# the rest can be fetched with get_mcp_server_readme
+MCP_SERVER_DETAIL_MAPPING = ResultMapping(
+    McpServerDetail,
+    {
+        **MCP_SERVER_MAPPING.fields,
+        "author": Source("author", ""),
+        "server_config": lambda data: data.get("server_config", []),
+        "env_schema": lambda data: data.get("env_schema", {}),
+        "is_hosted": Source("is_hosted", False),
+        "is_verified": Source("is_verified", False),
+        "source_url": Source("source_url", ""),
+        "github_stars": Source("github_stars", 0),
+        "readme": lambda data: get_preview(get_readme(data), settings.readme_preview_bytes)[0],
+        "readme_size": lambda data: get_size(get_readme(data)),
+        "readme_truncated": lambda data: get_preview(get_readme(data), settings.readme_preview_bytes)[1],
+        "readme_outline": lambda data: get_outline(get_readme(data)),
+    },
+)
+
+# Maximum number of IDs per batch detail lookup
+MAX_BATCH_SERVER_IDS = 50
+
+# Maximum README bytes per chunk request
+MAX_README_CHUNK_BYTES = 65536
+
+
+def get_mcp_server_detail_url(server_id: str) -> str:
+    """Return the API URL for the details of an MCP server."""
+    return f"{settings.main_domain}/openapi/v1/mcp/servers/{server_id}"
+
+
+def prefetch_mcp_server_details(servers_data: list[dict[str, Any]]) -> None:
+    """Prefetch the details of the top search hits, which are the usual follow-up lookups."""
+    client = get_client()
+    for server_data in servers_data[: settings.prefetch_mcp_server_details]:
+        client.prefetch(get_mcp_server_detail_url(server_data.get("id", "")), cache=GET_MCP_SERVER_DETAIL_CACHE)
+
+
+async def fetch_mcp_servers_data(
+    search: str = "",
+    category: str | None = None,
+    is_hosted: bool | None = None,
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Search for MCP servers on ModelScope, returning the raw upstream items."""
+    url = f"{settings.main_domain}/openapi/v1/mcp/servers"
+
+    # Build filter object
+    filter_obj = {}
+    if category is not None:
+        filter_obj["category"] = category
+    if is_hosted is not None:
+        filter_obj["is_hosted"] = is_hosted
+
+    request_data = {
+        "filter": filter_obj,
+        "page_number": 1,
+        "page_size": limit,
+        "search": search,
+    }
+
+    client = get_client()
+    response = await client.put(url, request_data, cache=SEARCH_MCP_SERVERS_CACHE)
+
+    return response.get("data", {}).get("mcp_server_list", [])
+
+
+async def fetch_mcp_servers(
+    search: str = "",
+    category: str | None = None,
+    is_hosted: bool | None = None,
+    limit: int = 10,
+) -> list[McpServer]:
+    """Search for MCP servers on ModelScope and map the results.
+
+    Shared by the corresponding search tool and other server components.
+    """
+    servers_data = await fetch_mcp_servers_data(search=search, category=category, is_hosted=is_hosted, limit=limit)
+    return MCP_SERVER_MAPPING.map_page(servers_data)
+
+
+async def fetch_mcp_server_data(server_id: str) -> dict:
+    """Get the raw details of an MCP server on ModelScope, served from the response cache when possible."""
+    url = get_mcp_server_detail_url(server_id)
+
+    client = get_client()
+    response = await client.get(url, cache=GET_MCP_SERVER_DETAIL_CACHE)
+    return response.get("data", {})
+
+
+async def fetch_mcp_server_detail(server_id: str) -> McpServerDetail:
+    """Get the details of an MCP server on ModelScope and map the result.
+
+    Shared by the single and batch detail tools.
+    """
+    return MCP_SERVER_DETAIL_MAPPING.map_item(await fetch_mcp_server_data(server_id))
+
 
 def register_mcp_tools(mcp: FastMCP) -> None:
     """Register all MCP-related tools with the MCP server.
@@ -27,6 +159,7 @@ def register_mcp_tools(mcp: FastMCP) -> None:
     @mcp.tool(
         annotations={
             "title": "Search MCP Servers",
+            "readOnlyHint": True,
         }
     )
     async def search_mcp_servers(
@@ -61,86 +194,125 @@ def register_mcp_tools(mcp: FastMCP) -> None:
             Field(description="Filter by hosted status"),
         ] = None,
         limit: Annotated[int, Field(description="Maximum number of servers to return", ge=1, le=100)] = 10,
-    ) -> list[McpServer]:
+        fields: Annotated[list[str] | None, Field(description=describe_fields(McpServer, "server"))] = None,
+        format: Annotated[OutputFormat, Field(description=FORMAT_DESCRIPTION)] = "objects",
+    ) -> Results[McpServer]:
         """Search for MCP servers on ModelScope."""
-        url = f"{settings.main_domain}/openapi/v1/mcp/servers"
-
-        # Build filter object
-        filter_obj = {}
-        if category is not None:
-            filter_obj["category"] = category
-        if is_hosted is not None:
-            filter_obj["is_hosted"] = is_hosted
-
-        request_data = {
-            "filter": filter_obj,
-            "page_number": 1,
-            "page_size": limit,
-            "search": search,
-        }
+        projection = validate_fields(McpServer, fields)
+        servers_data = await fetch_mcp_servers_data(search=search, category=category, is_hosted=is_hosted, limit=limit)
+        prefetch_mcp_server_details(servers_data)
+        return format_page(MCP_SERVER_MAPPING, servers_data, projection, format)
 
-        client = get_client()
-        response = await client.put(url, request_data)
+    @mcp.tool(
+        annotations={
+            "title": "Get MCP Server Detail",
+            "readOnlyHint": True,
+        }
+    )
+    async def get_mcp_server_detail(
+        server_id: Annotated[
+            str,
+            Field(description="MCP Server's unique ID, for example '@modelscope/modelscope-mcp-server'"),
+        ],
+        fields: Annotated[list[str] | None, Field(description=describe_fields(McpServerDetail, "server"))] = None,
+    ) -> Projected[McpServerDetail]:
+        """Get detailed information about a specific MCP server."""
+        projection = validate_fields(McpServerDetail, fields)
+        server_data = await fetch_mcp_server_data(server_id)
+        return MCP_SERVER_DETAIL_MAPPING.select(projection).map_item(server_data)
 
-        servers_data = response.get("data", {}).get("mcp_server_list", [])
+    @mcp.tool(
+        annotations={
+            "title": "Get MCP Server Details",
+            "readOnlyHint": True,
+        }
+    )
+    async def get_mcp_server_details(
+        server_ids: Annotated[
+            list[str],
+            Field(
+                description="MCP Server IDs, for example ['@modelscope/modelscope-mcp-server']",
+                min_length=1,
+                max_length=MAX_BATCH_SERVER_IDS,
+            ),
+        ],
+    ) -> list[McpServerDetailResult]:
+        """Get detailed information about multiple MCP servers in one call.
 
-        servers = []
-        for server_data in servers_data:
-            id = server_data.get("id", "")
-            modelscope_url = f"{settings.main_domain}/mcp/servers/{id}"
+        Results are returned in input order; a failed lookup reports its error without failing the others.
+        """
+        semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
 
-            server = McpServer(
-                id=id,
-                name=server_data.get("name", ""),
-                description=server_data.get("description", ""),
-                tags=server_data.get("tags", []),
-                logo_url=server_data.get("logo_url"),
-                modelscope_url=modelscope_url,
-                view_count=server_data.get("view_count", 0),
-            )
-            servers.append(server)
+        async def fetch_one(server_id: str) -> McpServerDetailResult:
+            async with semaphore:
+                try:
+                    detail = await fetch_mcp_server_detail(server_id)
+                except Exception as e:
+                    logger.warning(f"Failed to get MCP server detail for {server_id}: {e}")
+                    return McpServerDetailResult(server_id=server_id, error=str(e))
+            return McpServerDetailResult(server_id=server_id, detail=detail)
 
-        return servers
+        return await asyncio.gather(*(fetch_one(server_id) for server_id in server_ids))
 
     @mcp.tool(
         annotations={
-            "title": "Get MCP Server Detail",
+            "title": "Get MCP Server README",
+            "readOnlyHint": True,
         }
     )
-    async def get_mcp_server_detail(
+    async def get_mcp_server_readme(
         server_id: Annotated[
             str,
             Field(description="MCP Server's unique ID, for example '@modelscope/modelscope-mcp-server'"),
         ],
-    ) -> McpServerDetail:
-        """Get detailed information about a specific MCP server."""
-        url = f"{settings.main_domain}/openapi/v1/mcp/servers/{server_id}"
-
-        client = get_client()
-        response = await client.get(url)
-        server_data = response.get("data", {})
-
-        id = server_data.get("id", "")
-        modelscope_url = f"{settings.main_domain}/mcp/servers/{id}"
-
-        server_detail = McpServerDetail(
-            # McpServer fields
-            id=id,
-            name=server_data.get("name", ""),
-            description=server_data.get("description", ""),
-            tags=server_data.get("tags", []),
-            logo_url=server_data.get("logo_url"),
-            modelscope_url=modelscope_url,
-            view_count=server_data.get("view_count", 0),
-            # Additional fields
-            author=server_data.get("author", ""),
-            server_config=server_data.get("server_config", []),
-            env_schema=server_data.get("env_schema", {}),
-            is_hosted=server_data.get("is_hosted", False),
-            is_verified=server_data.get("is_verified", False),
-            source_url=server_data.get("source_url", ""),
-            readme=server_data.get("readme", ""),
-            github_stars=server_data.get("github_stars", 0),
-        )
+        sections: Annotated[
+            list[int] | None,
+            Field(description="Indexes of README sections to fetch, as listed in the detail's readme_outline"),
+        ] = None,
+        offset: Annotated[int, Field(description="Byte offset to read from, if no sections are given", ge=0)] = 0,
+        length: Annotated[
+            int,
+            Field(description="Number of bytes to read, if no sections are given", ge=1, le=MAX_README_CHUNK_BYTES),
+        ] = DEFAULT_README_CHUNK_BYTES,
+    ) -> ReadmeChunk:
+        """Get specific sections or a byte range of an MCP server's README.
+
+        Use the readme_outline from get_mcp_server_detail to pick sections.
+        """
+        server_data = await fetch_mcp_server_data(server_id)
+        readme = server_data.get("readme") or ""
+        total_size = get_size(readme)
+
+        if not sections:
+            end = min(offset + length, total_size)
+            start = min(offset, end)
+            return ReadmeChunk(
+                server_id=server_id,
+                content=read_bytes(readme, start, end),
+                start=start,
+                end=end,
+                total_size=total_size,
+            )
 
-        return server_detail
+        outline = get_outline(readme)
+        invalid = [index for index in sections if not 0 <= index < len(outline)]
+        if invalid:
+            raise ValueError(f"Unknown README sections {invalid}, the README has {len(outline)} sections")
+
+        # Merge overlapping ranges, so a section requested along with its parent is returned once
+        selected = [outline[index] for index in sorted(set(sections))]
+        ranges: list[list[int]] = []
+        for section in selected:
+            section_end = section.start + section.size
+            if ranges and section.start < ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], section_end)
+            else:
+                ranges.append([section.start, section_end])
+
+        # The sections may be disjoint, so the content has no single byte range: see each section's offsets
+        return ReadmeChunk(
+            server_id=server_id,
+            content="".join(read_bytes(readme, start, end) for start, end in ranges),
+            total_size=total_size,
+            sections=selected,
+        )
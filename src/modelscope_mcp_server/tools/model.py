@@ -4,18 +4,126 @@ Provides tools for model-related operations in the ModelScope MCP Server,
 such as searching for models and retrieving model details.
 """
 
-from typing import Annotated, Literal
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.utilities import logging
 from pydantic import Field
 
+from ..cache import CachePolicy
 from ..client import get_client
+from ..leaderboard import ALL_CATEGORY, leaderboards
 from ..settings import settings
+from ..tenant import get_tenant_id
 from ..types import Model
+from ..utils.mapping import ResultMapping, Source
+from ..utils.projection import describe_fields, validate_fields
+from ..utils.table import FORMAT_DESCRIPTION, OutputFormat, Results, format_page, format_results
 
 logger = logging.get_logger(__name__)
 
+SEARCH_MODELS_CACHE = CachePolicy(
+    "search_models",
+    per_tenant=True,
+    is_empty=lambda response: not response.get("Data", {}).get("Model", {}).get("Models"),
+)
+
+MODEL_MAPPING = ResultMapping(
+    Model,
+    {
+        "id": lambda data: f"{data['Path']}/{data['Name']}",
+        "path": "Path",
+        "name": "Name",
+        "chinese_name": Source("ChineseName", ""),
+        "created_by": "CreatedBy",
+        "license": Source("License", ""),
+        "modelscope_url": lambda data: f"{settings.main_domain}/models/{data['Path']}/{data['Name']}",
+        # Non-empty value means True, else False
+        "support_inference": Source("SupportInference", "", bool),
+        "downloads_count": Source("Downloads", 0),
+        "stars_count": Source("Stars", 0),
+        "created_at": Source("CreatedTime", 0),
+        "updated_at": Source("LastUpdatedTime", 0),
+    },
+    required=("Path", "Name"),
+)
+
+# Map task to API values
+MODEL_TASK_MAPPING = {
+    "text-generation": "text-generation",
+    "text-to-image": "text-to-image-synthesis",
+    "image-to-image": "image-to-image",
+}
+
+
+async def fetch_models_data(
+    query: str = "",
+    task: str | None = None,
+    filters: Sequence[str] | None = None,
+    sort: str = "Default",
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Search for models on ModelScope, returning the raw upstream items."""
+    url = f"{settings.main_domain}/api/v1/dolphin/models"
+
+    # Build criterion for task filter
+    criterion = []
+    if task:
+        api_task_value = MODEL_TASK_MAPPING.get(task)
+        if api_task_value:
+            criterion.append(
+                {
+                    "category": "tasks",
+                    "predicate": "contains",
+                    "values": [api_task_value],
+                    "sub_values": [],
+                }
+            )
+
+    # Build single criterion based on filters parameter
+    single_criterion = []
+    if filters:
+        for filter_type in filters:
+            if filter_type == "support_inference":
+                single_criterion.append(
+                    {
+                        "category": "inference_type",
+                        "DateType": "int",
+                        "predicate": "equal",
+                        "IntValue": 1,
+                    }
+                )
+
+    request_data = {
+        "Name": query,
+        "Criterion": criterion,
+        "SingleCriterion": single_criterion,
+        "SortBy": sort,
+        "PageNumber": 1,
+        "PageSize": limit,
+    }
+
+    client = get_client()
+    response = await client.put(url, request_data, cache=SEARCH_MODELS_CACHE)
+
+    return response.get("Data", {}).get("Model", {}).get("Models", [])
+
+
+async def fetch_models(
+    query: str = "",
+    task: str | None = None,
+    filters: Sequence[str] | None = None,
+    sort: str = "Default",
+    limit: int = 10,
+) -> list[Model]:
+    """Search for models on ModelScope and map the results.
+
+    Shared by the corresponding search tool and other server components.
+    """
+    models_data = await fetch_models_data(query=query, task=task, filters=filters, sort=sort, limit=limit)
+    return MODEL_MAPPING.map_page(models_data)
+
 
 def register_model_tools(mcp: FastMCP) -> None:
     """Register all model-related tools with the MCP server.
@@ -28,6 +136,7 @@ def register_model_tools(mcp: FastMCP) -> None:
     @mcp.tool(
         annotations={
             "title": "Search Models",
+            "readOnlyHint": True,
         }
     )
     async def search_models(
@@ -51,83 +160,18 @@ def register_model_tools(mcp: FastMCP) -> None:
             Field(description="Sort order"),
         ] = "Default",
         limit: Annotated[int, Field(description="Maximum number of models to return", ge=1, le=30)] = 10,
-    ) -> list[Model]:
+        fields: Annotated[list[str] | None, Field(description=describe_fields(Model, "model"))] = None,
+        format: Annotated[OutputFormat, Field(description=FORMAT_DESCRIPTION)] = "objects",
+    ) -> Results[Model]:
         """Search for models on ModelScope."""
-        url = f"{settings.main_domain}/api/v1/dolphin/models"
-
-        # Build criterion for task filter
-        criterion = []
-        if task:
-            # Map task to API values
-            task_mapping = {
-                "text-generation": "text-generation",
-                "text-to-image": "text-to-image-synthesis",
-                "image-to-image": "image-to-image",
-            }
-            api_task_value = task_mapping.get(task)
-            if api_task_value:
-                criterion.append(
-                    {
-                        "category": "tasks",
-                        "predicate": "contains",
-                        "values": [api_task_value],
-                        "sub_values": [],
-                    }
-                )
-
-        # Build single criterion based on filters parameter
-        single_criterion = []
-        if filters:
-            for filter_type in filters:
-                if filter_type == "support_inference":
-                    single_criterion.append(
-                        {
-                            "category": "inference_type",
-                            "DateType": "int",
-                            "predicate": "equal",
-                            "IntValue": 1,
-                        }
-                    )
-
-        request_data = {
-            "Name": query,
-            "Criterion": criterion,
-            "SingleCriterion": single_criterion,
-            "SortBy": sort,
-            "PageNumber": 1,
-            "PageSize": limit,
-        }
+        projection = validate_fields(Model, fields)
 
-        client = get_client()
-        response = await client.put(url, request_data)
-
-        models_data = response.get("Data", {}).get("Model", {}).get("Models", [])
-
-        models = []
-        for model_data in models_data:
-            path = model_data.get("Path", "")
-            name = model_data.get("Name", "")
-            modelscope_url = f"{settings.main_domain}/models/{path}/{name}"
-
-            if not path or not name:
-                logger.warning(f"Skipping model with invalid path or name: {model_data}")
-                continue
-
-            model = Model(
-                id=f"{path}/{name}",
-                path=path,
-                name=name,
-                chinese_name=model_data.get("ChineseName", ""),
-                created_by=model_data.get("CreatedBy"),
-                license=model_data.get("License", ""),
-                modelscope_url=modelscope_url,
-                # Non-empty value means True, else False
-                support_inference=bool(model_data.get("SupportInference", "")),
-                downloads_count=model_data.get("Downloads", 0),
-                stars_count=model_data.get("Stars", 0),
-                created_at=model_data.get("CreatedTime", 0),
-                updated_at=model_data.get("LastUpdatedTime", 0),
-            )
-            models.append(model)
+        # Serve the most downloaded models from the precomputed leaderboard when possible,
+        # which is fetched with the server's token and so not used for tenant callers
+        if get_tenant_id() is None and not query and not filters and sort == "DownloadsCount":
+            view = leaderboards.lookup("models", task or ALL_CATEGORY, limit)
+            if view is not None:
+                return format_results(view.items[:limit], Model, projection, format)
 
-        return models
+        models_data = await fetch_models_data(query=query, task=task, filters=filters, sort=sort, limit=limit)
+        return format_page(MODEL_MAPPING, models_data, projection, format)
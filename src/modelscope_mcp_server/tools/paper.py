@@ -3,18 +3,135 @@
 Provides MCP tools for paper-related operations, such as searching for papers, getting paper details, etc.
 """
 
-from typing import Annotated, Literal
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.utilities import logging
 from pydantic import Field
 
+from ..cache import CachePolicy
 from ..client import get_client
+from ..leaderboard import ALL_CATEGORY, leaderboards
 from ..settings import settings
+from ..tenant import get_tenant_id
 from ..types import Paper
+from ..utils.mapping import ResultMapping
+from ..utils.projection import describe_fields, validate_fields
+from ..utils.table import FORMAT_DESCRIPTION, OutputFormat, Results, format_page, format_results
+from ..utils.text import truncate_at_word
 
 logger = logging.get_logger(__name__)
 
+SEARCH_PAPERS_CACHE = CachePolicy("search_papers", is_empty=lambda response: not response.get("Data", {}).get("Papers"))
+
+PAPER_MAPPING = ResultMapping(
+    Paper,
+    {
+        "arxiv_id": "ArxivId",
+        "title": "Title",
+        "authors": "Authors",
+        "publish_date": "PublishDate",
+        "abstract_cn": "AbstractCn",
+        "abstract_en": "AbstractEn",
+        "modelscope_url": lambda data: f"{settings.main_domain}/papers/{data.get('ArxivId')}",
+        "arxiv_url": "ArxivUrl",
+        "pdf_url": "PdfUrl",
+        "code_link": "CodeLink",
+        "view_count": "ViewCount",
+        "favorite_count": "FavoriteCount",
+        "comment_count": "CommentTotalCount",
+    },
+)
+
+# Abstract fields returned for each abstract_lang value
+ABSTRACT_FIELDS = {
+    "cn": ("abstract_cn",),
+    "en": ("abstract_en",),
+    "both": ("abstract_cn", "abstract_en"),
+    "none": (),
+}
+
+
+@lru_cache(maxsize=4096)
+def shorten_abstract(abstract: str, max_chars: int) -> str:
+    """Truncate an abstract at a word boundary.
+
+    Memoized per abstract and limit, since the same papers are served repeatedly from the
+    response cache and the leaderboard.
+    """
+    return truncate_at_word(abstract, max_chars)
+
+
+def shorten_abstracts(papers: list[Paper], abstract_fields: tuple[str, ...], max_chars: int | None) -> list[Paper]:
+    """Truncate the given abstract fields of papers, copying only the papers that change."""
+    if max_chars is None or not abstract_fields:
+        return papers
+
+    shortened = []
+    for paper in papers:
+        update = {}
+        for name in abstract_fields:
+            abstract = getattr(paper, name)
+            if abstract and len(abstract) > max_chars:
+                update[name] = shorten_abstract(abstract, max_chars)
+        shortened.append(paper.model_copy(update=update) if update else paper)
+    return shortened
+
+
+def shorten_abstracts_data(
+    papers_data: list[dict[str, Any]], abstract_fields: tuple[str, ...], max_chars: int | None
+) -> list[dict[str, Any]]:
+    """Truncate the given abstract fields of upstream paper items, copying only the items that change."""
+    if max_chars is None or not abstract_fields:
+        return papers_data
+
+    keys = [PAPER_MAPPING.source_key(name) for name in abstract_fields]
+    shortened = []
+    for paper_data in papers_data:
+        update = {}
+        for key in keys:
+            abstract = paper_data.get(key)
+            if abstract and len(abstract) > max_chars:
+                update[key] = shorten_abstract(abstract, max_chars)
+        shortened.append({**paper_data, **update} if update else paper_data)
+    return shortened
+
+
+async def fetch_papers_data(
+    query: str,
+    sort: str = "default",
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Search for papers on ModelScope, returning the raw upstream items."""
+    url = f"{settings.main_domain}/api/v1/dolphin/papers"
+
+    request_data = {
+        "Query": query,
+        "PageNumber": 1,
+        "PageSize": limit,
+        "Sort": sort,
+        "Criterion": [],
+    }
+
+    client = get_client()
+    response = await client.put(url, request_data, cache=SEARCH_PAPERS_CACHE)
+
+    return response.get("Data", {}).get("Papers", [])
+
+
+async def fetch_papers(
+    query: str,
+    sort: str = "default",
+    limit: int = 10,
+) -> list[Paper]:
+    """Search for papers on ModelScope and map the results.
+
+    Shared by the corresponding search tool and other server components.
+    """
+    papers_data = await fetch_papers_data(query=query, sort=sort, limit=limit)
+    return PAPER_MAPPING.map_page(papers_data)
+
 
 def register_paper_tools(mcp: FastMCP) -> None:
     """Register all paper-related tools with the MCP server.
@@ -27,6 +144,7 @@ def register_paper_tools(mcp: FastMCP) -> None:
     @mcp.tool(
         annotations={
             "title": "Search Papers",
+            "readOnlyHint": True,
         }
     )
     async def search_papers(
@@ -36,43 +154,35 @@ def register_paper_tools(mcp: FastMCP) -> None:
             Field(description="Sort order"),
         ] = "default",
         limit: Annotated[int, Field(description="Maximum number of papers to return", ge=1, le=100)] = 10,
-    ) -> list[Paper]:
+        fields: Annotated[list[str] | None, Field(description=describe_fields(Paper, "paper"))] = None,
+        format: Annotated[OutputFormat, Field(description=FORMAT_DESCRIPTION)] = "objects",
+        abstract_lang: Annotated[
+            Literal["cn", "en", "both", "none"],
+            Field(description="Abstracts to include: Chinese, English, both or none"),
+        ] = "both",
+        abstract_max_chars: Annotated[
+            int | None,
+            Field(description="Truncate abstracts to this many characters, at a word boundary", ge=1),
+        ] = None,
+    ) -> Results[Paper]:
         """Search for papers on ModelScope."""
-        url = f"{settings.main_domain}/api/v1/dolphin/papers"
-
-        request_data = {
-            "Query": query,
-            "PageNumber": 1,
-            "PageSize": limit,
-            "Sort": sort,
-            "Criterion": [],
-        }
-
-        client = get_client()
-        response = await client.put(url, request_data)
-
-        papers_data = response.get("Data", {}).get("Papers", [])
-
-        papers = []
-        for paper_data in papers_data:
-            arxiv_id = paper_data.get("ArxivId")
-            modelscope_url = f"{settings.main_domain}/papers/{arxiv_id}"
-
-            paper = Paper(
-                arxiv_id=arxiv_id,
-                title=paper_data.get("Title"),
-                authors=paper_data.get("Authors"),
-                publish_date=paper_data.get("PublishDate"),
-                abstract_cn=paper_data.get("AbstractCn"),
-                abstract_en=paper_data.get("AbstractEn"),
-                modelscope_url=modelscope_url,
-                arxiv_url=paper_data.get("ArxivUrl"),
-                pdf_url=paper_data.get("PdfUrl"),
-                code_link=paper_data.get("CodeLink"),
-                view_count=paper_data.get("ViewCount"),
-                favorite_count=paper_data.get("FavoriteCount"),
-                comment_count=paper_data.get("CommentTotalCount"),
-            )
-            papers.append(paper)
-
-        return papers
+        projection = validate_fields(Paper, fields)
+
+        # Leave out the abstracts that were not asked for
+        abstract_fields = ABSTRACT_FIELDS[abstract_lang]
+        excluded = set(ABSTRACT_FIELDS["both"]) - set(abstract_fields)
+        if excluded:
+            projection = (projection or set(Paper.model_fields)) - excluded
+        if projection is not None:
+            abstract_fields = tuple(name for name in abstract_fields if name in projection)
+
+        # Serve the hottest papers from the precomputed leaderboard when possible, except to tenants
+        if get_tenant_id() is None and not query and sort == "hot":
+            view = leaderboards.lookup("papers", ALL_CATEGORY, limit)
+            if view is not None:
+                papers = shorten_abstracts(view.items[:limit], abstract_fields, abstract_max_chars)
+                return format_results(papers, Paper, projection, format)
+
+        papers_data = await fetch_papers_data(query=query, sort=sort, limit=limit)
+        papers_data = shorten_abstracts_data(papers_data, abstract_fields, abstract_max_chars)
+        return format_page(PAPER_MAPPING, papers_data, projection, format)
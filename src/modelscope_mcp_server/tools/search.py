@@ -0,0 +1,148 @@
+"""ModelScope MCP Server unified search tools.
+
+Provides a single tool that searches models, datasets, studios, papers and MCP servers
+concurrently and merges the results.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Literal
+
+from fastmcp import FastMCP
+from fastmcp.utilities import logging
+from pydantic import Field
+
+from ..settings import settings
+from ..types import Dataset, McpServer, Model, Paper, SearchHit, SearchSourceStatus, Studio, UnifiedSearchResult
+from ..utils.ranking import reciprocal_rank_fusion
+from .dataset import fetch_datasets
+from .mcp import fetch_mcp_servers
+from .model import fetch_models
+from .paper import fetch_papers
+from .studio import fetch_studios
+
+logger = logging.get_logger(__name__)
+
+SearchSource = Literal["models", "datasets", "studios", "papers", "mcp_servers"]
+
+SEARCH_SOURCES: dict[str, Callable[[str, int], Awaitable[list[Any]]]] = {
+    "models": lambda query, limit: fetch_models(query=query, limit=limit),
+    "datasets": lambda query, limit: fetch_datasets(query=query, limit=limit),
+    "studios": lambda query, limit: fetch_studios(query=query, limit=limit),
+    "papers": lambda query, limit: fetch_papers(query=query, limit=limit),
+    "mcp_servers": lambda query, limit: fetch_mcp_servers(search=query, limit=limit),
+}
+
+SUMMARY_MAX_CHARS = 200
+
+
+def _to_hit(source: str, item: Any, score: float) -> SearchHit:
+    """Convert a source-specific result into a compact search hit."""
+    if isinstance(item, Paper):
+        id, title, summary = item.arxiv_id, item.title, item.abstract_en
+    elif isinstance(item, Model | Dataset):
+        id, title, summary = item.id, item.id, item.chinese_name
+    elif isinstance(item, Studio | McpServer):
+        id, title, summary = item.id, item.name, item.description
+    else:
+        raise TypeError(f"Unsupported search result type: {type(item).__name__}")
+
+    summary = summary or ""
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = summary[:SUMMARY_MAX_CHARS] + "..."
+
+    return SearchHit(
+        source=source,
+        id=id,
+        title=title,
+        summary=summary,
+        modelscope_url=item.modelscope_url,
+        score=round(score, 6),
+    )
+
+
+async def _search_source(source: str, query: str, limit: int, timeout: float) -> list[Any]:
+    return await asyncio.wait_for(SEARCH_SOURCES[source](query, limit), timeout=timeout)
+
+
+def register_search_tools(mcp: FastMCP) -> None:
+    """Register all unified search tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+
+    """
+
+    @mcp.tool(
+        annotations={
+            "title": "Search All",
+            "readOnlyHint": True,
+        }
+    )
+    async def search_all(
+        query: Annotated[str, Field(description="Keyword to search for across all ModelScope catalogs")],
+        sources: Annotated[
+            list[SearchSource] | None,
+            Field(description="Catalogs to search (default: all)"),
+        ] = None,
+        limit_per_source: Annotated[
+            int, Field(description="Maximum number of entries to fetch from each catalog", ge=1, le=30)
+        ] = 5,
+        limit: Annotated[int, Field(description="Maximum number of merged entries to return", ge=1, le=100)] = 20,
+    ) -> UnifiedSearchResult:
+        """Search models, datasets, studios, papers and MCP servers on ModelScope in one call.
+
+        Sources are queried concurrently and merged by reciprocal rank fusion. Sources that do not
+        answer before the deadline are reported in `sources` and left out of the results.
+        """
+        selected = list(dict.fromkeys(sources)) if sources else list(SEARCH_SOURCES)
+        source_timeout = min(settings.search_all_source_timeout_seconds, settings.search_all_timeout_seconds)
+
+        start_time = time.perf_counter()
+        finished_at: dict[str, float] = {}
+
+        def record_finish(source: str) -> Callable[[asyncio.Task], None]:
+            def record(_: asyncio.Task) -> None:
+                finished_at.setdefault(source, time.perf_counter())
+
+            return record
+
+        tasks = {}
+        for source in selected:
+            task = asyncio.create_task(_search_source(source, query, limit_per_source, source_timeout))
+            task.add_done_callback(record_finish(source))
+            tasks[source] = task
+
+        done, pending = await asyncio.wait(tasks.values(), timeout=settings.search_all_timeout_seconds)
+        deadline_at = time.perf_counter()
+
+        for task in pending:
+            task.cancel()
+
+        ranked_lists: dict[str, list[tuple[str, Any]]] = {}
+        statuses = []
+        for source, task in tasks.items():
+            status = SearchSourceStatus(source=source, status="timeout")
+            status.elapsed_ms = int((finished_at.get(source, deadline_at) - start_time) * 1000)
+
+            error = None if task not in done else task.exception()
+            if task not in done or isinstance(error, asyncio.TimeoutError | TimeoutError):
+                status.status = "timeout"
+            elif error is not None:
+                logger.warning(f"Unified search source {source} failed: {error}")
+                status.status = "error"
+                status.error = str(error)
+            else:
+                ranked_lists[source] = [(source, item) for item in task.result()]
+                status.status = "ok"
+                status.count = len(ranked_lists[source])
+            statuses.append(status)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        fused = reciprocal_rank_fusion(ranked_lists, key=lambda source, entry: (source, entry[1].modelscope_url))
+        hits = [_to_hit(source, item, score) for (source, item), score in fused[:limit]]
+
+        return UnifiedSearchResult(query=query, hits=hits, sources=statuses)
@@ -4,18 +4,113 @@ Provides tools for studio-related operations in the ModelScope MCP Server,
 such as searching for studios and retrieving studio details.
 """
 
-from typing import Annotated, Literal
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.utilities import logging
 from pydantic import Field
 
+from ..cache import CachePolicy
 from ..client import get_client
+from ..leaderboard import ALL_CATEGORY, leaderboards
 from ..settings import settings
+from ..tenant import get_tenant_id
 from ..types import Studio
+from ..utils.mapping import ResultMapping, Source
+from ..utils.projection import describe_fields, validate_fields
+from ..utils.table import FORMAT_DESCRIPTION, OutputFormat, Results, format_page, format_results
 
 logger = logging.get_logger(__name__)
 
+SEARCH_STUDIOS_CACHE = CachePolicy(
+    "search_studios", per_tenant=True, is_empty=lambda response: not response.get("Data", {}).get("Studios")
+)
+
+STUDIO_MAPPING = ResultMapping(
+    Studio,
+    {
+        "id": Source("Id", "", str),
+        "path": "Path",
+        "name": "Name",
+        "chinese_name": Source("ChineseName", ""),
+        "description": Source("Description", ""),
+        "created_by": Source("CreatedBy", ""),
+        "license": Source("License", ""),
+        "modelscope_url": lambda data: f"{settings.main_domain}/studios/{data['Path']}/{data['Name']}",
+        "independent_url": "IndependentUrl",
+        "cover_image": "CoverImage",
+        "type": Source("Type", ""),
+        "status": Source("Status", ""),
+        "domains": lambda data: data.get("Domain") or [],
+        "stars": Source("Stars", 0),
+        "visits": Source("Visits", 0),
+        "created_at": Source("CreatedTime", 0),
+        "updated_at": Source("LastUpdatedTime", 0),
+        "deployed_at": Source("DeployedTime", 0),
+    },
+    required=("Path", "Name"),
+)
+
+
+async def fetch_studios_data(
+    query: str = "",
+    domains: Sequence[str] | None = None,
+    sort: str = "Default",
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Search for studios on ModelScope, returning the raw upstream items."""
+    url = f"{settings.main_domain}/api/v1/dolphin/studios"
+
+    # Build criterion for filters
+    criterion = []
+
+    # Add create_type filter (always include all types)
+    criterion.append(
+        {
+            "category": "create_type",
+            "predicate": "contains",
+            "values": ["interactive", "programmatic"],
+        }
+    )
+
+    # Add domains filter
+    if domains:
+        criterion.append(
+            {
+                "category": "domains",
+                "predicate": "contains",
+                "values": list(domains),
+            }
+        )
+
+    request_data = {
+        "Name": query,
+        "Criterion": criterion,
+        "SortBy": sort,
+        "PageNumber": 1,
+        "PageSize": limit,
+    }
+
+    client = get_client()
+    response = await client.put(url, request_data, cache=SEARCH_STUDIOS_CACHE)
+
+    return response.get("Data", {}).get("Studios", [])
+
+
+async def fetch_studios(
+    query: str = "",
+    domains: Sequence[str] | None = None,
+    sort: str = "Default",
+    limit: int = 10,
+) -> list[Studio]:
+    """Search for studios on ModelScope and map the results.
+
+    Shared by the corresponding search tool and other server components.
+    """
+    studios_data = await fetch_studios_data(query=query, domains=domains, sort=sort, limit=limit)
+    return STUDIO_MAPPING.map_page(studios_data)
+
 
 def register_studio_tools(mcp: FastMCP) -> None:
     """Register all studio-related tools with the MCP server.
@@ -28,6 +123,7 @@ def register_studio_tools(mcp: FastMCP) -> None:
     @mcp.tool(
         annotations={
             "title": "Search Studios (创空间 AI 应用)",
+            "readOnlyHint": True,
         }
     )
     async def search_studios(
@@ -47,75 +143,17 @@ def register_studio_tools(mcp: FastMCP) -> None:
             Field(description="Sort order"),
         ] = "Default",
         limit: Annotated[int, Field(description="Maximum number of studios to return", ge=1, le=30)] = 10,
-    ) -> list[Studio]:
+        fields: Annotated[list[str] | None, Field(description=describe_fields(Studio, "studio"))] = None,
+        format: Annotated[OutputFormat, Field(description=FORMAT_DESCRIPTION)] = "objects",
+    ) -> Results[Studio]:
         """Search for studios on ModelScope."""
-        url = f"{settings.main_domain}/api/v1/dolphin/studios"
-
-        # Build criterion for filters
-        criterion = []
-
-        # Add create_type filter (always include all types)
-        criterion.append(
-            {
-                "category": "create_type",
-                "predicate": "contains",
-                "values": ["interactive", "programmatic"],
-            }
-        )
+        projection = validate_fields(Studio, fields)
 
-        # Add domains filter
-        if domains:
-            criterion.append(
-                {
-                    "category": "domains",
-                    "predicate": "contains",
-                    "values": domains,
-                }
-            )
-
-        request_data = {
-            "Name": query,
-            "Criterion": criterion,
-            "SortBy": sort,
-            "PageNumber": 1,
-            "PageSize": limit,
-        }
+        # Serve the most visited studios from the precomputed leaderboard when possible, except to tenants
+        if get_tenant_id() is None and not query and sort == "VisitsCount" and (not domains or len(domains) == 1):
+            view = leaderboards.lookup("studios", domains[0] if domains else ALL_CATEGORY, limit)
+            if view is not None:
+                return format_results(view.items[:limit], Studio, projection, format)
 
-        client = get_client()
-        response = await client.put(url, request_data)
-
-        studios_data = response.get("Data", {}).get("Studios", [])
-
-        studios = []
-        for studio_data in studios_data:
-            path = studio_data.get("Path", "")
-            name = studio_data.get("Name", "")
-            modelscope_url = f"{settings.main_domain}/studios/{path}/{name}"
-
-            if not path or not name:
-                logger.warning(f"Skipping studio with invalid path or name: {studio_data}")
-                continue
-
-            studio = Studio(
-                id=str(studio_data.get("Id", "")),
-                path=path,
-                name=name,
-                chinese_name=studio_data.get("ChineseName", ""),
-                description=studio_data.get("Description", ""),
-                created_by=studio_data.get("CreatedBy", ""),
-                license=studio_data.get("License", ""),
-                modelscope_url=modelscope_url,
-                independent_url=studio_data.get("IndependentUrl"),
-                cover_image=studio_data.get("CoverImage"),
-                type=studio_data.get("Type", ""),
-                status=studio_data.get("Status", ""),
-                domains=studio_data.get("Domain") or [],
-                stars=studio_data.get("Stars", 0),
-                visits=studio_data.get("Visits", 0),
-                created_at=studio_data.get("CreatedTime", 0),
-                updated_at=studio_data.get("LastUpdatedTime", 0),
-                deployed_at=studio_data.get("DeployedTime", 0),
-            )
-            studios.append(studio)
-
-        return studios
+        studios_data = await fetch_studios_data(query=query, domains=domains, sort=sort, limit=limit)
+        return format_page(STUDIO_MAPPING, studios_data, projection, format)
@@ -1,7 +1,7 @@
 """Type definitions for ModelScope MCP server."""
 
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -151,6 +151,16 @@ class McpServer(BaseModel):
     view_count: Annotated[int, Field(description="View count")] = 0
 
 
+class ReadmeSection(BaseModel):
+    """A README section, from its heading to the next heading of the same or a higher level."""
+
+    index: Annotated[int, Field(description="Section index in document order")]
+    level: Annotated[int, Field(description="Heading level (1-6), 0 for the text before the first heading")]
+    title: Annotated[str, Field(description="Heading text")]
+    start: Annotated[int, Field(description="Byte offset of the section")]
+    size: Annotated[int, Field(description="Section size in bytes, including its subsections")]
+
+
 class McpServerDetail(McpServer):
     """Detailed MCP Server information extending basic MCP Server info."""
 
@@ -172,7 +182,105 @@ class McpServerDetail(McpServer):
     github_stars: Annotated[int, Field(description="GitHub stars count")] = 0
 
     # Documentation
-    readme: Annotated[str, Field(description="README content")]
+    readme: Annotated[str, Field(description="README content, only the beginning if readme_truncated is set")]
+    readme_size: Annotated[int, Field(description="Full README size in bytes")] = 0
+    readme_truncated: Annotated[bool, Field(description="Whether the README was cut to a preview")] = False
+    readme_outline: Annotated[list[ReadmeSection], Field(description="README sections, to fetch on demand")] = []
+
+
+class ReadmeChunk(BaseModel):
+    """Part of an MCP server README."""
+
+    server_id: Annotated[str, Field(description="MCP Server ID")]
+    content: Annotated[str, Field(description="README content of the requested sections or byte range")]
+    start: Annotated[int | None, Field(description="Byte offset of the content, for byte range requests")] = None
+    end: Annotated[int | None, Field(description="Byte offset after the content, for byte range requests")] = None
+    total_size: Annotated[int, Field(description="Full README size in bytes")]
+    sections: Annotated[list[ReadmeSection], Field(description="Sections included in the content")] = []
+
+
+class McpServerDetailResult(BaseModel):
+    """Outcome of one lookup in a batch MCP server detail request."""
+
+    server_id: Annotated[str, Field(description="Requested MCP Server ID")]
+    detail: Annotated[McpServerDetail | None, Field(description="Server details if the lookup succeeded")] = None
+    error: Annotated[str | None, Field(description="Error message if the lookup failed")] = None
+
+
+class CatalogSearchResult(BaseModel):
+    """Search result served from a local catalog snapshot."""
+
+    kind: Annotated[str, Field(description="Catalog kind, for example 'models' or 'datasets'")]
+    snapshot_created_at: Annotated[int, Field(description="Snapshot creation time (unix timestamp, seconds)")]
+    total_count: Annotated[int, Field(description="Total number of matching entries in the snapshot")]
+
+    # Results, depending on the catalog kind
+    models: Annotated[list[Model], Field(description="Matching models")] = []
+    datasets: Annotated[list[Dataset], Field(description="Matching datasets")] = []
+
+
+class CatalogAnalyticsResult(BaseModel):
+    """Tabular analytics result computed over a local catalog snapshot."""
+
+    kind: Annotated[str, Field(description="Catalog kind, for example 'models' or 'datasets'")]
+    operation: Annotated[str, Field(description="Analytics operation that produced the result")]
+    snapshot_created_at: Annotated[int, Field(description="Snapshot creation time (unix timestamp, seconds)")]
+    matched_count: Annotated[int, Field(description="Number of catalog entries matching the filters")]
+
+    # Table
+    columns: Annotated[list[str], Field(description="Column names")]
+    rows: Annotated[list[list[str | int | float]], Field(description="Result rows, one value per column")] = []
+
+
+class ResultTable(BaseModel):
+    """List results in tabular form: column names once, then one row of values per result."""
+
+    columns: Annotated[list[str], Field(description="Column names, the result fields")]
+    rows: Annotated[list[list[Any]], Field(description="Result rows, one value per column")] = []
+
+
+class Leaderboard(BaseModel):
+    """Precomputed leaderboard served from memory."""
+
+    board: Annotated[str, Field(description="Leaderboard, for example 'models' or 'papers'")]
+    category: Annotated[str, Field(description="Task category or domain, 'all' if not filtered")]
+    ranked_by: Annotated[str, Field(description="Ranking criterion, for example 'downloads'")]
+    refreshed_at: Annotated[int, Field(description="Time the leaderboard was refreshed (unix timestamp, seconds)")]
+
+    # Entries, depending on the leaderboard
+    models: Annotated[list[Model], Field(description="Ranked models")] = []
+    datasets: Annotated[list[Dataset], Field(description="Ranked datasets")] = []
+    studios: Annotated[list[Studio], Field(description="Ranked studios")] = []
+    papers: Annotated[list[Paper], Field(description="Ranked papers")] = []
+
+
+class SearchHit(BaseModel):
+    """A single entry in a unified cross-catalog search result."""
+
+    source: Annotated[str, Field(description="Catalog the entry comes from, for example 'models' or 'papers'")]
+    id: Annotated[str, Field(description="Unique ID within the source catalog")]
+    title: Annotated[str, Field(description="Display name or title")]
+    summary: Annotated[str, Field(description="Short description")] = ""
+    modelscope_url: Annotated[str, Field(description="Detail page URL on ModelScope")]
+    score: Annotated[float, Field(description="Reciprocal rank fusion score, higher is better")]
+
+
+class SearchSourceStatus(BaseModel):
+    """Outcome of one source in a unified cross-catalog search."""
+
+    source: Annotated[str, Field(description="Catalog name")]
+    status: Annotated[Literal["ok", "timeout", "error"], Field(description="Whether the source answered in time")]
+    count: Annotated[int, Field(description="Number of entries returned by the source")] = 0
+    elapsed_ms: Annotated[int, Field(description="Time spent waiting for the source, in milliseconds")] = 0
+    error: Annotated[str | None, Field(description="Error message if the source failed")] = None
+
+
+class UnifiedSearchResult(BaseModel):
+    """Merged search result across ModelScope catalogs."""
+
+    query: Annotated[str, Field(description="Search query")]
+    hits: Annotated[list[SearchHit], Field(description="Merged entries, best first")] = []
+    sources: Annotated[list[SearchSourceStatus], Field(description="Per-source status")] = []
 
 
 class ImageGenerationResult(BaseModel):
@@ -183,6 +291,26 @@ class ImageGenerationResult(BaseModel):
     image_url: Annotated[str, Field(description="URL of the generated image")]
 
 
+class HistogramInfo(BaseModel):
+    """Distribution of observed values."""
+
+    buckets: Annotated[dict[str, int], Field(description="Number of values at or below each bucket bound")]
+    count: Annotated[int, Field(description="Number of values")]
+    sum: Annotated[float, Field(description="Sum of the values")]
+
+
+class ConnectionPoolInfo(BaseModel):
+    """Upstream connection pool statistics."""
+
+    requests: Annotated[int, Field(description="Number of upstream requests sent")]
+    max_in_flight: Annotated[int, Field(description="Peak number of concurrent upstream requests")]
+    keepalive_resizes: Annotated[int, Field(description="Number of adaptive keep-alive resizes")]
+    wait_seconds: Annotated[
+        HistogramInfo, Field(description="Time requests waited until sent on a connection, in seconds")
+    ]
+    utilization: Annotated[HistogramInfo, Field(description="Requests in flight relative to max_connections")]
+
+
 class EnvironmentInfo(BaseModel):
     """Environment information."""
 
@@ -199,3 +327,6 @@ class EnvironmentInfo(BaseModel):
     # Settings
     default_text_to_image_model: Annotated[str, Field(description="Default text-to-image model")]
     default_image_to_image_model: Annotated[str, Field(description="Default image-to-image model")]
+
+    # Statistics
+    connection_pool: Annotated[ConnectionPoolInfo, Field(description="Upstream connection pool statistics")]
@@ -0,0 +1,127 @@
+"""Declarative mapping of upstream API results to result models.
+
+A ResultMapping describes once how each field of a model is read from an upstream item, then
+converts whole pages: items are turned into plain dicts in one pass and validated together
+by a precompiled TypeAdapter, which is much cheaper than constructing one model per item.
+
+For tools with a ``fields`` parameter, select() restricts a mapping to the requested fields:
+only those are read from the upstream items, and they are validated into a projection of
+the model (see utils.projection).
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Generic, NamedTuple
+
+from fastmcp.utilities import logging
+from pydantic import TypeAdapter
+
+from .projection import ModelT, projected_model
+
+logger = logging.get_logger(__name__)
+
+
+class Source(NamedTuple):
+    """Upstream key of a field, with the value used when it is missing and an optional conversion."""
+
+    key: str
+    default: Any = None
+    convert: Callable[[Any], Any] | None = None
+
+
+# A field is read from an upstream key, or derived from the whole upstream item
+FieldSpec = str | Source | Callable[[Mapping[str, Any]], Any]
+
+
+class ResultMapping(Generic[ModelT]):
+    """Conversion of upstream items to a result model."""
+
+    def __init__(
+        self,
+        model: type[ModelT],
+        fields: Mapping[str, FieldSpec],
+        required: Iterable[str] = (),
+    ) -> None:
+        """Compile a mapping.
+
+        Args:
+            model: Result model
+            fields: Spec for each model field: an upstream key, a Source, or a function of the upstream item
+            required: Upstream keys that must be non-empty, other items are skipped with a warning
+
+        """
+        unknown = fields.keys() - model.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Unknown fields for {model.__name__}: {sorted(unknown)}")
+
+        self.model = model
+        self.fields = dict(fields)
+        self.required = tuple(required)
+        self._selections: dict[frozenset[str], ResultMapping[Any]] = {}
+        self._copied: list[tuple[str, str, Any]] = []
+        self._converted: list[tuple[str, str, Any, Callable[[Any], Any]]] = []
+        self._derived: list[tuple[str, Callable[[Mapping[str, Any]], Any]]] = []
+        for name, spec in fields.items():
+            if isinstance(spec, str):
+                spec = Source(spec)
+            if isinstance(spec, Source):
+                if spec.convert is None:
+                    self._copied.append((name, spec.key, spec.default))
+                else:
+                    self._converted.append((name, spec.key, spec.default, spec.convert))
+            else:
+                self._derived.append((name, spec))
+        self._adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    def to_row(self, item: Mapping[str, Any]) -> dict[str, Any]:
+        """Read the model fields of one upstream item into a dict."""
+        get = item.get
+        row = {name: get(key, default) for name, key, default in self._copied}
+        for name, key, default, convert in self._converted:
+            row[name] = convert(get(key, default))
+        for name, derive in self._derived:
+            row[name] = derive(item)
+        return row
+
+    def source_key(self, name: str) -> str:
+        """Return the upstream key a field is read from, for fields that are not derived."""
+        spec = self.fields[name]
+        if isinstance(spec, str):
+            return spec
+        if isinstance(spec, Source):
+            return spec.key
+        raise ValueError(f"Field '{name}' is derived from the whole item, not read from a key")
+
+    def select(self, fields: set[str] | None) -> "ResultMapping[Any]":
+        """Return the mapping restricted to the given fields, itself for all fields."""
+        if fields is None:
+            return self
+        key = frozenset(fields)
+        selection = self._selections.get(key)
+        if selection is None:
+            selection = ResultMapping(
+                projected_model(self.model, key),
+                {name: spec for name, spec in self.fields.items() if name in key},
+                self.required,
+            )
+            self._selections[key] = selection
+        return selection
+
+    def map_item(self, item: Mapping[str, Any]) -> ModelT:
+        """Convert a single upstream item."""
+        return self.model.model_validate(self.to_row(item))
+
+    def to_rows(self, items: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """Read the model fields of a page of upstream items, skipping items missing required keys."""
+        rows = []
+        for item in items:
+            if self.required and not all(item.get(key) for key in self.required):
+                logger.warning(
+                    f"Skipping {self.model.__name__.lower()} with invalid {' or '.join(self.required)}: {item}"
+                )
+                continue
+            rows.append(self.to_row(item))
+        return rows
+
+    def map_page(self, items: Iterable[Mapping[str, Any]]) -> list[ModelT]:
+        """Convert a page of upstream items, validating them in one call."""
+        return self._adapter.validate_python(self.to_rows(items))
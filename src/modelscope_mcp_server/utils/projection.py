@@ -0,0 +1,81 @@
+"""Field projection for tool results.
+
+Tools with a ``fields`` parameter return only the requested fields of each result, which
+shrinks serialization work, transport size and the tokens an agent has to read.
+
+A projection of a model is a model of its own, holding only the requested fields with the
+same types, defaults and descriptions (see projected_model). Results are converted straight
+to it, so the other fields are neither built nor validated.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Annotated, Any, TypeVar, cast
+
+from pydantic import BaseModel, GetJsonSchemaHandler, create_model
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ProjectionSchema:
+    """JSON schema of results that may be projected: all fields of their model are optional."""
+
+    def __get_pydantic_json_schema__(self, core_schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        """Return the model's schema without its required fields."""
+        schema = handler.resolve_ref_schema(handler(core_schema))
+        return {key: value for key, value in schema.items() if key != "required"}
+
+
+# Return type of tools with a `fields` parameter. The model itself keeps its required fields,
+# only the tool's output schema allows them to be left out.
+Projected = Annotated[ModelT, ProjectionSchema()]
+
+
+def describe_fields(model: type[BaseModel], item_name: str) -> str:
+    """Build the description of a `fields` parameter for results of the given model."""
+    return f"Fields to include in each {item_name}, any of: {', '.join(model.model_fields)}. Omit to include all."
+
+
+def validate_fields(model: type[BaseModel], fields: Sequence[str] | None) -> set[str] | None:
+    """Check requested field names against a model, returning them as a set (None for all fields)."""
+    if not fields:
+        return None
+    unknown = [field for field in fields if field not in model.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown}, available fields: {', '.join(model.model_fields)}")
+    return set(fields)
+
+
+@lru_cache(maxsize=256)
+def projected_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Return the projection of a model on the given fields, created once per field set."""
+    field_definitions: dict[str, Any] = {
+        name: (info.annotation, info) for name, info in model.model_fields.items() if name in fields
+    }
+    return create_model(
+        model.__name__,
+        __config__=model.model_config,
+        __doc__=model.__doc__,
+        __module__=model.__module__,
+        **field_definitions,
+    )
+
+
+def project(item: ModelT, fields: set[str] | None) -> ModelT:
+    """Return the item itself, or its projection on the given fields.
+
+    The item's values are already validated, so the projection is built without validation.
+    A projection only has some of the item's fields, but is typed as the item's model, as
+    results of tools with a `fields` parameter are (see Projected).
+    """
+    if fields is None:
+        return item
+    model = projected_model(type(item), frozenset(fields))
+    return cast(ModelT, model.model_construct(**{name: getattr(item, name) for name in model.model_fields}))
+
+
+def project_all(items: Sequence[ModelT], fields: set[str] | None) -> list[ModelT]:
+    """Project each item of a list, see project."""
+    return [project(item, fields) for item in items]
@@ -0,0 +1,46 @@
+"""Utility helpers for merging ranked result lists."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Damping constant from the original reciprocal rank fusion paper
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Mapping[str, Sequence[T]],
+    key: Callable[[str, T], Hashable],
+    k: int = RRF_K,
+) -> list[tuple[T, float]]:
+    """Merge ranked lists with reciprocal rank fusion.
+
+    Each item scores ``sum(1 / (k + rank))`` over the lists it appears in (rank starting at 1).
+    Items with the same key in several lists are merged, keeping the first occurrence.
+
+    Args:
+        ranked_lists: Ranked lists keyed by source name, in source priority order.
+        key: Function returning the identity of an item, given its source name and the item.
+        k: Damping constant, higher values flatten the influence of top ranks.
+
+    Returns:
+        Items with their fused scores, best first. Ties keep source priority order.
+
+    """
+    scores: dict[Hashable, float] = {}
+    items: dict[Hashable, T] = {}
+    order: dict[Hashable, tuple[int, int]] = {}
+
+    for source_index, (source, ranked) in enumerate(ranked_lists.items()):
+        for rank, item in enumerate(ranked, start=1):
+            item_key = key(source, item)
+            scores[item_key] = scores.get(item_key, 0.0) + 1.0 / (k + rank)
+            if item_key not in items:
+                items[item_key] = item
+                order[item_key] = (rank, source_index)
+
+    ranked_keys = sorted(scores, key=lambda item_key: (-scores[item_key], order[item_key]))
+    return [(items[item_key], scores[item_key]) for item_key in ranked_keys]
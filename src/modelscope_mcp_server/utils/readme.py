@@ -0,0 +1,80 @@
+"""Section-aware access to Markdown READMEs.
+
+READMEs are indexed once by their ATX headings (``#`` to ``######``, ignoring fenced code
+blocks) and the index is cached, so outlines, previews and sections can be served without
+re-scanning the text. All offsets and sizes are in UTF-8 bytes.
+"""
+
+import re
+from functools import lru_cache
+
+from ..types import ReadmeSection
+
+HEADING_PATTERN = re.compile(rb"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t#]*$")
+FENCE_PATTERN = re.compile(rb"^ {0,3}(`{3,}|~{3,})")
+
+# Title of the text before the first heading
+PREAMBLE_TITLE = "(preamble)"
+
+
+@lru_cache(maxsize=256)
+def _index(readme: str) -> tuple[bytes, tuple[ReadmeSection, ...]]:
+    data = readme.encode("utf-8")
+    headings: list[tuple[int, int, str]] = []
+    fence: bytes | None = None
+
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        stripped = line.rstrip(b"\r\n")
+        fence_match = FENCE_PATTERN.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[:1] == fence[:1] and len(marker) >= len(fence):
+                fence = None
+        elif fence is None:
+            heading_match = HEADING_PATTERN.match(stripped)
+            if heading_match:
+                title = (heading_match.group(2) or b"").decode("utf-8", errors="replace").strip()
+                headings.append((offset, len(heading_match.group(1)), title))
+        offset += len(line)
+
+    if not headings or headings[0][0] > 0:
+        headings.insert(0, (0, 0, PREAMBLE_TITLE))
+
+    sections = []
+    for i, (start, level, title) in enumerate(headings):
+        # A section extends to the next heading of the same or a higher level
+        end = len(data)
+        for next_start, next_level, _ in headings[i + 1 :]:
+            if level == 0 or next_level <= level:
+                end = next_start
+                break
+        sections.append(ReadmeSection(index=i, level=level, title=title, start=start, size=end - start))
+    return data, tuple(sections)
+
+
+def get_outline(readme: str) -> list[ReadmeSection]:
+    """Return the sections of a README in document order."""
+    if not readme:
+        return []
+    return list(_index(readme)[1])
+
+
+def read_bytes(readme: str, start: int, end: int) -> str:
+    """Return a byte range of a README, dropping characters split at the boundaries."""
+    data = _index(readme)[0] if readme else b""
+    return data[start:end].decode("utf-8", errors="ignore")
+
+
+def get_preview(readme: str, max_bytes: int) -> tuple[str, bool]:
+    """Return (the first `max_bytes` bytes of a README, whether it was truncated)."""
+    if get_size(readme) <= max_bytes:
+        return readme, False
+    return read_bytes(readme, 0, max_bytes), True
+
+
+def get_size(readme: str) -> int:
+    """Return the size of a README in bytes."""
+    return len(_index(readme)[0]) if readme else 0
@@ -0,0 +1,61 @@
+"""Tabular output for list-returning tools.
+
+With ``format="table"`` a tool returns the column names once followed by one array of values
+per result, instead of an object per result that repeats every key. Rows are read straight
+from the values mapped from the upstream items, or from the attributes of results that are
+already built, skipping model validation and per-object serialization.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Literal
+
+from pydantic import BaseModel, SerializeAsAny
+
+from ..types import ResultTable
+from .mapping import ResultMapping
+from .projection import ModelT, Projected, project_all
+
+OutputFormat = Literal["objects", "table"]
+
+FORMAT_DESCRIPTION = (
+    "Output format: 'objects' returns one object per result, "
+    "'table' returns the column names once plus one row of values per result, which is more compact"
+)
+
+
+# Return type of tools supporting both output formats. Results are serialized by their own
+# class rather than matched against the union, where projected results (which lack fields)
+# would not match their model.
+Results = SerializeAsAny[list[Projected[ModelT]] | ResultTable]
+
+
+def tabulate(items: Sequence[BaseModel], model: type[BaseModel], fields: set[str] | None = None) -> ResultTable:
+    """Build a table of results, with the model's fields (or the given subset) as columns."""
+    columns = [name for name in model.model_fields if fields is None or name in fields]
+    rows = [[getattr(item, name) for name in columns] for item in items]
+    # The values come from validated models, so the table needs no validation
+    return ResultTable.model_construct(columns=columns, rows=rows)
+
+
+def format_results(
+    items: Sequence[ModelT], model: type[ModelT], fields: set[str] | None, format: OutputFormat
+) -> list[ModelT] | ResultTable:
+    """Return built results as (projected) objects or as a table, depending on the requested format."""
+    if format == "table":
+        return tabulate(items, model, fields)
+    return project_all(items, fields)
+
+
+def format_page(
+    mapping: ResultMapping[ModelT], items: Iterable[Mapping[str, Any]], fields: set[str] | None, format: OutputFormat
+) -> list[ModelT] | ResultTable:
+    """Convert a page of upstream items to results in the requested format, building only the requested fields.
+
+    Only object results are validated into models, table rows hold the mapped values.
+    """
+    selection = mapping.select(fields)
+    if format == "table":
+        columns = [name for name in selection.model.model_fields if name in selection.fields]
+        rows = [[row[name] for name in columns] for row in selection.to_rows(items)]
+        return ResultTable.model_construct(columns=columns, rows=rows)
+    return selection.map_page(items)
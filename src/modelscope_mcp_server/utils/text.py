@@ -31,3 +31,30 @@ def truncate_for_log(text: str | None, max_chars: int = 2000) -> str:
 
     displayed = text[:max_chars]
     return f"{displayed}\n... [truncated display={max_chars} total={total_len}]"
+
+
+def truncate_at_word(text: str, max_chars: int, marker: str = "...") -> str:
+    """Truncate a string to at most max_chars characters, preferring a word boundary.
+
+    The cut is moved back to the last whitespace if that keeps at least half of the allowed
+    text, otherwise (for example in Chinese text without spaces) the text is cut at max_chars.
+    Text within the limit is returned as is, without copying.
+
+    Args:
+        text: The input string to truncate.
+        max_chars: Maximum number of characters to keep, excluding the marker.
+        marker: Appended to truncated text.
+
+    Returns:
+        The original text if within limit; otherwise its truncated prefix followed by the marker.
+
+    """
+    if len(text) <= max_chars:
+        return text
+
+    cut = max_chars
+    if not text[cut].isspace():
+        boundary = max(text.rfind(" ", 0, cut + 1), text.rfind("\n", 0, cut + 1))
+        if boundary >= max_chars // 2:
+            cut = boundary
+    return text[:cut].rstrip() + marker
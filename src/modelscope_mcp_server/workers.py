@@ -0,0 +1,71 @@
+"""Serving of the HTTP and SSE transports, optionally from several worker processes.
+
+The transports are served by uvicorn from an app factory, so that the server's lifespan runs
+inside uvicorn and the shutdown sequence receives its signals first (see shutdown).
+
+With several workers, a supervisor process binds the listening socket once and pre-forks
+worker processes that all accept connections from it, each running its own server and event
+loop, so that response mapping and serialization scale across cores. The supervisor is
+uvicorn's:
+
+- Workers are health-checked over a pipe and replaced when they crash or stop answering.
+- SIGHUP reloads gracefully: workers are replaced one at a time, each replacement serving
+  before the old worker stops accepting connections and finishes its in-flight requests.
+- SIGTTIN and SIGTTOU add and remove a worker.
+- SIGINT and SIGTERM stop all workers gracefully.
+
+Workers share no memory: the response cache, rate limits and admission control are per
+worker. Configure a cache backend (cache_dir or cache_redis_url) to share cached responses.
+"""
+
+import math
+from typing import Literal
+
+import fastmcp
+import uvicorn
+from fastmcp.server.http import StarletteWithLifespan
+
+from .server import create_mcp_server
+from .settings import settings
+
+HttpTransport = Literal["http", "sse"]
+
+# Import strings of the app factory run by the workers of each transport
+APP_FACTORIES: dict[HttpTransport, str] = {
+    "http": f"{__name__}:create_http_app",
+    "sse": f"{__name__}:create_sse_app",
+}
+
+
+def create_http_app() -> StarletteWithLifespan:
+    """Create the ASGI app of a streamable HTTP worker."""
+    return create_mcp_server().http_app(transport="http", stateless_http=settings.stateless_http)
+
+
+def create_sse_app() -> StarletteWithLifespan:
+    """Create the ASGI app of an SSE worker."""
+    return create_mcp_server().http_app(transport="sse")
+
+
+def run_http(transport: HttpTransport, port: int, workers: int = 1, host: str | None = None) -> None:
+    """Serve an HTTP transport until stopped, from a pool of worker processes if `workers` > 1.
+
+    Args:
+        transport: HTTP transport to serve
+        port: Port to listen on, shared by all workers
+        workers: Number of worker processes, 1 to serve from this process
+        host: Address to bind, defaults to the FastMCP host setting
+
+    """
+    uvicorn.run(
+        APP_FACTORIES[transport],
+        factory=True,
+        host=host or fastmcp.settings.host,
+        port=port,
+        workers=workers,
+        lifespan="on",
+        log_level=settings.log_level.lower(),
+        timeout_worker_healthcheck=settings.worker_healthcheck_timeout_seconds,
+        # Whole seconds, rounded up so the server's own drain deadline comes first
+        timeout_graceful_shutdown=math.ceil(settings.shutdown_timeout_seconds),
+    )
@@ -0,0 +1 @@
+"""Cache test package."""
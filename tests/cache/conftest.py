@@ -0,0 +1,121 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from modelscope_mcp_server.cache.redis import read_reply
+
+
+def encode_reply(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, Exception):
+        return b"-ERR %s\r\n" % str(value).encode()
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(encode_reply(item) for item in value)
+
+
+class StandInRedisServer:
+    """In-process server speaking the subset of the Redis protocol used by RedisBackend."""
+
+    def __init__(self, password=None):
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self.commands: list[bytes] = []
+        self.connections = 0
+        self.delay = 0.0
+        self._server = None
+
+    @property
+    def url(self):
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}127.0.0.1:{self.port}/0"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        assert self._server is not None
+        self._server.close()
+        for writers in self.subscribers.values():
+            for writer in writers:
+                writer.close()
+        await self._server.wait_closed()
+
+    def _get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        authenticated = self.password is None
+        try:
+            while True:
+                command = await read_reply(reader)
+                name, args = command[0].upper(), command[1:]
+                self.commands.append(name)
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                if name == b"AUTH":
+                    authenticated = args[0].decode() == self.password
+                    reply = "OK" if authenticated else Exception("invalid password")
+                elif not authenticated:
+                    reply = Exception("NOAUTH")
+                elif name == b"SUBSCRIBE":
+                    self.subscribers.setdefault(args[0], set()).add(writer)
+                    reply = [b"subscribe", args[0], 1]
+                else:
+                    reply = self._execute(name, args)
+                writer.write(encode_reply(reply))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for writers in self.subscribers.values():
+                writers.discard(writer)
+            writer.close()
+
+    def _execute(self, name, args):
+        if name == b"PING":
+            return "PONG"
+        if name == b"SELECT":
+            return "OK"
+        if name == b"GET":
+            return self._get(args[0])
+        if name == b"MGET":
+            return [self._get(key) for key in args]
+        if name == b"SET":
+            expires_at = None
+            if len(args) == 4 and args[2].upper() == b"PX":
+                expires_at = time.monotonic() + int(args[3]) / 1000
+            self.data[args[0]] = (args[1], expires_at)
+            return "OK"
+        if name == b"DEL":
+            return sum(self.data.pop(key, None) is not None for key in args)
+        if name == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            return [b"0", [key for key in list(self.data) if fnmatch.fnmatch(key.decode(), pattern)]]
+        if name == b"PUBLISH":
+            writers = self.subscribers.get(args[0], set())
+            for subscriber in writers:
+                subscriber.write(encode_reply([b"message", args[0], args[1]]))
+            return len(writers)
+        return Exception(f"unknown command {name!r}")
+
+
+@pytest.fixture
+async def redis_server():
+    server = StandInRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
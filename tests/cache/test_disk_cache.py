@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from modelscope_mcp_server.cache import CachePolicy, DiskBackend, DiskCache, ResponseCache
+
+POLICY = CachePolicy("test", soft_ttl=10, hard_ttl=100)
+
+
+@pytest.fixture
+def disk_path(tmp_path):
+    return tmp_path / "cache" / "responses.sqlite3"
+
+
+def test_values_are_compressed_and_persisted(disk_path):
+    value = {"Data": {"Models": [{"Name": "model", "Description": "text " * 200}]}}
+    disk = DiskCache(disk_path, max_bytes=1024 * 1024)
+    disk.set("k", value, ttl=60)
+    assert disk.size_bytes() < len(str(value)) / 4
+    disk.close()
+
+    reopened = DiskCache(disk_path, max_bytes=1024 * 1024)
+    stored = reopened.get("k")
+    assert stored is not None
+    stored_value, stored_at = stored
+    assert stored_value == value
+    assert stored_at <= time.time()
+    assert reopened.get("missing") is None
+
+
+def test_expired_entries_are_not_served(disk_path):
+    disk = DiskCache(disk_path, max_bytes=1024 * 1024)
+    disk.set("old", {"v": 1}, ttl=60, stored_at=time.time() - 120)
+    disk.set("new", {"v": 2}, ttl=60)
+
+    assert disk.get("old") is None
+    # Expired entries are purged on the next write
+    assert len(disk) == 1
+
+
+def test_size_limit_evicts_entries_closest_to_expiry(disk_path):
+    disk = DiskCache(disk_path, max_bytes=200)
+    payload = "".join(chr(0x4E00 + i) for i in range(40))
+    disk.set("short", {"v": payload + "a"}, ttl=10)
+    disk.set("long", {"v": payload + "b"}, ttl=1000)
+    disk.set("medium", {"v": payload + "c"}, ttl=100)
+
+    assert disk.size_bytes() <= 200
+    assert disk.get("short") is None
+    assert disk.get("long") is not None
+
+
+def test_size_total_follows_every_change(disk_path):
+    disk = DiskCache(disk_path, max_bytes=1024 * 1024)
+    other = DiskCache(disk_path, max_bytes=1024 * 1024)
+
+    def table_size():
+        (total,) = disk._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return total
+
+    disk.set("a", {"v": "x" * 100}, ttl=60)
+    other.set("b", {"v": 1}, ttl=60)
+    disk.set("a", {"v": 2}, ttl=60)
+    other.set("old", {"v": 3}, ttl=60, stored_at=time.time() - 120)
+    assert disk.size_bytes() == other.size_bytes() == table_size() > 0
+
+    other.delete("b")
+    assert disk.size_bytes() == table_size()
+    disk.clear()
+    assert disk.size_bytes() == 0
+
+
+def test_connections_share_entries(disk_path):
+    writer = DiskCache(disk_path, max_bytes=1024 * 1024)
+    reader = DiskCache(disk_path, max_bytes=1024 * 1024)
+
+    writer.set("k", {"v": 1}, ttl=60)
+    shared = reader.get("k")
+    assert shared is not None and shared[0] == {"v": 1}
+
+    reader.delete("k")
+    assert writer.get("k") is None
+
+
+async def test_response_cache_serves_from_disk_after_restart(disk_path):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"version": calls}
+
+    first = ResponseCache(backend=DiskBackend(DiskCache(disk_path, max_bytes=1024 * 1024)))
+    assert await first.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    await first.close()
+
+    # A new process starts with an empty memory tier
+    second = ResponseCache(backend=DiskBackend(DiskCache(disk_path, max_bytes=1024 * 1024)))
+    assert await second.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    assert await second.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    assert calls == 1
+    assert second.stats.backend_hits == 1
+    assert second.stats.hits == 2
+
+
+async def test_response_cache_prefers_fresher_disk_entry(disk_path):
+    disk = DiskCache(disk_path, max_bytes=1024 * 1024)
+    cache = ResponseCache(backend=DiskBackend(disk))
+
+    async def fetch():
+        return {"version": 1}
+
+    await cache.get_or_fetch("k", fetch, POLICY)
+    await cache.flush()
+    cache._entries["k"].stored_at -= 50
+
+    # Another worker refreshed the entry in the meantime
+    disk.set("k", {"version": 2}, ttl=1000)
+    assert await cache.get_or_fetch("k", fetch, POLICY) == {"version": 2}
+    assert cache.stats.stale_hits == 0
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+import pytest
+
+from modelscope_mcp_server.cache import CachePolicy, RedisBackend, ResponseCache, StoredValue
+from modelscope_mcp_server.cache.redis import encode_command
+
+from .conftest import StandInRedisServer
+
+POLICY = CachePolicy("test", soft_ttl=10, hard_ttl=100)
+
+
+def test_encode_command():
+    assert encode_command("SET", "k", b"\x00v", 10) == b"*4\r\n$3\r\nSET\r\n$1\r\nk\r\n$2\r\n\x00v\r\n$2\r\n10\r\n"
+
+
+async def test_set_and_get_many(redis_server):
+    backend = RedisBackend(redis_server.url, timeout=1.0)
+    stored_at = time.time()
+    await backend.set_many({"a": StoredValue({"v": "模型"}, stored_at), "b": StoredValue({"v": 2}, stored_at)}, ttl=60)
+
+    results = await backend.get_many(["a", "b", "missing"])
+    assert results == {"a": (({"v": "模型"}), stored_at), "b": ({"v": 2}, stored_at)}
+    assert b"modelscope-mcp:a" in redis_server.data
+    # The batch of reads is a single MGET
+    assert redis_server.commands.count(b"MGET") == 1
+
+    await backend.delete(["a"])
+    assert await backend.get("a") is None
+    await backend.close()
+
+
+async def test_concurrent_requests_are_pipelined_on_one_connection(redis_server):
+    backend = RedisBackend(redis_server.url, timeout=1.0)
+    await backend.set_many({f"k{i}": StoredValue({"v": i}, time.time()) for i in range(20)}, ttl=60)
+
+    results = await asyncio.gather(*(backend.get(f"k{i}") for i in range(20)))
+
+    assert [result.value for result in results if result is not None] == [{"v": i} for i in range(20)]
+    assert redis_server.connections == 1
+    await backend.close()
+
+
+async def test_entries_expire_with_ttl(redis_server):
+    backend = RedisBackend(redis_server.url, timeout=1.0)
+    await backend.set("old", StoredValue({"v": 1}, time.time() - 59.95), ttl=60)
+    await backend.set("gone", StoredValue({"v": 1}, time.time() - 120), ttl=60)
+
+    assert b"modelscope-mcp:gone" not in redis_server.data
+    await asyncio.sleep(0.1)
+    assert await backend.get("old") is None
+    await backend.close()
+
+
+async def test_slow_server_counts_as_miss(redis_server):
+    backend = RedisBackend(redis_server.url, timeout=0.05)
+    await backend.set("k", StoredValue({"v": 1}, time.time()), ttl=60)
+    redis_server.delay = 0.5
+
+    start = time.perf_counter()
+    assert await backend.get("k") is None
+    assert time.perf_counter() - start < 0.3
+    await backend.close()
+
+
+async def test_unavailable_server_disables_backend(redis_server):
+    url = redis_server.url
+    await redis_server.stop()
+    backend = RedisBackend(url, timeout=0.5, retry_interval=60)
+
+    assert await backend.get("k") is None
+    assert backend._disabled_until > time.monotonic()
+    # Further calls return immediately without connecting
+    start = time.perf_counter()
+    await backend.set("k", StoredValue({"v": 1}, time.time()), ttl=60)
+    assert time.perf_counter() - start < 0.01
+
+
+async def test_authentication_and_clear():
+    server = StandInRedisServer(password="secret")
+    await server.start()
+    try:
+        backend = RedisBackend(server.url, timeout=1.0)
+        await backend.set("k", StoredValue({"v": 1}, time.time()), ttl=60)
+        server.data[b"other:k"] = (b"v", None)
+        assert await backend.get("k") is not None
+
+        await backend.clear()
+        assert list(server.data) == [b"other:k"]
+        await backend.close()
+
+        wrong = RedisBackend(server.url.replace("secret", "wrong"), timeout=1.0)
+        assert await wrong.get("k") is None
+        assert wrong._disabled_until > 0
+    finally:
+        await server.stop()
+
+
+def test_rejects_unsupported_url():
+    with pytest.raises(ValueError, match="Unsupported cache URL scheme"):
+        RedisBackend("http://localhost", timeout=1.0)
+
+
+async def test_replicas_share_entries_and_invalidate_near_caches(redis_server):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"version": calls}
+
+    replica_a = ResponseCache(backend=RedisBackend(redis_server.url, timeout=1.0))
+    replica_b = ResponseCache(backend=RedisBackend(redis_server.url, timeout=1.0))
+
+    assert await replica_a.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    await replica_a.flush()
+
+    # Served from the shared backend, then from the near-cache
+    assert await replica_b.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    assert await replica_b.get_or_fetch("k", fetch, POLICY) == {"version": 1}
+    assert calls == 1
+    assert replica_b.stats.backend_hits == 1
+    await asyncio.sleep(0.05)
+
+    # A invalidates the key, which drops it from B's near-cache
+    await replica_a.invalidate("k")
+    for _ in range(50):
+        if len(replica_b) == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert len(replica_b) == 0
+
+    assert await replica_b.get_or_fetch("k", fetch, POLICY) == {"version": 2}
+    await replica_a.close()
+    await replica_b.close()
@@ -0,0 +1,344 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from modelscope_mcp_server import settings
+from modelscope_mcp_server.cache import CachePolicy, ResponseCache, make_cache_key
+from modelscope_mcp_server.client import ModelScopeAPIError, ModelScopeClient
+from modelscope_mcp_server.server import create_mcp_server
+
+POLICY = CachePolicy("test", soft_ttl=10, hard_ttl=100)
+
+
+class Upstream:
+    """Fake upstream counting requests."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.delay = 0.0
+
+    async def fetch(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream failed")
+        return {"version": self.calls}
+
+
+def age_entry(cache, key, seconds):
+    cache._entries[key].stored_at -= seconds
+
+
+async def test_fresh_entry_is_served_from_cache():
+    cache, upstream = ResponseCache(), Upstream()
+
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+
+    assert upstream.calls == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+async def test_stale_entry_is_served_and_revalidated_once():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 50)
+
+    upstream.delay = 0.05
+    results = await asyncio.gather(*(cache.get_or_fetch("k", upstream.fetch, POLICY) for _ in range(5)))
+
+    # All callers get the stale value immediately, a single refresh runs in the background
+    assert results == [{"version": 1}] * 5
+    assert cache.stats.stale_hits == 5
+    assert cache.stats.background_refreshes == 1
+
+    await asyncio.sleep(0.1)
+    assert upstream.calls == 2
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 2}
+
+
+async def test_expired_entry_is_refetched_synchronously():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 150)
+
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 2}
+    assert cache.stats.misses == 2
+
+
+async def test_concurrent_misses_share_one_request():
+    cache, upstream = ResponseCache(), Upstream()
+    upstream.delay = 0.05
+
+    results = await asyncio.gather(*(cache.get_or_fetch("k", upstream.fetch, POLICY) for _ in range(10)))
+
+    assert results == [{"version": 1}] * 10
+    assert upstream.calls == 1
+
+
+async def test_stale_entry_is_served_while_upstream_fails():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 150)
+
+    upstream.fail = True
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+    assert cache.stats.stale_on_error == 1
+
+    age_entry(cache, "k", settings.cache_stale_if_error_seconds)
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        await cache.get_or_fetch("k", upstream.fetch, POLICY)
+
+
+async def test_failed_background_refresh_keeps_stale_entry():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 50)
+
+    upstream.fail = True
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+    await asyncio.sleep(0.01)
+
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+    assert cache.stats.background_refreshes == 2
+
+
+async def test_close_cancels_background_refreshes():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 50)
+
+    upstream.delay = 10
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    await asyncio.sleep(0)
+    (refresh,) = cache._get_loop_tasks().refresh_tasks
+
+    await cache.close()
+    assert refresh.cancelled()
+    assert not cache._get_loop_tasks().refresh_tasks
+
+
+async def test_lru_eviction():
+    cache, upstream = ResponseCache(max_entries=2), Upstream()
+    for key in ["a", "b", "a", "c"]:
+        await cache.get_or_fetch(key, upstream.fetch, POLICY)
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert set(cache._entries) == {"a", "c"}
+
+
+def test_cache_key_is_canonical():
+    assert make_cache_key("put", "u", {"b": 1, "a": 2}) == make_cache_key("PUT", "u", {"a": 2, "b": 1})
+    assert make_cache_key("PUT", "u", {"a": 1}) != make_cache_key("PUT", "u", {"a": 2})
+    assert make_cache_key("GET", "u", None) == make_cache_key("GET", "u", {})
+
+
+async def test_client_uses_cache_only_with_policy(mocker):
+    mock_request = mocker.patch.object(ModelScopeClient, "_request", new_callable=mocker.AsyncMock, return_value={})
+    mocker.patch("modelscope_mcp_server.client.response_cache", ResponseCache())
+    client = ModelScopeClient()
+
+    await client.put("https://example.com/search", {"q": 1}, cache=POLICY)
+    await client.put("https://example.com/search", {"q": 1}, cache=POLICY)
+    assert mock_request.await_count == 1
+
+    await client.put("https://example.com/search", {"q": 1})
+    await client.post("https://example.com/search", {"q": 1})
+    assert mock_request.await_count == 3
+
+    mocker.patch.object(settings, "cache_enabled", False)
+    await client.get("https://example.com/detail", cache=POLICY)
+    await client.get("https://example.com/detail", cache=POLICY)
+    assert mock_request.await_count == 5
+
+
+def not_found_error():
+    request = httpx.Request("GET", "https://example.com/servers/missing")
+    return httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+
+
+async def test_not_found_errors_are_cached():
+    cache, upstream = ResponseCache(), Upstream()
+
+    async def fetch():
+        upstream.calls += 1
+        raise not_found_error()
+
+    errors = []
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await cache.get_or_fetch("k", fetch, POLICY)
+        errors.append(exc_info.value)
+
+    assert upstream.calls == 1
+    assert cache.stats.negative_hits == 2
+    # Each caller gets its own exception
+    assert len({id(error) for error in errors}) == 3
+    assert {(error.response.status_code, str(error), str(error.request.url)) for error in errors} == {
+        (404, "Not Found", "https://example.com/servers/missing")
+    }
+
+
+async def test_not_found_api_errors_are_cached():
+    cache, upstream = ResponseCache(), Upstream()
+
+    async def fetch():
+        upstream.calls += 1
+        raise ModelScopeAPIError("API error [MCP_SERVER_NOT_FOUND]: server does not exist", "MCP_SERVER_NOT_FOUND")
+
+    for _ in range(2):
+        with pytest.raises(ModelScopeAPIError) as exc_info:
+            await cache.get_or_fetch("k", fetch, POLICY)
+    assert upstream.calls == 1
+    assert exc_info.value.code == "MCP_SERVER_NOT_FOUND"
+    assert str(exc_info.value) == "API error [MCP_SERVER_NOT_FOUND]: server does not exist"
+
+
+async def test_other_errors_are_not_cached():
+    cache, upstream = ResponseCache(), Upstream()
+    upstream.fail = True
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    assert upstream.calls == 2
+
+
+async def test_empty_results_use_negative_ttl():
+    policy = CachePolicy("test", soft_ttl=10, hard_ttl=100, negative_ttl=5, is_empty=lambda response: not response)
+    cache, calls = ResponseCache(), 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {}
+
+    assert await cache.get_or_fetch("k", fetch, policy) == {}
+    assert await cache.get_or_fetch("k", fetch, policy) == {}
+    assert calls == 1
+    assert len(cache) == 0
+
+    cache._negative["k"].stored_at -= 6
+    await cache.get_or_fetch("k", fetch, policy)
+    assert calls == 2
+
+
+async def test_not_found_replaces_stale_entry():
+    cache, upstream = ResponseCache(), Upstream()
+    await cache.get_or_fetch("k", upstream.fetch, POLICY)
+    age_entry(cache, "k", 150)
+
+    async def fetch():
+        raise not_found_error()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await cache.get_or_fetch("k", fetch, POLICY)
+    assert len(cache) == 0
+    assert cache.stats.stale_on_error == 0
+
+
+async def test_negative_entries_are_bounded(mocker):
+    mocker.patch.object(settings, "cache_negative_max_entries", 2)
+    policy = CachePolicy("test", is_empty=lambda response: True)
+    cache = ResponseCache()
+
+    async def fetch():
+        return {}
+
+    for key in ["a", "b", "c"]:
+        await cache.get_or_fetch(key, fetch, policy)
+    assert list(cache._negative) == ["b", "c"]
+
+
+def test_api_error_not_found_detection():
+    assert ModelScopeAPIError("[status=200] API error [NOT_FOUND]: missing", "NOT_FOUND").not_found
+    assert ModelScopeAPIError("[status=404] API error [X]: gone", "X", 404).not_found
+    assert not ModelScopeAPIError("[status=200] API error [AUTH]: invalid token", "AUTH").not_found
+    assert not ModelScopeAPIError("[status=200] API error [AUTH_FAILED]: user not found", "AUTH_FAILED").not_found
+
+
+async def test_prefetch_warms_cache_and_counts_hits(mocker):
+    mocker.patch.object(settings, "prefetch_max_concurrency", 2)
+    cache, upstream = ResponseCache(), Upstream()
+
+    assert cache.prefetch("a", upstream.fetch, POLICY)
+    assert cache.prefetch("b", upstream.fetch, POLICY)
+    # Over the concurrency cap, dropped instead of queued
+    assert not cache.prefetch("c", upstream.fetch, POLICY)
+    # Already being fetched
+    assert not cache.prefetch("a", upstream.fetch, POLICY)
+    await asyncio.sleep(0.01)
+
+    assert await cache.get_or_fetch("a", upstream.fetch, POLICY) == {"version": 1}
+    assert upstream.calls == 2
+    assert cache.stats.prefetches == 2
+    assert cache.stats.prefetches_dropped == 1
+    assert cache.stats.prefetch_hits == 1
+    assert cache.stats.prefetch_hit_rate == 0.5
+
+    # Fresh entries are not prefetched again
+    assert not cache.prefetch("a", upstream.fetch, POLICY)
+
+
+async def test_request_joining_inflight_prefetch_counts_as_hit():
+    cache, upstream = ResponseCache(), Upstream()
+    upstream.delay = 0.05
+
+    cache.prefetch("k", upstream.fetch, POLICY)
+    await asyncio.sleep(0)
+    assert await cache.get_or_fetch("k", upstream.fetch, POLICY) == {"version": 1}
+
+    assert upstream.calls == 1
+    assert cache.stats.prefetch_hits == 1
+
+
+async def test_failed_prefetch_is_counted():
+    cache, upstream = ResponseCache(), Upstream()
+    upstream.fail = True
+
+    cache.prefetch("k", upstream.fetch, POLICY)
+    await asyncio.sleep(0.01)
+
+    assert cache.stats.prefetch_failures == 1
+    assert "k" not in cache._prefetched
+
+
+def test_cached_tool_is_served_from_several_event_loops(mocker):
+    cache = ResponseCache()
+    mocker.patch("modelscope_mcp_server.client.response_cache", cache)
+    mocker.patch.object(settings, "memo_enabled", False)
+    upstream_loops = []
+
+    async def fake_request(*args, **kwargs):
+        upstream_loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.1)
+        return {"data": {"id": "@owner/s0", "name": "s0", "author": "owner"}}
+
+    mocker.patch.object(ModelScopeClient, "_request", fake_request)
+    barrier = threading.Barrier(2)
+
+    async def call_tool():
+        async with Client(create_mcp_server()) as client:
+            barrier.wait(timeout=5)
+            # Both loops miss at once, then a stale entry is refreshed in the background
+            first = await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/s0"})
+            for entry in cache._entries.values():
+                entry.stored_at -= 1000
+            second = await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/s0"})
+            await asyncio.gather(*cache._get_loop_tasks().refresh_tasks)
+            return first.data.name, second.data.name
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: asyncio.run(call_tool()), range(2)))
+
+    assert results == [("s0", "s0")] * 2
+    # Concurrent fetches are only collapsed within a loop, never awaited from another one
+    assert len(set(upstream_loops)) == 2
@@ -0,0 +1 @@
+"""Catalog test package."""
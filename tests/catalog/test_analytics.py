@@ -0,0 +1,106 @@
+import pytest
+
+from modelscope_mcp_server.catalog import CatalogSnapshot, ColumnSpec, ColumnType, write_snapshot
+
+np = pytest.importorskip("numpy")
+
+from modelscope_mcp_server.catalog import analytics  # noqa: E402
+
+SCHEMA = (
+    ColumnSpec("id", ColumnType.STRING),
+    ColumnSpec("license", ColumnType.STRING),
+    ColumnSpec("tasks", ColumnType.STRING),
+    ColumnSpec("support_inference", ColumnType.BOOL),
+    ColumnSpec("downloads_count", ColumnType.INT64),
+)
+
+ROWS = [
+    {
+        "id": "a/one",
+        "license": "apache-2.0",
+        "tasks": "text-generation",
+        "support_inference": True,
+        "downloads_count": 10,
+    },
+    {
+        "id": "a/two",
+        "license": "mit",
+        "tasks": "text-to-image-synthesis",
+        "support_inference": True,
+        "downloads_count": 50,
+    },
+    {"id": "b/three", "license": "apache-2.0", "tasks": "text-to-image-synthesis", "downloads_count": 20},
+    {"id": "b/four", "license": "apache-2.0", "tasks": "text-to-image-synthesis", "downloads_count": 5},
+    {"id": "c/five", "license": "", "tasks": "text-generation", "support_inference": True, "downloads_count": 1000},
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "models.mscat"
+    write_snapshot(path, "models", SCHEMA, ROWS, search_fields=("id",))
+    return CatalogSnapshot(path)
+
+
+def test_numeric_column_is_zero_copy(snapshot):
+    downloads = analytics.numeric_column(snapshot, "downloads_count")
+    assert downloads.dtype == np.int64
+    assert not downloads.flags.writeable
+    assert not downloads.flags.owndata
+    assert downloads.tolist() == [10, 50, 20, 5, 1000]
+
+
+def test_build_mask(snapshot):
+    mask = analytics.build_mask(snapshot, contains={"tasks": "text-to-image"})
+    assert mask.tolist() == [False, True, True, True, False]
+
+    mask = analytics.build_mask(snapshot, query="B/", where={"license": "apache-2.0"})
+    assert mask.tolist() == [False, False, True, True, False]
+
+    mask = analytics.build_mask(snapshot, where={"support_inference": True, "license": "unknown"})
+    assert not mask.any()
+
+
+def test_group_by_counts(snapshot):
+    mask = analytics.build_mask(snapshot, contains={"tasks": "text-to-image"})
+    columns, rows = analytics.group_by(snapshot, mask, "license")
+    assert columns == ["license", "count"]
+    assert rows == [["apache-2.0", 2], ["mit", 1]]
+
+
+def test_group_by_with_metric(snapshot):
+    mask = analytics.build_mask(snapshot)
+    columns, rows = analytics.group_by(snapshot, mask, "support_inference", "downloads_count", limit=1)
+    assert columns == ["support_inference", "count", "sum_downloads_count", "mean_downloads_count"]
+    assert rows == [["true", 3, 1060, 353.33]]
+
+
+def test_top_k(snapshot):
+    mask = analytics.build_mask(snapshot, where={"support_inference": True})
+    columns, rows = analytics.top_k(snapshot, mask, "downloads_count", limit=2)
+    assert columns == ["id", "downloads_count"]
+    assert rows == [["c/five", 1000], ["a/two", 50]]
+
+
+def test_histogram(snapshot):
+    mask = analytics.build_mask(snapshot)
+    _, rows = analytics.histogram(snapshot, mask, "downloads_count", bins=2)
+    assert rows == [[5, 502.5, 4], [502.5, 1000, 1]]
+
+    _, rows = analytics.histogram(snapshot, mask, "downloads_count", bins=4, log_scale=True)
+    assert sum(row[2] for row in rows) == len(ROWS)
+    assert rows[0][0] == 0
+
+
+def test_percentiles(snapshot):
+    mask = analytics.build_mask(snapshot)
+    columns, rows = analytics.percentiles(snapshot, mask, "downloads_count", [0, 50, 100])
+    assert columns == ["percentile", "downloads_count"]
+    assert rows == [[0, 5], [50, 20], [100, 1000]]
+
+
+def test_empty_selection(snapshot):
+    mask = np.zeros(snapshot.row_count, dtype=bool)
+    assert analytics.percentiles(snapshot, mask, "downloads_count")[1] == []
+    assert analytics.histogram(snapshot, mask, "downloads_count")[1] == []
+    assert analytics.group_by(snapshot, mask, "license")[1] == []
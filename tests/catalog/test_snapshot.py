@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from modelscope_mcp_server.catalog import CatalogSnapshot, ColumnSpec, ColumnType, SnapshotFormatError, write_snapshot
+from modelscope_mcp_server.catalog.snapshot import SEARCH_COLUMN, SNAPSHOT_MAGIC
+
+SCHEMA = (
+    ColumnSpec("id", ColumnType.STRING),
+    ColumnSpec("chinese_name", ColumnType.STRING),
+    ColumnSpec("support_inference", ColumnType.BOOL),
+    ColumnSpec("downloads_count", ColumnType.INT64),
+)
+
+ROWS = [
+    {"id": "Qwen/Qwen3-8B", "chinese_name": "通义千问3-8B", "support_inference": True, "downloads_count": 500},
+    {"id": "deepseek-ai/DeepSeek-R1", "chinese_name": "", "support_inference": True, "downloads_count": 900},
+    {"id": "Qwen/Qwen-Image", "chinese_name": "千问图像", "support_inference": False, "downloads_count": 300},
+    {"id": "empty/model", "chinese_name": None, "support_inference": False, "downloads_count": None},
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "models.mscat"
+    write_snapshot(path, "models", SCHEMA, ROWS, search_fields=("id", "chinese_name"), created_at=1700000000)
+    with CatalogSnapshot(path) as snapshot:
+        yield snapshot
+
+
+def test_header_round_trip(snapshot):
+    assert snapshot.kind == "models"
+    assert snapshot.row_count == len(ROWS)
+    assert snapshot.created_at == 1700000000
+    assert snapshot.column_names == ["id", "chinese_name", "support_inference", "downloads_count"]
+    assert SEARCH_COLUMN not in snapshot.column_names
+
+
+def test_columns_are_zero_copy_views(snapshot):
+    downloads = snapshot.column("downloads_count")
+    assert isinstance(downloads, memoryview)
+    assert downloads.readonly
+    assert downloads.tolist() == [500, 900, 300, 0]
+
+    names = snapshot.column("chinese_name")
+    assert list(names) == ["通义千问3-8B", "", "千问图像", ""]
+    assert names[-1] == ""
+
+
+def test_row_materialization(snapshot):
+    assert snapshot.row(0) == {
+        "id": "Qwen/Qwen3-8B",
+        "chinese_name": "通义千问3-8B",
+        "support_inference": True,
+        "downloads_count": 500,
+    }
+    assert snapshot.row(2, fields=["id"]) == {"id": "Qwen/Qwen-Image"}
+
+
+def test_search_is_case_insensitive(snapshot):
+    total, rows = snapshot.search("qwen")
+    assert total == 2
+    assert rows == [0, 2]
+
+    total, rows = snapshot.search("千问")
+    assert rows == [0, 2]
+
+
+def test_search_does_not_match_across_rows(snapshot):
+    # The end of one row followed by the start of the next must not produce a match
+    total, _ = snapshot.search("8b\ndeepseek")
+    assert total == 0
+
+
+def test_search_filters_and_sorting(snapshot):
+    total, rows = snapshot.search(where={"support_inference": True}, sort_by="downloads_count", limit=1)
+    assert total == 2
+    assert rows == [1]
+
+    total, rows = snapshot.search(contains={"id": "Qwen/"}, sort_by="downloads_count")
+    assert rows == [0, 2]
+
+
+def test_search_rejects_string_sort_column(snapshot):
+    with pytest.raises(ValueError):
+        snapshot.search(sort_by="id")
+
+
+def test_rejects_invalid_file(tmp_path):
+    path = tmp_path / "bad.mscat"
+    path.write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(SnapshotFormatError):
+        CatalogSnapshot(path)
+
+
+def test_rejects_unsupported_version(tmp_path):
+    path = tmp_path / "models.mscat"
+    write_snapshot(path, "models", SCHEMA, ROWS)
+    data = bytearray(path.read_bytes())
+    assert data.startswith(SNAPSHOT_MAGIC)
+    data[8] = 99
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotFormatError, match="version"):
+        CatalogSnapshot(path)
+
+
+def test_rewrite_is_atomic(tmp_path):
+    path = tmp_path / "models.mscat"
+    write_snapshot(path, "models", SCHEMA, ROWS)
+    with CatalogSnapshot(path) as old:
+        write_snapshot(path, "models", SCHEMA, ROWS[:1])
+        # The already mapped snapshot keeps serving the previous data
+        assert old.row_count == len(ROWS)
+        assert old.row(3)["id"] == "empty/model"
+        with CatalogSnapshot(path) as new:
+            assert new.row_count == 1
+            assert new.file_id != old.file_id
+    assert [name for name in os.listdir(tmp_path)] == ["models.mscat"]
@@ -0,0 +1,145 @@
+import asyncio
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from modelscope_mcp_server.middleware import AdmissionController, AdmissionControlMiddleware, AIMDLimit, OverloadedError
+from modelscope_mcp_server.middleware.admission import is_overload_error
+
+
+def make_controller(limit=2, max_queue=10, max_queue_wait=0.05):
+    return AdmissionController(
+        AIMDLimit(limit, min_limit=1, max_limit=10, latency_target=1.0),
+        max_queue=max_queue,
+        max_queue_wait=max_queue_wait,
+    )
+
+
+def test_aimd_limit_grows_when_used_and_backs_off_on_overload():
+    limit = AIMDLimit(4, min_limit=2, max_limit=5, latency_target=1.0)
+
+    # Not increased while mostly idle
+    limit.update(0.1, in_flight=1, overloaded=False)
+    assert limit.value == 4
+
+    for _ in range(10):
+        limit.update(0.1, in_flight=4, overloaded=False)
+    assert limit.value == 5
+
+    limit.update(0.1, in_flight=5, overloaded=True)
+    limit.update(2.0, in_flight=5, overloaded=False)
+    assert limit.value == 4
+
+    for _ in range(20):
+        limit.update(0.1, in_flight=5, overloaded=True)
+    assert limit.value == 2
+
+
+async def test_queued_call_is_admitted_when_a_slot_frees():
+    controller = make_controller(limit=1, max_queue_wait=1.0)
+    await controller.acquire("a")
+
+    waiting = asyncio.create_task(controller.acquire("b"))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    controller.release(0.1)
+    assert await waiting > 0
+    assert controller.in_flight == 1
+    assert controller.stats.queued == 1
+
+
+async def test_calls_are_shed_when_saturated():
+    controller = make_controller(limit=1, max_queue=1)
+    await controller.acquire("a")
+
+    with pytest.raises(OverloadedError) as error:
+        await controller.acquire("batch", low_priority=True)
+    assert error.value.reason == "low_priority"
+    data = error.value.error.data
+    assert data is not None
+    assert data["reason"] == "low_priority"
+    assert data["retry_after_seconds"] > 0
+
+    waiting = asyncio.create_task(controller.acquire("b"))
+    await asyncio.sleep(0)
+    with pytest.raises(OverloadedError, match="queue_full"):
+        await controller.acquire("c")
+
+    with pytest.raises(OverloadedError, match="queue_timeout"):
+        await waiting
+    assert controller.in_flight == 1
+    assert controller.stats.shed == 3
+
+
+async def test_cancelled_waiter_gives_back_its_slot():
+    controller = make_controller(limit=1, max_queue_wait=1.0)
+    await controller.acquire("a")
+    waiting = asyncio.create_task(controller.acquire("b"))
+    await asyncio.sleep(0.01)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    controller.release(0.1)
+
+    assert controller.in_flight == 0
+    assert not controller._waiters
+
+
+def test_is_overload_error_follows_causes():
+    request = httpx.Request("GET", "https://example.com")
+    unavailable = httpx.HTTPStatusError("", request=request, response=httpx.Response(503, request=request))
+    not_found = httpx.HTTPStatusError("", request=request, response=httpx.Response(404, request=request))
+
+    try:
+        try:
+            raise httpx.PoolTimeout("pool exhausted")
+        except httpx.PoolTimeout as e:
+            raise TimeoutError("Request timeout") from e
+    except TimeoutError as e:
+        assert is_overload_error(e)
+
+    assert is_overload_error(asyncio.TimeoutError())
+    assert not is_overload_error(RuntimeError("unrelated"))
+
+    assert is_overload_error(unavailable)
+    assert not is_overload_error(not_found)
+
+
+async def test_middleware_sheds_with_retry_hint():
+    mcp = FastMCP("test")
+    controller = make_controller(limit=1)
+    mcp.add_middleware(AdmissionControlMiddleware(controller, low_priority_tools=["batch"], exempt_tools=["local"]))
+    release = asyncio.Event()
+
+    @mcp.tool
+    async def slow() -> str:
+        await release.wait()
+        return "done"
+
+    @mcp.tool
+    def batch() -> str:
+        return "batch"
+
+    @mcp.tool
+    def local() -> str:
+        return "local"
+
+    async with Client(mcp) as client:
+        slow_call = asyncio.create_task(client.call_tool("slow", {}))
+        await asyncio.sleep(0.05)
+
+        # Failed tool calls are reported as error results, with the reason and hint in the message
+        with pytest.raises(ToolError, match=r"\(low_priority\), retry after"):
+            await client.call_tool("batch", {})
+
+        assert (await client.call_tool("local", {})).data == "local"
+
+        release.set()
+        assert (await slow_call).data == "done"
+        assert (await client.call_tool("batch", {})).data == "batch"
+
+    assert controller.in_flight == 0
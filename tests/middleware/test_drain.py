@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from modelscope_mcp_server.middleware import DrainMiddleware, ShuttingDownError
+
+
+def make_server(drain):
+    mcp = FastMCP("test")
+    mcp.add_middleware(drain)
+
+    @mcp.tool
+    async def nap(seconds: float) -> str:
+        await asyncio.sleep(seconds)
+        return "rested"
+
+    return mcp
+
+
+async def test_drain_waits_for_in_flight_calls_and_rejects_new_ones():
+    drain = DrainMiddleware()
+
+    async with Client(make_server(drain)) as client:
+        call = asyncio.create_task(client.call_tool("nap", {"seconds": 0.2}))
+        await asyncio.sleep(0.05)
+        assert drain.in_flight == 1
+
+        draining = asyncio.create_task(drain.drain(timeout=5))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolError, match="Server is shutting down, tool 'nap' was not run"):
+            await client.call_tool("nap", {"seconds": 0})
+
+        assert (await call).data == "rested"
+        report = await draining
+
+    assert (report.completed, report.abandoned) == (1, 0)
+    assert report.duration < 1
+
+
+async def test_calls_past_the_deadline_are_abandoned():
+    drain = DrainMiddleware()
+
+    async with Client(make_server(drain)) as client:
+        call = asyncio.create_task(client.call_tool("nap", {"seconds": 10}))
+        await asyncio.sleep(0.05)
+
+        report = await drain.drain(timeout=0.1)
+        with pytest.raises(ToolError, match="Server shut down before tool 'nap' finished"):
+            await call
+
+    assert (report.completed, report.abandoned) == (0, 1)
+    assert drain.in_flight == 0
+
+    drain.resume()
+    async with Client(make_server(drain)) as client:
+        assert (await client.call_tool("nap", {"seconds": 0})).data == "rested"
+
+
+def test_shutting_down_error_carries_reason():
+    error = ShuttingDownError("nap")
+    assert error.error.data == {"reason": "shutting_down", "tool": "nap"}
@@ -0,0 +1,95 @@
+from fastmcp import Client, FastMCP
+
+from modelscope_mcp_server.middleware import MemoizationMiddleware
+from modelscope_mcp_server.server import create_mcp_server
+
+
+def make_memo(**kwargs):
+    limits = {"ttl": 60.0, "max_bytes": 1000, "max_result_bytes": 500}
+    return MemoizationMiddleware(**(limits | kwargs))
+
+
+def make_server(memo, calls):
+    mcp = FastMCP("test")
+    mcp.add_middleware(memo)
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def lookup(name: str, limit: int = 10) -> str:
+        calls.append(name)
+        return f"{name}:{limit}"
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def echo(text: str) -> str:
+        calls.append(text)
+        return text
+
+    @mcp.tool(annotations={"destructiveHint": False})
+    def create(name: str) -> str:
+        calls.append(name)
+        return name
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def fail(name: str) -> str:
+        calls.append(name)
+        raise ValueError("upstream failed")
+
+    return mcp
+
+
+async def test_repeated_calls_are_replayed():
+    calls = []
+    memo = make_memo()
+
+    async with Client(make_server(memo, calls)) as client:
+        assert (await client.call_tool("lookup", {"name": "a"})).data == "a:10"
+        # Same call with the default spelled out
+        assert (await client.call_tool("lookup", {"limit": 10, "name": "a"})).data == "a:10"
+        assert (await client.call_tool("lookup", {"name": "a", "limit": 5})).data == "a:5"
+
+        for _ in range(2):
+            await client.call_tool("create", {"name": "x"})
+            await client.call_tool("fail", {"name": "y"}, raise_on_error=False)
+
+    assert calls == ["a", "a", "x", "y", "x", "y"]
+    assert memo.stats.hits == 1
+
+
+async def test_ttls_and_size_limits(mocker):
+    now = [1000.0]
+    mocker.patch("modelscope_mcp_server.middleware.memoize.time.monotonic", side_effect=lambda: now[0])
+    calls = []
+    memo = make_memo(tool_ttls={"echo": 0, "lookup": 5}, max_bytes=10, tool_max_result_bytes={"lookup": 4})
+
+    async with Client(make_server(memo, calls)) as client:
+        for _ in range(2):
+            await client.call_tool("echo", {"text": "a"})
+        assert calls == ["a", "a"]
+
+        await client.call_tool("lookup", {"name": "b"})
+        now[0] += 4
+        await client.call_tool("lookup", {"name": "b"})
+        now[0] += 2
+        await client.call_tool("lookup", {"name": "b"})
+        assert calls == ["a", "a", "b", "b"]
+
+        # Too large for the lookup limit
+        await client.call_tool("lookup", {"name": "long"})
+        assert memo.stats.oversized == 1
+
+        # Least recently used results are evicted beyond max_bytes
+        await client.call_tool("lookup", {"name": "c"})
+        await client.call_tool("lookup", {"name": "d"})
+        assert len(memo) == 2
+        assert memo.size == 8
+        assert memo.stats.evictions == 1
+
+
+async def test_server_memoizes_read_only_tools_only():
+    mcp = create_mcp_server()
+    memo = next(m for m in mcp.middleware if isinstance(m, MemoizationMiddleware))
+    await memo.load_policies(mcp)
+
+    for tool in ["search_models", "search_datasets", "search_papers", "get_mcp_server_detail"]:
+        assert memo._policies[tool] is not None, tool
+    for tool in ["generate_image", "get_environment_info", "get_leaderboard"]:
+        assert memo._policies[tool] is None, tool
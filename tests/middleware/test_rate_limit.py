@@ -0,0 +1,109 @@
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import MiddlewareContext
+from mcp.shared.exceptions import McpError
+from starlette.requests import Request
+
+from modelscope_mcp_server.middleware import RateLimitExceededError, RateLimitMiddleware
+from modelscope_mcp_server.middleware.rate_limit import get_client_address
+from modelscope_mcp_server.settings import settings
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("modelscope_mcp_server.middleware.rate_limit.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def make_limiter(**kwargs):
+    limits: dict[str, Any] = {"global_rate": 100.0, "global_burst": 100.0, "session_rate": 1.0, "session_burst": 2.0}
+    return RateLimitMiddleware(**(limits | kwargs))
+
+
+def test_session_buckets_are_independent(clock):
+    limiter = make_limiter()
+
+    limiter.acquire("a")
+    limiter.acquire("a")
+    with pytest.raises(RateLimitExceededError) as error:
+        limiter.acquire("a")
+    assert error.value.scope == "session"
+    assert error.value.retry_after == pytest.approx(1.0)
+
+    # Another session still has its full budget
+    limiter.acquire("b")
+
+    clock[0] += 1.0
+    limiter.acquire("a")
+
+
+def test_tool_costs_and_tool_buckets(clock):
+    limiter = make_limiter(
+        session_rate=0, tool_rates={"generate_image": 0.5}, tool_costs={"generate_image": 1.0, "cheap": 0.1}
+    )
+
+    limiter.acquire("a", "generate_image")
+    with pytest.raises(RateLimitExceededError) as error:
+        limiter.acquire("b", "generate_image")
+    assert error.value.scope == "tool"
+    assert error.value.retry_after == pytest.approx(2.0)
+
+    for _ in range(50):
+        limiter.acquire("a", "cheap")
+
+
+def test_rejected_request_takes_no_tokens(clock):
+    limiter = make_limiter(global_rate=1.0, global_burst=1.0, session_rate=1.0, session_burst=3.0)
+
+    limiter.acquire("a")
+    with pytest.raises(RateLimitExceededError, match="global"):
+        limiter.acquire("a")
+
+    # The rejected request did not draw from the session bucket
+    assert limiter.session_buckets["a"].tokens == pytest.approx(2.0)
+
+
+async def test_rejection_carries_retry_hint(clock):
+    limiter = make_limiter(global_rate=1.0, global_burst=1.0, session_rate=0)
+    limiter.acquire("a", "ping")
+    with pytest.raises(McpError) as error:
+        limiter.acquire("a", "ping")
+    assert error.value.error.code == -32000
+    assert error.value.error.data == {"scope": "global", "retry_after_seconds": 1.0, "tool": "ping"}
+
+    mcp = FastMCP("test")
+    mcp.add_middleware(make_limiter(global_rate=0, session_rate=0, tool_rates={"ping": 0.5}))
+
+    @mcp.tool
+    def ping() -> str:
+        return "pong"
+
+    async with Client(mcp) as client:
+        await client.call_tool("ping", {})
+        # Failed tool calls are reported as error results, with the hint in the message
+        with pytest.raises(ToolError, match=r"Rate limit exceeded \(tool\) for tool 'ping', retry after"):
+            await client.call_tool("ping", {})
+
+
+def test_stateless_requests_are_limited_per_client_address(mocker):
+    mocker.patch.object(settings, "stateless_http", True)
+    headers = [(b"x-forwarded-for", b"203.0.113.9, 10.0.0.7")]
+    request = Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 4711)})
+    mocker.patch("modelscope_mcp_server.middleware.rate_limit.get_http_request", return_value=request)
+    limiter = make_limiter()
+    context = MiddlewareContext(message=None, fastmcp_context=mocker.Mock(session_id="random"))
+
+    # The header is ignored unless the request comes from a trusted proxy
+    assert get_client_address() == "10.0.0.1"
+    assert limiter._get_session_id(context) == "10.0.0.1"
+
+    mocker.patch.object(settings, "trusted_proxies", ["10.0.0.1"])
+    assert get_client_address() == "10.0.0.7"
+    assert limiter._get_session_id(context) == "10.0.0.7"
+
+    mocker.patch.object(settings, "trusted_proxies", ["10.0.0.0/8"])
+    assert get_client_address() == "203.0.113.9"
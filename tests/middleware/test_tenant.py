@@ -0,0 +1,33 @@
+import httpx
+from fastmcp import Client, FastMCP
+
+from modelscope_mcp_server.middleware import MemoizationMiddleware, TenantMiddleware
+from modelscope_mcp_server.tenant import get_tenant_token
+
+
+async def test_calls_use_the_callers_token_and_memo_entry(mocker):
+    headers = httpx.Headers()
+    mocker.patch(
+        "modelscope_mcp_server.middleware.tenant.get_http_request",
+        side_effect=lambda: mocker.Mock(headers=headers),
+    )
+    calls = []
+    mcp = FastMCP("test")
+    mcp.add_middleware(TenantMiddleware(header="X-ModelScope-Token"))
+    mcp.add_middleware(MemoizationMiddleware(ttl=60, max_bytes=1000, max_result_bytes=100))
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def whoami() -> str:
+        calls.append(get_tenant_token())
+        return get_tenant_token() or "server"
+
+    async with Client(mcp) as client:
+        assert (await client.call_tool("whoami")).data == "server"
+        headers["X-ModelScope-Token"] = "Bearer alice"
+        assert (await client.call_tool("whoami")).data == "alice"
+        headers["X-ModelScope-Token"] = "bob"
+        assert (await client.call_tool("whoami")).data == "bob"
+        assert (await client.call_tool("whoami")).data == "bob"
+
+    assert calls == [None, "alice", "bob"]
+    assert get_tenant_token() is None
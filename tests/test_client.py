@@ -0,0 +1,103 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from fastmcp import Client
+
+from modelscope_mcp_server.cache import CachePolicy
+from modelscope_mcp_server.client import ModelScopeClient
+from modelscope_mcp_server.server import create_mcp_server
+from modelscope_mcp_server.settings import settings
+from modelscope_mcp_server.tenant import use_token
+
+
+async def test_warm_up_reports_handshakes_per_domain(mocker):
+    async def handler(request):
+        if request.url.host == "api-inference.modelscope.cn":
+            raise httpx.ConnectError("unreachable", request=request)
+        trace = request.extensions["trace"]
+        for phase in ["connection.connect_tcp", "connection.start_tls"]:
+            await trace(f"{phase}.started", {})
+            await trace(f"{phase}.complete", {})
+        return httpx.Response(301, headers={"Location": "https://www.modelscope.cn/"})
+
+    hooks = {"response": [ModelScopeClient._raise_on_error]}
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), event_hooks=hooks)
+    mocker.patch.object(ModelScopeClient, "_ensure_global_client", return_value=client)
+    mocker.patch.object(settings, "main_domain", "https://modelscope.cn")
+    mocker.patch.object(settings, "api_inference_domain", "https://api-inference.modelscope.cn")
+
+    main, inference = await ModelScopeClient.warm_up(3, timeout=1.0)
+
+    assert (main.domain, main.probes, main.connections, main.failures) == ("https://modelscope.cn", 3, 3, 0)
+    assert len(main.connect_seconds) == len(main.tls_seconds) == 3
+    assert (inference.connections, inference.failures) == (0, 3)
+
+
+async def test_lifespan_warms_up_before_serving(mocker):
+    warm_up = mocker.patch.object(ModelScopeClient, "warm_up")
+    mocker.patch.object(settings, "warmup_connections", 0)
+    async with Client(create_mcp_server()):
+        warm_up.assert_not_called()
+
+    mocker.patch.object(settings, "warmup_connections", 2)
+    async with Client(create_mcp_server()):
+        warm_up.assert_awaited_once_with(2, settings.warmup_timeout_seconds)
+
+
+async def test_tenants_get_their_own_clients_on_the_shared_pool(mocker):
+    now = [1000.0]
+    mocker.patch("modelscope_mcp_server.client.time.monotonic", side_effect=lambda: now[0])
+    mocker.patch.object(settings, "api_token", "server-token")
+    mocker.patch.object(settings, "tenant_max_clients", 2)
+    mocker.patch.object(settings, "tenant_idle_seconds", 60)
+    policy = CachePolicy("test", per_tenant=True)
+
+    try:
+        server_client = await ModelScopeClient._get_http_client()
+        with use_token("server-token"):
+            assert await ModelScopeClient._get_http_client() is server_client
+
+        with use_token("alice"):
+            alice = await ModelScopeClient._get_http_client()
+            alice_key = ModelScopeClient._cache_key("GET", "u", {}, policy)
+            assert await ModelScopeClient._get_http_client() is alice
+        assert alice.headers["Authorization"] == "Bearer alice"
+        assert alice._transport is server_client._transport
+        assert alice_key != ModelScopeClient._cache_key("GET", "u", {}, policy)
+        with use_token("alice"):
+            assert ModelScopeClient._cache_key("GET", "u", {}, CachePolicy("shared")) == ModelScopeClient._cache_key(
+                "GET", "u", {}, CachePolicy("shared")
+            )
+
+        # Beyond the limit the least recently used client is evicted, and idle clients expire
+        for token in ["bob", "carol"]:
+            with use_token(token):
+                await ModelScopeClient._get_http_client()
+        assert len(ModelScopeClient._get_loop_pool().tenant_clients) == 2
+        with use_token("alice"):
+            assert await ModelScopeClient._get_http_client() is not alice
+
+        now[0] += 61
+        with use_token("dave"):
+            await ModelScopeClient._get_http_client()
+        assert len(ModelScopeClient._get_loop_pool().tenant_clients) == 1
+    finally:
+        await ModelScopeClient.close_global_pool()
+
+
+def test_each_event_loop_has_its_own_pool_closed_with_the_loop():
+    async def use_pool():
+        client = await ModelScopeClient._ensure_global_client()
+        assert await ModelScopeClient._ensure_global_client() is client
+        return client
+
+    def run_loop(_):
+        return asyncio.run(use_pool())
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        clients = list(executor.map(run_loop, range(2)))
+    clients.append(run_loop(None))
+
+    assert len({id(client) for client in clients}) == 3
+    assert all(client.is_closed for client in clients)
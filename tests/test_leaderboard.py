@@ -0,0 +1,72 @@
+import asyncio
+
+from modelscope_mcp_server import settings
+from modelscope_mcp_server.leaderboard import LeaderboardSpec, LeaderboardStore
+
+
+async def test_refresh_all_keeps_previous_view_on_failure():
+    calls = {"count": 0}
+
+    async def fetch(size):
+        calls["count"] += 1
+        if calls["count"] > 1:
+            raise RuntimeError("upstream down")
+        return ["first"]
+
+    store = LeaderboardStore(specs=[LeaderboardSpec("papers", "all", "hot", fetch)])
+
+    await store.refresh_all()
+    first = store.lookup("papers")
+    assert first is not None and first.items == ["first"]
+
+    await store.refresh_all()
+    assert store.lookup("papers") is first
+
+
+async def test_lookup_requires_enough_items():
+    async def fetch(size):
+        return list(range(size))
+
+    store = LeaderboardStore(specs=[LeaderboardSpec("models", "all", "downloads", fetch)])
+    await store.refresh("models")
+
+    assert store.lookup("models", limit=settings.leaderboard_size) is not None
+    assert store.lookup("models", limit=settings.leaderboard_size + 1) is None
+
+
+async def test_background_refresher(mocker):
+    fetched = asyncio.Event()
+
+    async def fetch(size):
+        fetched.set()
+        return []
+
+    mocker.patch.object(settings, "leaderboard_refresh_interval_seconds", 3600)
+    store = LeaderboardStore(specs=[LeaderboardSpec("papers", "all", "hot", fetch)])
+
+    store.start()
+    await asyncio.wait_for(fetched.wait(), timeout=1)
+    await store.stop()
+
+    assert store.lookup("papers") is not None
+
+
+async def test_concurrent_cold_gets_share_one_refresh():
+    calls = {"count": 0}
+    release = asyncio.Event()
+
+    async def fetch(size):
+        calls["count"] += 1
+        await release.wait()
+        return ["top"]
+
+    store = LeaderboardStore(specs=[LeaderboardSpec("papers", "all", "hot", fetch)])
+
+    gets = [asyncio.create_task(store.get("papers")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    views = await asyncio.gather(*gets)
+
+    assert calls["count"] == 1
+    assert all(view is views[0] for view in views)
+    assert not store._refreshing
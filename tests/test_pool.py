@@ -0,0 +1,71 @@
+from typing import cast
+
+import httpx
+import pytest
+
+from modelscope_mcp_server.pool import Histogram, KeepaliveTuner, MeteredTransport, PoolStatistics
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram([0.01, 0.1])
+    for value in [0.005, 0.01, 0.05, 3]:
+        histogram.observe(value)
+
+    assert histogram.cumulative() == {"0.01": 2, "0.1": 3, "+Inf": 4}
+    assert histogram.mean == pytest.approx(3.065 / 4)
+
+
+def test_tuner_follows_concurrency_and_pool_wait(mocker):
+    now = [0.0]
+    mocker.patch("modelscope_mcp_server.pool.time.monotonic", side_effect=lambda: now[0])
+    tuner = KeepaliveTuner(min_keepalive=4, max_keepalive=100, interval=10, wait_target=0.05)
+
+    tuner.observe(40, 0.01)
+    assert tuner.resize(20) is None, "the interval has not elapsed"
+
+    now[0] = 10
+    assert tuner.resize(20) == 50
+
+    # Requests waited for connections
+    tuner.observe(8, 0.2)
+    now[0] = 20
+    assert tuner.resize(50) == 100
+
+    # Quiet interval: shrink by half the surplus, down to the minimum
+    now[0] = 30
+    assert tuner.resize(100) == 50
+    size = 50
+    for _ in range(10):
+        now[0] += 10
+        size = tuner.resize(size) or size
+    assert size == 4
+
+
+async def test_transport_records_wait_and_utilization(mocker):
+    stats = mocker.patch("modelscope_mcp_server.pool.pool_stats", PoolStatistics())
+
+    async def handler(request):
+        trace = request.extensions["trace"]
+        await trace("connection.connect_tcp.started", {})
+        await trace("http11.send_request_headers.started", {})
+        return httpx.Response(200, json={"ok": True})
+
+    traced = []
+
+    async def outer_trace(event, info):
+        traced.append(event)
+
+    limits = httpx.Limits(max_connections=4)
+    # Without a tuner, the pool of the wrapped transport is never resized
+    mock_transport = cast(httpx.AsyncHTTPTransport, httpx.MockTransport(handler))
+    transport = MeteredTransport(mock_transport, limits, tuner=None)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(2):
+            response = await client.get("https://modelscope.cn/api", extensions={"trace": outer_trace})
+            assert response.json() == {"ok": True}
+
+    assert transport.in_flight == 0
+    assert stats.requests == 2
+    assert stats.wait_seconds.count == 2
+    assert stats.utilization.cumulative()["0.25"] == 2
+    assert traced.count("http11.send_request_headers.started") == 2
@@ -0,0 +1,27 @@
+import argparse
+
+import pytest
+from uvicorn.importer import import_from_string
+
+from modelscope_mcp_server.cli import validate_args
+from modelscope_mcp_server.workers import APP_FACTORIES
+
+
+@pytest.mark.parametrize("transport", ["http", "sse"])
+def test_worker_app_factories_are_importable(transport):
+    app = import_from_string(APP_FACTORIES[transport])()
+    assert app.routes[0].path == ("/mcp" if transport == "http" else "/sse")
+
+
+def make_args(transport="http", workers=1, stateless=False):
+    return argparse.Namespace(transport=transport, port=8000, workers=workers, stateless=stateless)
+
+
+def test_workers_and_stateless_mode_require_http_transport():
+    validate_args(make_args(workers=4, stateless=True))
+    with pytest.raises(ValueError, match="SSE/HTTP"):
+        validate_args(make_args(transport="stdio", workers=2))
+    with pytest.raises(ValueError, match="positive"):
+        validate_args(make_args(workers=0))
+    with pytest.raises(ValueError, match="Stateless"):
+        validate_args(make_args(transport="sse", stateless=True))
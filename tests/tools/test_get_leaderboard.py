@@ -0,0 +1,117 @@
+import time
+
+import pytest
+from fastmcp import Client
+
+from modelscope_mcp_server import settings
+from modelscope_mcp_server.leaderboard import LeaderboardView, leaderboards
+from modelscope_mcp_server.types import Model
+
+
+def make_models_response(count):
+    return {
+        "Data": {
+            "Model": {
+                "Models": [
+                    {"Path": "org", "Name": f"model-{i}", "CreatedBy": "org", "License": "mit", "Downloads": 1000 - i}
+                    for i in range(count)
+                ]
+            }
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_leaderboards():
+    leaderboards.views.clear()
+    yield
+    leaderboards.views.clear()
+
+
+async def test_get_leaderboard_fetches_on_demand_then_serves_from_memory(mcp_server, mocker):
+    mock_put = mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.put",
+        new_callable=mocker.AsyncMock,
+        return_value=make_models_response(3),
+    )
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("get_leaderboard", {"board": "models", "category": "text-to-image", "limit": 2})
+        data = result.data
+
+        assert data.board == "models"
+        assert data.category == "text-to-image"
+        assert data.ranked_by == "downloads"
+        assert abs(data.refreshed_at - time.time()) < 60
+        assert [model.id for model in data.models] == ["org/model-0", "org/model-1"]
+
+        request_data = mock_put.call_args.args[1]
+        assert request_data["SortBy"] == "DownloadsCount"
+        assert request_data["PageSize"] == settings.leaderboard_size
+        assert request_data["Criterion"][0]["values"] == ["text-to-image-synthesis"]
+
+        await client.call_tool("get_leaderboard", {"board": "models", "category": "text-to-image"})
+        mock_put.assert_called_once()
+
+
+async def test_search_models_served_from_fresh_leaderboard(mcp_server, mocker):
+    mock_put = mocker.patch("modelscope_mcp_server.client.ModelScopeClient.put", new_callable=mocker.AsyncMock)
+    leaderboards.views["models:all"] = LeaderboardView(
+        board="models",
+        category="all",
+        ranked_by="downloads",
+        items=[
+            Model(id="org/top", path="org", name="top", chinese_name="", created_by="", license="", modelscope_url="")
+        ],
+        refreshed_at=time.time(),
+    )
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_models", {"sort": "DownloadsCount", "limit": 5})
+
+        assert result.structured_content is not None
+        assert [model["id"] for model in result.structured_content["result"]] == ["org/top"]
+        mock_put.assert_not_called()
+
+
+async def test_search_models_bypasses_stale_leaderboard(mcp_server, mocker):
+    mock_put = mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.put",
+        new_callable=mocker.AsyncMock,
+        return_value=make_models_response(1),
+    )
+    leaderboards.views["models:all"] = LeaderboardView(
+        board="models",
+        category="all",
+        ranked_by="downloads",
+        items=[],
+        refreshed_at=time.time() - settings.leaderboard_max_age_seconds - 1,
+    )
+
+    async with Client(mcp_server) as client:
+        await client.call_tool("search_models", {"sort": "DownloadsCount"})
+        mock_put.assert_called_once()
+
+
+async def test_search_models_bypasses_leaderboard_for_tenants(mcp_server, mocker):
+    mock_put = mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.put",
+        new_callable=mocker.AsyncMock,
+        return_value=make_models_response(1),
+    )
+    mocker.patch("modelscope_mcp_server.tools.model.get_tenant_id", return_value="tenant")
+    leaderboards.views["models:all"] = LeaderboardView(
+        board="models",
+        category="all",
+        ranked_by="downloads",
+        items=[
+            Model(id="org/top", path="org", name="top", chinese_name="", created_by="", license="", modelscope_url="")
+        ],
+        refreshed_at=time.time(),
+    )
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_models", {"sort": "DownloadsCount"})
+
+        assert [model.id for model in result.data] == ["org/model-0"]
+        mock_put.assert_called_once()
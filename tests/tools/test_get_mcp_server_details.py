@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from modelscope_mcp_server import settings
+
+
+def detail_response(server_id):
+    return {"data": {"id": server_id, "name": server_id.split("/")[-1], "author": "owner"}}
+
+
+async def test_get_mcp_server_details_in_input_order(mcp_server, mocker):
+    async def fake_get(url, **kwargs):
+        server_id = url.split("/servers/", 1)[1]
+        # Finish in reverse order of the input
+        await asyncio.sleep(0.01 * (3 - int(server_id[-1])))
+        if server_id.endswith("2"):
+            raise RuntimeError("API error [NOT_FOUND]: server does not exist")
+        return detail_response(server_id)
+
+    mocker.patch("modelscope_mcp_server.client.ModelScopeClient.get", side_effect=fake_get)
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool(
+            "get_mcp_server_details", {"server_ids": ["@owner/s0", "@owner/s1", "@owner/s2", "@owner/s3"]}
+        )
+
+    assert result.structured_content is not None
+    items = result.structured_content["result"]
+    assert [item["server_id"] for item in items] == ["@owner/s0", "@owner/s1", "@owner/s2", "@owner/s3"]
+    assert [item["detail"]["id"] if item["detail"] else None for item in items] == [
+        "@owner/s0",
+        "@owner/s1",
+        None,
+        "@owner/s3",
+    ]
+    assert "does not exist" in items[2]["error"]
+    assert items[0]["error"] is None
+
+
+async def test_get_mcp_server_details_bounds_concurrency(mcp_server, mocker):
+    mocker.patch.object(settings, "batch_max_concurrency", 3)
+    running = 0
+    max_running = 0
+
+    async def fake_get(url, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return detail_response(url.split("/servers/", 1)[1])
+
+    mock_get = mocker.patch("modelscope_mcp_server.client.ModelScopeClient.get", side_effect=fake_get)
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("get_mcp_server_details", {"server_ids": [f"@owner/s{i}" for i in range(10)]})
+
+    assert result.structured_content is not None
+    assert len(result.structured_content["result"]) == 10
+    assert mock_get.call_count == 10
+    assert max_running == 3
+
+
+async def test_get_mcp_server_details_rejects_empty_list(mcp_server):
+    async with Client(mcp_server) as client:
+        with pytest.raises(ToolError, match="should be non-empty"):
+            await client.call_tool("get_mcp_server_details", {"server_ids": []})
+
+
+async def test_get_mcp_server_detail_with_fields(mcp_server, mocker):
+    response = detail_response("@owner/s0")
+    response["data"]["readme"] = "# README\n" + "text " * 10000
+    mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.get", new_callable=mocker.AsyncMock, return_value=response
+    )
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/s0", "fields": ["id", "name"]})
+        assert result.structured_content == {"id": "@owner/s0", "name": "s0"}
+
+        with pytest.raises(Exception, match="Unknown fields"):
+            await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/s0", "fields": ["stars"]})
@@ -0,0 +1,62 @@
+import pytest
+from fastmcp import Client
+
+from modelscope_mcp_server import settings
+
+README = "# Server\nIntro\n## Install\n" + "step\n" * 1000 + "### Docker\nrun\n## Usage\nuse it\n"
+
+
+@pytest.fixture
+def mock_detail(mocker):
+    response = {"data": {"id": "@owner/s0", "name": "s0", "author": "owner", "readme": README}}
+    return mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.get", new_callable=mocker.AsyncMock, return_value=response
+    )
+
+
+async def test_detail_returns_readme_preview_and_outline(mcp_server, mock_detail, mocker):
+    mocker.patch.object(settings, "readme_preview_bytes", 100)
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/s0"})
+
+    detail = result.structured_content
+    assert detail is not None
+    assert detail["readme"] == README[:100]
+    assert detail["readme_truncated"] is True
+    assert detail["readme_size"] == len(README)
+    assert [section["title"] for section in detail["readme_outline"]] == ["Server", "Install", "Docker", "Usage"]
+
+
+async def test_readme_sections_and_byte_ranges(mcp_server, mock_detail):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("get_mcp_server_readme", {"server_id": "@owner/s0", "sections": [3]})
+        chunk = result.structured_content
+        assert chunk is not None
+        assert chunk["content"] == "## Usage\nuse it\n"
+
+        # Sections are located by their own offsets, the content has no single byte range
+        result = await client.call_tool("get_mcp_server_readme", {"server_id": "@owner/s0", "sections": [2, 3]})
+        chunk = result.structured_content
+        assert chunk is not None
+        assert chunk["content"] == "### Docker\nrun\n## Usage\nuse it\n"
+        assert chunk["start"] is None and chunk["end"] is None
+
+        # A subsection requested along with its parent is returned once
+        result = await client.call_tool("get_mcp_server_readme", {"server_id": "@owner/s0", "sections": [2, 1]})
+        chunk = result.structured_content
+        assert chunk is not None
+        assert chunk["content"].startswith("## Install\n") and chunk["content"].endswith("### Docker\nrun\n")
+        assert chunk["content"].count("### Docker") == 1
+        assert [section["index"] for section in chunk["sections"]] == [1, 2]
+
+        result = await client.call_tool(
+            "get_mcp_server_readme", {"server_id": "@owner/s0", "offset": len(README) - 7, "length": 100}
+        )
+        chunk = result.structured_content
+        assert chunk is not None
+        assert chunk["content"] == "use it\n"
+        assert (chunk["start"], chunk["end"], chunk["total_size"]) == (len(README) - 7, len(README), len(README))
+
+        with pytest.raises(Exception, match="Unknown README sections"):
+            await client.call_tool("get_mcp_server_readme", {"server_id": "@owner/s0", "sections": [9]})
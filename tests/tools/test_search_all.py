@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from modelscope_mcp_server import settings
+from modelscope_mcp_server.types import McpServer, Model, Paper
+
+
+def make_model(name):
+    return Model(
+        id=f"org/{name}",
+        path="org",
+        name=name,
+        chinese_name="",
+        created_by="org",
+        license="mit",
+        modelscope_url=f"https://modelscope.cn/models/org/{name}",
+    )
+
+
+def make_paper(arxiv_id):
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=f"Paper {arxiv_id}",
+        authors="",
+        publish_date="",
+        abstract_cn="",
+        abstract_en="x" * 500,
+        modelscope_url=f"https://modelscope.cn/papers/{arxiv_id}",
+        arxiv_url="",
+        pdf_url="",
+    )
+
+
+@pytest.fixture
+def short_deadlines(mocker):
+    mocker.patch.object(settings, "search_all_timeout_seconds", 0.5)
+    mocker.patch.object(settings, "search_all_source_timeout_seconds", 0.3)
+
+
+@pytest.fixture
+def mock_sources(mocker):
+    async def slow_studios(**kwargs):
+        await asyncio.sleep(5)
+        return []
+
+    return {
+        "models": mocker.patch(
+            "modelscope_mcp_server.tools.search.fetch_models",
+            new_callable=mocker.AsyncMock,
+            return_value=[make_model("a"), make_model("b")],
+        ),
+        "datasets": mocker.patch(
+            "modelscope_mcp_server.tools.search.fetch_datasets",
+            new_callable=mocker.AsyncMock,
+            side_effect=RuntimeError("upstream failed"),
+        ),
+        "studios": mocker.patch("modelscope_mcp_server.tools.search.fetch_studios", side_effect=slow_studios),
+        "papers": mocker.patch(
+            "modelscope_mcp_server.tools.search.fetch_papers",
+            new_callable=mocker.AsyncMock,
+            return_value=[make_paper("2501.00001")],
+        ),
+        "mcp_servers": mocker.patch(
+            "modelscope_mcp_server.tools.search.fetch_mcp_servers",
+            new_callable=mocker.AsyncMock,
+            return_value=[McpServer(id="@x/y", name="y", description="server", modelscope_url="u")],
+        ),
+    }
+
+
+async def test_search_all_merges_and_reports_sources(mcp_server, mock_sources, short_deadlines):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_all", {"query": "qwen", "limit_per_source": 3})
+        data = result.data
+
+        statuses = {status.source: status for status in data.sources}
+        assert statuses["models"].status == "ok" and statuses["models"].count == 2
+        assert statuses["datasets"].status == "error"
+        assert "upstream failed" in statuses["datasets"].error
+        assert statuses["studios"].status == "timeout"
+        assert statuses["studios"].elapsed_ms < 1000
+        assert statuses["papers"].status == "ok"
+
+        # Top ranked entries of every source come first, in source order
+        assert [(hit.source, hit.id) for hit in data.hits] == [
+            ("models", "org/a"),
+            ("papers", "2501.00001"),
+            ("mcp_servers", "@x/y"),
+            ("models", "org/b"),
+        ]
+        assert data.hits[0].score > data.hits[-1].score
+        assert len(data.hits[1].summary) == 203
+
+        mock_sources["models"].assert_awaited_once_with(query="qwen", limit=3)
+        mock_sources["mcp_servers"].assert_awaited_once_with(search="qwen", limit=3)
+
+
+async def test_search_all_selected_sources(mcp_server, mock_sources, short_deadlines):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_all", {"query": "qwen", "sources": ["papers"], "limit": 1})
+
+        assert [status.source for status in result.data.sources] == ["papers"]
+        assert [hit.id for hit in result.data.hits] == ["2501.00001"]
+        mock_sources["models"].assert_not_called()
@@ -0,0 +1,139 @@
+import pytest
+from fastmcp import Client
+
+from modelscope_mcp_server import settings
+from modelscope_mcp_server.catalog import CATALOG_SCHEMAS, get_snapshot_path, write_snapshot
+from modelscope_mcp_server.catalog.builder import CATALOG_SEARCH_FIELDS, model_row
+from modelscope_mcp_server.server import create_mcp_server
+
+UPSTREAM_MODELS = [
+    {
+        "Path": "Qwen",
+        "Name": "Qwen-Image",
+        "ChineseName": "千问图像",
+        "CreatedBy": "qwen",
+        "License": "apache-2.0",
+        "Tasks": [{"Name": "text-to-image-synthesis"}],
+        "SupportInference": "txt2img",
+        "Downloads": 300,
+        "Stars": 10,
+    },
+    {
+        "Path": "deepseek-ai",
+        "Name": "DeepSeek-R1",
+        "License": "mit",
+        "Tasks": [{"Name": "text-generation"}],
+        "SupportInference": "",
+        "Downloads": 900,
+        "Stars": 50,
+    },
+    {
+        "Path": "Qwen",
+        "Name": "Qwen3-8B",
+        "License": "apache-2.0",
+        "Tasks": [{"Name": "text-generation"}],
+        "SupportInference": "llm",
+        "Downloads": 500,
+        "Stars": 30,
+    },
+]
+
+
+def model_rows(records):
+    return [row for record in records if (row := model_row(record)) is not None]
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    original_catalog_dir = settings.catalog_dir
+    settings.catalog_dir = str(tmp_path)
+    rows = model_rows(UPSTREAM_MODELS)
+    write_snapshot(get_snapshot_path("models"), "models", CATALOG_SCHEMAS["models"], rows, CATALOG_SEARCH_FIELDS)
+    yield tmp_path
+    settings.catalog_dir = original_catalog_dir
+
+
+@pytest.fixture
+def mcp_server(catalog_dir, mcp_server):
+    # The catalog tools are registered only if the catalog directory is set when the server is created
+    return mcp_server
+
+
+async def test_search_catalog_models(mcp_server, catalog_dir):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_catalog", {"query": "qwen", "sort": "downloads"})
+
+        data = result.data
+        assert data.kind == "models"
+        assert data.total_count == 2
+        assert [model.id for model in data.models] == ["Qwen/Qwen3-8B", "Qwen/Qwen-Image"]
+        assert data.models[0].modelscope_url == f"{settings.main_domain}/models/Qwen/Qwen3-8B"
+
+
+async def test_search_catalog_task_and_inference_filters(mcp_server, catalog_dir):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool(
+            "search_catalog",
+            {"task": "text-generation", "support_inference": True},
+        )
+
+        assert [model.id for model in result.data.models] == ["Qwen/Qwen3-8B"]
+
+
+async def test_search_catalog_picks_up_rebuilt_snapshot(mcp_server, catalog_dir):
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_catalog", {})
+        assert result.data.total_count == 3
+
+        rows = model_rows(UPSTREAM_MODELS[:1])
+        write_snapshot(get_snapshot_path("models"), "models", CATALOG_SCHEMAS["models"], rows, CATALOG_SEARCH_FIELDS)
+
+        result = await client.call_tool("search_catalog", {})
+        assert result.data.total_count == 1
+
+
+async def test_search_catalog_not_available(mcp_server):
+    async with Client(mcp_server) as client:
+        with pytest.raises(Exception) as exc_info:
+            await client.call_tool("search_catalog", {"kind": "datasets"})
+        assert "not available" in str(exc_info.value)
+
+
+async def test_catalog_tools_require_catalog_dir(mocker):
+    mocker.patch.object(settings, "catalog_dir", None)
+    async with Client(create_mcp_server()) as client:
+        tools = {tool.name for tool in await client.list_tools()}
+
+    assert "search_models" in tools
+    assert "search_catalog" not in tools
+    assert "analyze_catalog" not in tools
+
+
+async def test_analyze_catalog_group_by(mcp_server, catalog_dir):
+    pytest.importorskip("numpy")
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("analyze_catalog", {"operation": "group_by", "column": "license"})
+
+        data = result.data
+        assert data.matched_count == 3
+        assert data.columns == ["license", "count"]
+        assert data.rows == [["apache-2.0", 2], ["mit", 1]]
+
+
+async def test_analyze_catalog_percentiles(mcp_server, catalog_dir):
+    pytest.importorskip("numpy")
+    async with Client(mcp_server) as client:
+        result = await client.call_tool(
+            "analyze_catalog",
+            {"operation": "percentiles", "metric": "downloads_count", "support_inference": True, "percentiles": [50]},
+        )
+
+        assert result.data.matched_count == 2
+        assert result.data.rows == [[50, 400]]
+
+
+async def test_analyze_catalog_requires_metric(mcp_server, catalog_dir):
+    async with Client(mcp_server) as client:
+        with pytest.raises(Exception) as exc_info:
+            await client.call_tool("analyze_catalog", {"operation": "top_k"})
+        assert "Metric is required" in str(exc_info.value)
@@ -1,6 +1,15 @@
+import asyncio
+import warnings
+
 import pytest
 from fastmcp import Client
 
+from modelscope_mcp_server.cache import response_cache
+from modelscope_mcp_server.client import ModelScopeClient
+from modelscope_mcp_server.settings import settings
+from modelscope_mcp_server.types import McpServer
+from modelscope_mcp_server.utils.mapping import ResultMapping
+
 
 # Helper functions
 async def search_mcp_servers_helper(client, params):
@@ -125,3 +134,75 @@ async def test_search_mcp_servers_all_filters(mcp_server):
         )
 
         print_servers_list(servers, "with all filters", ["view_count"])
+
+
+async def test_search_mcp_servers_prefetches_top_details(mcp_server, mocker):
+    mocker.patch.object(settings, "prefetch_enabled", True)
+    mocker.patch.object(settings, "prefetch_mcp_server_details", 2)
+    servers = [{"id": f"@owner/server-{i}", "name": f"server-{i}"} for i in range(4)]
+
+    async def fake_request(method, url, timeout=None, **kwargs):
+        if method == "PUT":
+            return {"data": {"mcp_server_list": servers}}
+        server_id = url.split("/servers/", 1)[1]
+        return {"data": {"id": server_id, "name": server_id, "author": "owner"}}
+
+    mock_request = mocker.patch.object(ModelScopeClient, "_request", side_effect=fake_request)
+
+    async with Client(mcp_server) as client:
+        await client.call_tool("search_mcp_servers", {"search": "files"})
+        await asyncio.sleep(0.05)
+        detail_urls = [call.args[1] for call in mock_request.call_args_list if call.args[0] == "GET"]
+        assert [url.rsplit("/", 1)[1] for url in detail_urls] == ["server-0", "server-1"]
+
+        result = await client.call_tool("get_mcp_server_detail", {"server_id": "@owner/server-0"})
+        assert result.data.id == "@owner/server-0"
+
+    assert mock_request.call_count == 3
+    assert response_cache.stats.prefetch_hits == 1
+
+
+async def test_search_mcp_servers_table_format(mcp_server, mocker):
+    servers = [{"id": f"@owner/server-{i}", "name": f"server-{i}", "tags": ["files"]} for i in range(3)]
+    mocker.patch.object(
+        ModelScopeClient, "put", new_callable=mocker.AsyncMock, return_value={"data": {"mcp_server_list": servers}}
+    )
+    map_page = mocker.spy(ResultMapping, "map_page")
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool("search_mcp_servers", {"search": "files", "format": "table"})
+        assert result.structured_content is not None
+        table = result.structured_content["result"]
+        assert table["columns"] == list(McpServer.model_fields)
+        assert len(table["rows"]) == 3
+        row = dict(zip(table["columns"], table["rows"][0], strict=True))
+        assert row["id"] == "@owner/server-0"
+        assert row["tags"] == ["files"]
+
+        result = await client.call_tool(
+            "search_mcp_servers", {"search": "files", "format": "table", "fields": ["name", "id"]}
+        )
+        assert result.structured_content is not None
+        # Columns keep the model's field order
+        assert result.structured_content["result"] == {
+            "columns": ["id", "name"],
+            "rows": [["@owner/server-0", "server-0"], ["@owner/server-1", "server-1"], ["@owner/server-2", "server-2"]],
+        }
+
+    # Table rows are read from the mapped values, without validating models
+    map_page.assert_not_called()
+
+
+async def test_search_mcp_servers_projected_objects_serialize_cleanly(mcp_server, mocker):
+    servers = [{"id": f"@owner/server-{i}", "name": f"server-{i}"} for i in range(2)]
+    mocker.patch.object(
+        ModelScopeClient, "put", new_callable=mocker.AsyncMock, return_value={"data": {"mcp_server_list": servers}}
+    )
+
+    async with Client(mcp_server) as client:
+        # Projected servers lack fields of McpServer, which must not make them mismatch the return type
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = await client.call_tool("search_mcp_servers", {"search": "files", "fields": ["id"]})
+        assert result.structured_content is not None
+        assert result.structured_content["result"] == [{"id": "@owner/server-0"}, {"id": "@owner/server-1"}]
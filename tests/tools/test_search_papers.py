@@ -22,3 +22,49 @@ async def test_search_papers(mcp_server):
         assert "title" in paper, "Paper should have title"
         assert "authors" in paper, "Paper should have authors"
         assert "modelscope_url" in paper, "Paper should have modelscope_url"
+
+
+def paper_data(i):
+    return {
+        "ArxivId": f"2401.0000{i}",
+        "Title": f"Paper {i}",
+        "Authors": "A. Author",
+        "PublishDate": "2024-01-01",
+        "AbstractCn": "中文摘要" * 50,
+        "AbstractEn": "English abstract text " * 20,
+        "ArxivUrl": f"https://arxiv.org/abs/2401.0000{i}",
+        "PdfUrl": f"https://arxiv.org/pdf/2401.0000{i}",
+        "ViewCount": 1,
+        "FavoriteCount": 0,
+        "CommentTotalCount": 0,
+    }
+
+
+async def test_search_papers_abstract_lang_and_max_chars(mcp_server, mocker):
+    mocker.patch(
+        "modelscope_mcp_server.client.ModelScopeClient.put",
+        new_callable=mocker.AsyncMock,
+        return_value={"Data": {"Papers": [paper_data(i) for i in range(2)]}},
+    )
+
+    async with Client(mcp_server) as client:
+        result = await client.call_tool(
+            "search_papers", {"query": "x", "abstract_lang": "en", "abstract_max_chars": 30}
+        )
+        assert result.structured_content is not None
+        papers = result.structured_content["result"]
+        assert "abstract_cn" not in papers[0]
+        assert papers[0]["abstract_en"] == "English abstract text English..."
+        assert papers[0]["title"] == "Paper 0"
+
+        result = await client.call_tool(
+            "search_papers", {"query": "x", "abstract_lang": "none", "fields": ["arxiv_id", "abstract_en"]}
+        )
+        assert result.structured_content is not None
+        assert result.structured_content["result"] == [{"arxiv_id": "2401.00000"}, {"arxiv_id": "2401.00001"}]
+
+        result = await client.call_tool("search_papers", {"query": "x", "abstract_max_chars": 8})
+        assert result.structured_content is not None
+        paper = result.structured_content["result"][0]
+        assert paper["abstract_cn"] == "中文摘要中文摘要..."
+        assert paper["abstract_en"] == "English..."
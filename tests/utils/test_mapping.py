@@ -0,0 +1,80 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from modelscope_mcp_server.utils.mapping import ResultMapping, Source
+
+
+class Item(BaseModel):
+    id: str
+    name: str
+    count: int = 0
+    enabled: bool = False
+    tags: list[str] = []
+
+
+MAPPING = ResultMapping(
+    Item,
+    {
+        "id": lambda data: f"{data['Owner']}/{data['Name']}",
+        "name": "Name",
+        "count": Source("Count", 0),
+        "enabled": Source("Enabled", "", bool),
+        "tags": lambda data: data.get("Tags") or [],
+    },
+    required=("Owner", "Name"),
+)
+
+
+def test_map_page_reads_converts_and_derives_fields():
+    items = MAPPING.map_page(
+        [
+            {"Owner": "o", "Name": "a", "Count": 3, "Enabled": "yes", "Tags": ["x"]},
+            {"Owner": "o", "Name": "b", "Tags": None},
+        ]
+    )
+
+    assert items == [
+        Item(id="o/a", name="a", count=3, enabled=True, tags=["x"]),
+        Item(id="o/b", name="b", count=0, enabled=False, tags=[]),
+    ]
+
+
+def test_map_page_skips_items_missing_required_keys():
+    items = MAPPING.map_page([{"Owner": "", "Name": "a"}, {"Name": "b"}, {"Owner": "o", "Name": "c"}])
+
+    assert [item.id for item in items] == ["o/c"]
+
+
+def test_map_page_validates_values():
+    with pytest.raises(ValidationError):
+        MAPPING.map_page([{"Owner": "o", "Name": "a", "Count": "many"}])
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="Unknown fields for Item"):
+        ResultMapping(Item, {"identifier": "Id"})
+
+
+def test_select_reads_and_validates_only_the_requested_fields():
+    derived = []
+
+    def derive_id(data):
+        derived.append(data)
+        return f"{data['Owner']}/{data['Name']}"
+
+    mapping = ResultMapping(Item, {**MAPPING.fields, "id": derive_id}, required=MAPPING.required)
+    selection = mapping.select({"name", "count"})
+
+    assert mapping.select(None) is mapping
+    assert mapping.select({"count", "name"}) is selection
+    items = selection.map_page([{"Owner": "o", "Name": "a", "Count": "3"}, {"Name": "b"}])
+    assert [item.model_dump() for item in items] == [{"name": "a", "count": 3}]
+    assert selection.map_item({"Name": "c"}).model_dump() == {"name": "c", "count": 0}
+    assert derived == []
+
+
+def test_source_key_of_read_fields():
+    assert MAPPING.source_key("name") == "Name"
+    assert MAPPING.source_key("count") == "Count"
+    with pytest.raises(ValueError, match="derived"):
+        MAPPING.source_key("id")
@@ -0,0 +1,50 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from modelscope_mcp_server.types import McpServer, Paper
+from modelscope_mcp_server.utils.projection import Projected, project, project_all, projected_model, validate_fields
+
+
+def make_server(server_id):
+    return McpServer(id=server_id, name="name", description="long " * 100, modelscope_url="https://example.com")
+
+
+def test_validate_fields():
+    assert validate_fields(McpServer, None) is None
+    assert validate_fields(McpServer, []) is None
+    assert validate_fields(McpServer, ["id", "name"]) == {"id", "name"}
+
+    with pytest.raises(ValueError, match=r"Unknown fields \['readme'\]"):
+        validate_fields(McpServer, ["id", "readme"])
+
+
+def test_project():
+    server = make_server("@owner/server")
+
+    assert project(server, None) is server
+
+    projected = project(server, {"id", "view_count"})
+    assert type(projected) is projected_model(McpServer, frozenset({"id", "view_count"}))
+    assert list(type(projected).model_fields) == ["id", "view_count"]
+    assert projected.model_dump() == {"id": "@owner/server", "view_count": 0}
+    assert [item.model_dump() for item in project_all([server, make_server("@owner/other")], {"id"})] == [
+        {"id": "@owner/server"},
+        {"id": "@owner/other"},
+    ]
+
+
+def test_projected_model_validates_like_the_model():
+    model = projected_model(Paper, frozenset({"arxiv_id", "view_count"}))
+
+    assert model.model_validate({"arxiv_id": "2401.00001"}).model_dump() == {"arxiv_id": "2401.00001", "view_count": 0}
+    with pytest.raises(ValidationError):
+        model.model_validate({"view_count": 1})
+    assert model.model_fields["arxiv_id"].description == Paper.model_fields["arxiv_id"].description
+
+
+def test_only_projected_results_make_fields_optional():
+    assert "required" in Paper.model_json_schema()
+
+    schema = TypeAdapter(list[Projected[Paper]]).json_schema()
+    assert "required" not in schema["items"]
+    assert schema["items"]["properties"] == Paper.model_json_schema()["properties"]
@@ -0,0 +1,28 @@
+import pytest
+
+from modelscope_mcp_server.utils.ranking import reciprocal_rank_fusion
+
+
+def by_value(source, item):
+    return item
+
+
+def test_disjoint_lists_are_interleaved_by_rank():
+    fused = reciprocal_rank_fusion({"a": ["a1", "a2"], "b": ["b1", "b2", "b3"]}, key=by_value)
+    assert [item for item, _ in fused] == ["a1", "b1", "a2", "b2", "b3"]
+
+
+def test_items_in_several_lists_are_boosted():
+    fused = reciprocal_rank_fusion({"a": ["x", "shared"], "b": ["y", "shared"]}, key=by_value, k=1)
+    assert fused[0] == ("shared", pytest.approx(1 / 3 + 1 / 3))
+    assert [item for item, _ in fused] == ["shared", "x", "y"]
+
+
+def test_key_includes_source():
+    fused = reciprocal_rank_fusion({"a": ["x"], "b": ["x"]}, key=lambda source, item: (source, item))
+    assert len(fused) == 2
+
+
+def test_empty_input():
+    assert reciprocal_rank_fusion({}, key=by_value) == []
+    assert reciprocal_rank_fusion({"a": []}, key=by_value) == []
@@ -0,0 +1,49 @@
+from modelscope_mcp_server.utils.readme import PREAMBLE_TITLE, get_outline, get_preview, get_size, read_bytes
+
+README = """Intro line
+# Title
+Text
+## Install
+```bash
+# not a heading
+pip install x
+```
+### Extras
+More
+## Usage
+Use it
+"""
+
+
+def test_outline_levels_and_sizes():
+    outline = get_outline(README)
+
+    assert [(section.level, section.title) for section in outline] == [
+        (0, PREAMBLE_TITLE),
+        (1, "Title"),
+        (2, "Install"),
+        (3, "Extras"),
+        (2, "Usage"),
+    ]
+    # A section includes its subsections and ends at the next heading of the same or a higher level
+    install, extras, usage = outline[2], outline[3], outline[4]
+    assert read_bytes(README, install.start, install.start + install.size).endswith("More\n")
+    assert install.start + install.size == usage.start
+    assert extras.start + extras.size == usage.start
+    assert outline[1].start + outline[1].size == get_size(README)
+
+
+def test_no_preamble_when_readme_starts_with_heading():
+    outline = get_outline("# Only\nText\n")
+    assert [section.title for section in outline] == ["Only"]
+    assert get_outline("") == []
+
+
+def test_preview_cuts_at_character_boundary():
+    readme = "# 标题\n" + "模型" * 100
+
+    preview, truncated = get_preview(readme, 10)
+    assert truncated
+    assert preview == "# 标题\n"  # the partial third character is dropped
+    assert get_preview(readme, get_size(readme)) == (readme, False)
+    assert get_size(readme) == len(readme.encode("utf-8"))
@@ -1,6 +1,6 @@
 import pytest
 
-from modelscope_mcp_server.utils.text import truncate_for_log
+from modelscope_mcp_server.utils.text import truncate_at_word, truncate_for_log
 
 
 def test_returns_empty_string_for_none_input():
@@ -38,3 +38,19 @@ def test_unicode_handling_and_marker():
 def test_empty_string_input():
     out = truncate_for_log("")
     assert out == ""
+
+
+def test_truncate_at_word_boundary():
+    assert truncate_at_word("hello world foo", 8) == "hello..."
+    assert truncate_at_word("hello world", 6) == "hello..."
+
+
+def test_truncate_at_word_within_limit_returns_same_object():
+    text = "short text"
+    assert truncate_at_word(text, 10) is text
+
+
+def test_truncate_at_word_without_spaces_cuts_at_limit():
+    assert truncate_at_word("模型" * 10, 5) == "模型模型模..."
+    # A boundary that would drop more than half of the allowed text is ignored
+    assert truncate_at_word("a verylongword", 10) == "a verylong..."